@@ -1 +1,12 @@
- 
+# optionkit/calibration/__init__.py
+from .svi import SVISlice, svi_total_variance, fit_svi_slice, fit_ssvi_slice
+from .surface import VolSurface
+from .fourier import heston_cf, merton_cf, lewis_prices, heston_prices, merton_prices
+from .calibrate import CalibrationResult, calibrate_heston, calibrate_merton
+
+__all__ = [
+    "SVISlice", "svi_total_variance", "fit_svi_slice", "fit_ssvi_slice",
+    "VolSurface",
+    "heston_cf", "merton_cf", "lewis_prices", "heston_prices", "merton_prices",
+    "CalibrationResult", "calibrate_heston", "calibrate_merton",
+]
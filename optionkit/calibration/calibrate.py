@@ -0,0 +1,133 @@
+# optionkit/calibration/calibrate.py
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy.optimize import least_squares
+
+import optionkit.models  # noqa: F401  (populates MODEL_REGISTRY)
+from optionkit.core.factory import create_model
+from .fourier import heston_cf, merton_cf, lewis_prices
+
+# name -> (default start, lower bound, upper bound)
+HESTON_PARAMS: Dict[str, Tuple[float, float, float]] = {
+    "v0": (0.04, 1e-4, 2.0),
+    "kappa": (1.5, 1e-3, 20.0),
+    "theta": (0.04, 1e-4, 2.0),
+    "sigma_v": (0.5, 1e-3, 5.0),
+    "rho": (-0.5, -0.999, 0.999),
+}
+MERTON_PARAMS: Dict[str, Tuple[float, float, float]] = {
+    "vol": (0.2, 1e-3, 2.0),
+    "lam": (0.5, 0.0, 10.0),
+    "mu_j": (-0.1, -2.0, 2.0),
+    "sigma_j": (0.15, 1e-3, 2.0),
+}
+
+
+@dataclass(slots=True)
+class CalibrationResult:
+    """Fitted parameters plus fit diagnostics; pass `params` as `x0` to warm-start."""
+    model: str
+    spot: float
+    rate: float
+    params: Dict[str, float]
+    rmse: float             # unweighted root-mean-square price error
+    nfev: int
+    success: bool
+    elapsed: float
+    residuals: np.ndarray = field(repr=False)
+
+    def to_model(self, **kwargs):
+        """Instantiate the registered model with the fitted parameters."""
+        return create_model(self.model, spot=self.spot, rate=self.rate, **self.params, **kwargs)
+
+
+def _calibrate(name: str, cf: Callable, spec: Mapping[str, Tuple[float, float, float]],
+               spot, rate, strikes, maturities, prices, is_call,
+               weights, x0, fixed, n_nodes, u_max) -> CalibrationResult:
+    names = list(spec)
+    fixed = dict(fixed or {})
+    free = [n for n in names if n not in fixed]
+    start = {n: spec[n][0] for n in names}
+    start.update(x0 or {})
+    lower = np.array([spec[n][1] for n in free])
+    upper = np.array([spec[n][2] for n in free])
+    p0 = np.clip([start[n] for n in free], lower, upper)
+
+    target = np.asarray(prices, dtype=float)
+    wts = np.ones_like(target) if weights is None else np.asarray(weights, dtype=float)
+
+    def full(x):
+        """Stack free values (last axis) with fixed ones into per-name arrays."""
+        it = iter(np.moveaxis(np.atleast_2d(x), -1, 0))
+        return tuple(
+            np.full(np.atleast_2d(x).shape[0], fixed[n]) if n in fixed else next(it)
+            for n in names
+        )
+
+    def model_prices(x):
+        return lewis_prices(cf, full(x), spot, rate, strikes, maturities, is_call,
+                            n_nodes=n_nodes, u_max=u_max)
+
+    def residuals(x):
+        return (model_prices(x)[0] - target) * wts
+
+    def jacobian(x):
+        # Forward differences for every parameter in one batched evaluation
+        h = 1e-6 * np.maximum(np.abs(x), 1e-2)
+        h = np.where(x + h > upper, -h, h)
+        batch = np.vstack([x, x + np.diag(h)])
+        p = model_prices(batch)
+        return ((p[1:] - p[0]) / h[:, None] * wts).T
+
+    t0 = time.perf_counter()
+    res = least_squares(residuals, p0, jac=jacobian, bounds=(lower, upper),
+                        method="trf", x_scale="jac")
+    elapsed = time.perf_counter() - t0
+
+    params = dict(fixed)
+    params.update({n: float(v) for n, v in zip(free, res.x)})
+    params = {n: float(params[n]) for n in names}
+    # Unweighted price error: dividing res.fun by the weights fails for zero weights
+    rmse = float(np.sqrt(np.mean((model_prices(res.x)[0] - target) ** 2)))
+    return CalibrationResult(name, spot, rate, params, rmse, res.nfev,
+                             bool(res.success), elapsed, res.fun)
+
+
+def calibrate_heston(spot: float, rate: float, strikes: Sequence[float],
+                     maturities: Sequence[float], prices: Sequence[float],
+                     is_call=True, weights: Optional[Sequence[float]] = None,
+                     x0: Optional[Mapping[str, float]] = None,
+                     fixed: Optional[Mapping[str, float]] = None,
+                     n_nodes: int = 128, u_max: float = 200.0) -> CalibrationResult:
+    """
+    Fit Heston (v0, kappa, theta, sigma_v, rho) to a chain of option prices.
+
+    Every objective call prices the whole chain through the semi-analytic
+    Fourier pricer (one characteristic-function evaluation per maturity);
+    the Jacobian is a single batched evaluation over all bumped parameter
+    sets. `x0` warm-starts from a previous fit (e.g. `result.params`) and
+    `fixed` pins parameters to given values.
+    """
+    return _calibrate("Heston", heston_cf, HESTON_PARAMS, spot, rate, strikes,
+                      maturities, prices, is_call, weights, x0, fixed, n_nodes, u_max)
+
+
+def calibrate_merton(spot: float, rate: float, strikes: Sequence[float],
+                     maturities: Sequence[float], prices: Sequence[float],
+                     is_call=True, weights: Optional[Sequence[float]] = None,
+                     x0: Optional[Mapping[str, float]] = None,
+                     fixed: Optional[Mapping[str, float]] = None,
+                     n_nodes: int = 128, u_max: float = 200.0) -> CalibrationResult:
+    """
+    Fit Merton (vol, lam, mu_j, sigma_j) to a chain of option prices.
+
+    Same machinery as `calibrate_heston`; pass e.g. ``fixed={"vol": 0.2}``
+    to fit the jump parameters only.
+    """
+    return _calibrate("Merton", merton_cf, MERTON_PARAMS, spot, rate, strikes,
+                      maturities, prices, is_call, weights, x0, fixed, n_nodes, u_max)
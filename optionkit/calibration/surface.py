@@ -0,0 +1,184 @@
+# optionkit/calibration/surface.py
+from __future__ import annotations
+
+import math
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from .svi import SVISlice, fit_svi_slice, fit_ssvi_slice
+
+_FITTERS = {"svi": fit_svi_slice, "ssvi": fit_ssvi_slice}
+
+
+class VolSurface:
+    """
+    Implied volatility surface built from SVI/SSVI slices.
+
+    Each slice's total variance w(k) is tabulated on a uniform log-forward-
+    moneyness grid, so lookups are an index computation plus linear
+    interpolation. Between expiries the surface interpolates linearly in
+    total variance at fixed k, which keeps it free of calendar arbitrage
+    whenever the slices themselves do not cross (see `arbitrage_report`).
+    Before the first expiry and after the last one, implied vol is held flat
+    in T. Outside the grid the slices are evaluated analytically.
+
+    Parameters
+    ----------
+    spot, rate : float
+        Define the forward F(T) = spot * exp(rate * T) used for k = log(K / F).
+    slices : sequence of SVISlice
+        One slice per expiry.
+    k_range : (float, float), optional
+        Extent of the interpolation grid in log-moneyness. Default (-1.5, 1.5).
+    n_k : int, optional
+        Number of grid points. Default 301.
+    kind : {"svi", "ssvi"}, optional
+        Parameterisation used by `update_slice`. Default "svi".
+    """
+
+    def __init__(self, spot: float, rate: float, slices: Sequence[SVISlice],
+                 k_range=(-1.5, 1.5), n_k: int = 301, kind: str = "svi"):
+        if not slices:
+            raise ValueError("VolSurface needs at least one slice.")
+        if kind not in _FITTERS:
+            raise ValueError(f"Unknown slice parameterisation: {kind}")
+        self.spot = spot
+        self.rate = rate
+        self.kind = kind
+        self.k_grid = np.linspace(k_range[0], k_range[1], n_k)
+        self._dk = self.k_grid[1] - self.k_grid[0]
+        self._slices: List[SVISlice] = sorted(slices, key=lambda s: s.maturity)
+        self._rebuild()
+
+    @classmethod
+    def fit(cls, spot: float, rate: float, strikes, maturities, vols,
+            kind: str = "svi", **kwargs) -> "VolSurface":
+        """Fit one slice per distinct maturity to flat arrays of quotes."""
+        K = np.asarray(strikes, dtype=float)
+        T = np.asarray(maturities, dtype=float)
+        iv = np.asarray(vols, dtype=float)
+        fitter = _FITTERS[kind]
+        slices = []
+        for t in np.unique(T):
+            sel = T == t
+            k = np.log(K[sel] / (spot * math.exp(rate * t)))
+            slices.append(fitter(float(t), k, iv[sel]))
+        return cls(spot, rate, slices, kind=kind, **kwargs)
+
+    # ------------------------------------------------------------------
+
+    @property
+    def slices(self) -> List[SVISlice]:
+        return list(self._slices)
+
+    @property
+    def maturities(self) -> np.ndarray:
+        return self._T.copy()
+
+    def _rebuild(self) -> None:
+        self._T = np.array([s.maturity for s in self._slices])
+        self._params = np.array([s.params for s in self._slices])
+        self._table = np.array([s.total_variance(self.k_grid) for s in self._slices])
+
+    def update_slice(self, maturity: float, strikes, vols, weights=None) -> SVISlice:
+        """
+        Refit (or add) the slice for one expiry, warm-started from its current
+        parameters; only that row of the interpolation table is recomputed.
+        """
+        k = np.log(np.asarray(strikes, dtype=float) / (self.spot * math.exp(self.rate * maturity)))
+        match = np.flatnonzero(np.isclose(self._T, maturity))
+        exists = match.size > 0
+        j = int(match[0]) if exists else int(np.searchsorted(self._T, maturity))
+        new = _FITTERS[self.kind](maturity, k, vols, weights,
+                                  x0=self._slices[j] if exists else None)
+        if exists:
+            self._slices[j] = new
+            self._T[j] = new.maturity
+            self._params[j] = new.params
+            self._table[j] = new.total_variance(self.k_grid)
+        else:
+            self._slices.insert(j, new)
+            self._rebuild()
+        return new
+
+    # ------------------------------------------------------------------
+
+    def _slice_w(self, j, k):
+        """Total variance of slices `j` at log-moneyness `k` (same shapes)."""
+        x = (k - self.k_grid[0]) / self._dk
+        inside = (x >= 0) & (x <= len(self.k_grid) - 1)
+        i = np.clip(np.floor(x).astype(int), 0, len(self.k_grid) - 2)
+        f = x - i
+        w = self._table[j, i] * (1 - f) + self._table[j, i + 1] * f
+        if not inside.all():
+            out = ~inside
+            p = self._params[j[out]]
+            w[out] = self._eval_params(k[out], p)
+        return w
+
+    @staticmethod
+    def _eval_params(k, p):
+        a, b, rho, m, sigma = p.T
+        x = k - m
+        return a + b * (rho * x + np.sqrt(x * x + sigma * sigma))
+
+    def total_variance(self, k, maturity):
+        """Vectorized total implied variance w(k, T)."""
+        k, T = np.broadcast_arrays(np.asarray(k, dtype=float), np.asarray(maturity, dtype=float))
+        shape = k.shape
+        k, T = k.ravel(), T.ravel()
+
+        n = len(self._T)
+        hi = np.clip(np.searchsorted(self._T, T), 0, n - 1)
+        lo = np.maximum(hi - 1, 0)
+        w_hi = self._slice_w(hi, k)
+        w_lo = self._slice_w(lo, k)
+
+        T_lo, T_hi = self._T[lo], self._T[hi]
+        span = np.where(hi > lo, T_hi - T_lo, 1.0)
+        alpha = np.clip((T - T_lo) / span, 0.0, 1.0)
+        w = w_lo + alpha * (w_hi - w_lo)
+
+        # flat implied vol outside [T_first, T_last]
+        before, after = T < self._T[0], T > self._T[-1]
+        w = np.where(before, w_hi * T / self._T[0], w)
+        w = np.where(after, w_hi * T / self._T[-1], w)
+        return w.reshape(shape)
+
+    def vol(self, strike, maturity):
+        """
+        Vectorized implied vol lookup sigma(K, T). At T = 0 this is the
+        short-end limit, the first slice's vol at k = log(K / spot).
+        """
+        K = np.asarray(strike, dtype=float)
+        T = np.asarray(maturity, dtype=float)
+        if np.any(T < 0):
+            raise ValueError("Implied vol lookup needs maturity >= 0.")
+        k = np.log(K / self.spot) - self.rate * T
+        T = np.where(T > 0, T, self._T[0])      # vol is flat in T before the first expiry
+        w = self.total_variance(k, T)
+        return np.sqrt(np.maximum(w, 0.0) / T)
+
+    # ------------------------------------------------------------------
+
+    def arbitrage_report(self) -> Dict[str, object]:
+        """
+        Static-arbitrage diagnostics on the interpolation grid:
+
+        - ``butterfly``: {maturity: min g(k)} for slices with g < 0 somewhere
+        - ``calendar``: [(T1, T2)] pairs of adjacent slices whose total
+          variance decreases somewhere on the grid
+        """
+        butterfly = {}
+        for s in self._slices:
+            g = s.density_condition(self.k_grid)
+            if g.min() < 0:
+                butterfly[s.maturity] = float(g.min())
+        calendar = [
+            (float(self._T[j]), float(self._T[j + 1]))
+            for j in range(len(self._T) - 1)
+            if (self._table[j + 1] < self._table[j] - 1e-12).any()
+        ]
+        return {"butterfly": butterfly, "calendar": calendar,
+                "arbitrage_free": not butterfly and not calendar}
@@ -0,0 +1,141 @@
+# optionkit/calibration/svi.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import numpy as np
+from scipy.optimize import least_squares
+
+# Grid on which the butterfly (density) condition is penalised during fits
+_PENALTY_GRID = np.linspace(-1.5, 1.5, 31)
+_PENALTY_WEIGHT = 10.0
+
+
+@dataclass(slots=True, frozen=True)
+class SVISlice:
+    """
+    Raw SVI smile for one expiry, in total implied variance:
+
+        w(k) = a + b * (rho * (k - m) + sqrt((k - m)**2 + sigma**2))
+
+    with k = log(K / F) the log-forward-moneyness.
+    """
+    maturity: float
+    a: float
+    b: float
+    rho: float
+    m: float
+    sigma: float
+
+    @classmethod
+    def from_ssvi(cls, maturity: float, theta: float, rho: float, phi: float) -> "SVISlice":
+        """SSVI slice (ATM total variance `theta`, skew `rho`, curvature `phi`) in raw form."""
+        return cls(
+            maturity,
+            a=0.5 * theta * (1 - rho**2),
+            b=0.5 * theta * phi,
+            rho=rho,
+            m=-rho / phi,
+            sigma=np.sqrt(1 - rho**2) / phi,
+        )
+
+    @property
+    def params(self) -> np.ndarray:
+        return np.array([self.a, self.b, self.rho, self.m, self.sigma])
+
+    def total_variance(self, k):
+        return svi_total_variance(k, *self.params)
+
+    def implied_vol(self, k):
+        return np.sqrt(np.maximum(self.total_variance(k), 0.0) / self.maturity)
+
+    def density_condition(self, k):
+        """Durrleman's g(k); the smile is free of butterfly arbitrage where g >= 0."""
+        return svi_density_condition(k, *self.params)
+
+
+def svi_total_variance(k, a, b, rho, m, sigma):
+    x = np.asarray(k, dtype=float) - m
+    return a + b * (rho * x + np.sqrt(x * x + sigma * sigma))
+
+
+def svi_density_condition(k, a, b, rho, m, sigma):
+    k = np.asarray(k, dtype=float)
+    x = k - m
+    r = np.sqrt(x * x + sigma * sigma)
+    w = a + b * (rho * x + r)
+    w1 = b * (rho + x / r)
+    w2 = b * sigma * sigma / r**3
+    return (1 - k * w1 / (2 * w)) ** 2 - 0.25 * w1 * w1 * (1 / w + 0.25) + 0.5 * w2
+
+
+# ----------------------------------------------------------------------
+
+def fit_svi_slice(maturity: float, k: Sequence[float], vols: Sequence[float],
+                  weights: Optional[Sequence[float]] = None,
+                  x0: Optional[SVISlice] = None) -> SVISlice:
+    """
+    Least-squares fit of a raw SVI slice to implied vols at log-moneyness `k`.
+
+    Butterfly arbitrage (g(k) < 0) and negative variance are penalised.
+    Pass the previous fit as `x0` to warm-start.
+    """
+    k = np.asarray(k, dtype=float)
+    w_mkt = np.asarray(vols, dtype=float) ** 2 * maturity
+    wts = np.ones_like(k) if weights is None else np.asarray(weights, dtype=float)
+    w_max = float(w_mkt.max())
+
+    if x0 is not None:
+        start = x0.params
+    else:
+        start = np.array([0.5 * float(w_mkt.min()), 0.1, -0.3, 0.0, 0.1])
+    lower = [-w_max, 1e-8, -0.999, k.min() - 1.0, 1e-4]
+    upper = [w_max, 10.0, 0.999, k.max() + 1.0, 5.0]
+    start = np.clip(start, lower, upper)
+
+    def residuals(p):
+        a, b, rho, m, sigma = p
+        fit = (svi_total_variance(k, *p) - w_mkt) * wts
+        min_w = a + b * sigma * np.sqrt(1 - rho**2)
+        g = svi_density_condition(_PENALTY_GRID, *p) if min_w > 0 else np.full(_PENALTY_GRID.shape, -1.0)
+        penalty = _PENALTY_WEIGHT * w_max * np.concatenate(
+            ([min(min_w, 0.0)], np.minimum(g, 0.0))
+        )
+        return np.concatenate((fit, penalty))
+
+    res = least_squares(residuals, start, bounds=(lower, upper), method="trf")
+    return SVISlice(maturity, *map(float, res.x))
+
+
+def fit_ssvi_slice(maturity: float, k: Sequence[float], vols: Sequence[float],
+                   weights: Optional[Sequence[float]] = None,
+                   x0: Optional[SVISlice] = None) -> SVISlice:
+    """
+    Fit an SSVI slice (theta, rho, phi) and return it in raw SVI form.
+
+    The sufficient no-butterfly conditions theta*phi*(1+|rho|) <= 4 and
+    theta*phi**2*(1+|rho|) <= 4 are penalised.
+    """
+    k = np.asarray(k, dtype=float)
+    w_mkt = np.asarray(vols, dtype=float) ** 2 * maturity
+    wts = np.ones_like(k) if weights is None else np.asarray(weights, dtype=float)
+
+    if x0 is not None:
+        theta0 = float(x0.total_variance(0.0))
+        start = np.array([theta0, x0.rho, 2 * x0.b / theta0])
+    else:
+        start = np.array([float(np.interp(0.0, np.sort(k), w_mkt[np.argsort(k)])), -0.3, 1.0])
+    lower, upper = [1e-8, -0.999, 1e-4], [10.0, 0.999, 100.0]
+    start = np.clip(start, lower, upper)
+
+    def residuals(p):
+        theta, rho, phi = p
+        s = SVISlice.from_ssvi(maturity, theta, rho, phi)
+        fit = (s.total_variance(k) - w_mkt) * wts
+        c = theta * (1 + abs(rho))
+        penalty = _PENALTY_WEIGHT * np.array([max(c * phi - 4, 0.0), max(c * phi**2 - 4, 0.0)])
+        return np.concatenate((fit, penalty))
+
+    res = least_squares(residuals, start, bounds=(lower, upper), method="trf")
+    return SVISlice.from_ssvi(maturity, *map(float, res.x))
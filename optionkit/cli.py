@@ -0,0 +1,305 @@
+# optionkit/cli.py
+"""
+Batch pricing from the command line::
+
+    optionkit rows.jsonl -o prices.jsonl --workers 8
+    cat rows.csv | optionkit --format csv --model BlackScholes \\
+        --model-params '{"spot": 100, "rate": 0.05, "vol": 0.2}'
+
+Input is read as a stream (a file or ``-`` for stdin), cut into chunks of
+`--chunk` rows and priced on a process pool; results are written in input
+order as soon as each chunk completes, with at most `2 * workers` chunks in
+flight, so memory stays bounded however long the input is.
+
+JSON-lines rows use the pricing-service schema::
+
+    {"id": 7, "model": "BlackScholes", "model_params": {"spot": 100, ...},
+     "option": "EuropeanOption", "option_params": {"strike": 100, "maturity": 1.0}}
+
+CSV rows have a header; `id`, `model` and `option` columns are optional,
+`model.<name>` columns become model parameters and every other non-empty
+cell an option parameter. Missing model/option fields fall back to
+`--model` and `--option`; `--model-params` fills in parameters of rows
+priced with the default model. Models and options are built
+with `create_model` / `create_option`; each model is built once per chunk
+and prices its options through `price_many`.
+
+Each output record carries the row `id` (the 0-based row number when the
+input has none) and either `price` or `error`; a malformed JSON line gets
+an error record with its row number as `id` and does not stop the run. A summary with rows/sec and
+per-model timing goes to stderr.
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import optionkit.models  # noqa: F401  (populates MODEL_REGISTRY)
+import optionkit.payoffs  # noqa: F401  (populates OPTION_REGISTRY)
+from optionkit.core.factory import create_model, create_option
+
+Row = Dict[str, Any]
+Timings = Dict[str, List[float]]      # model -> [rows, seconds]
+
+_BOOL = {"true": True, "false": False}
+
+
+def _scalar(text: str) -> Any:
+    """CSV cell -> int, float, bool or str."""
+    low = text.strip().lower()
+    if low in _BOOL:
+        return _BOOL[low]
+    for cast in (int, float):
+        try:
+            return cast(text)
+        except ValueError:
+            pass
+    return text
+
+
+# ----------------------------------------------------------------------
+# Input
+
+def read_rows(stream, fmt: str, defaults: Row) -> Iterator[Row]:
+    """Yield normalized rows (id, model, model_params, option, option_params)."""
+    if fmt == "csv":
+        records = (_csv_row(r) for r in csv.DictReader(stream))
+    else:
+        records = (_json_row(line) for line in stream if line.strip())
+    for i, rec in enumerate(records):
+        if isinstance(rec, Exception):
+            yield {"id": i, "error": f"{type(rec).__name__}: {rec}"}
+            continue
+        model = rec.get("model") or defaults["model"]
+        params = rec.get("model_params", {})
+        if model == defaults["model"]:
+            params = {**defaults["model_params"], **params}
+        yield {
+            "id": rec.get("id", i),
+            "model": model,
+            "model_params": params,
+            "option": rec.get("option") or defaults["option"],
+            "option_params": rec.get("option_params", {}),
+        }
+
+
+def _json_row(line: str) -> Any:
+    """Decoded JSON object, or the exception for a malformed line."""
+    try:
+        rec = json.loads(line)
+    except json.JSONDecodeError as exc:
+        return exc
+    if not isinstance(rec, dict):
+        return ValueError(f"row must be a JSON object, got {type(rec).__name__}")
+    return rec
+
+
+def _csv_row(raw: Dict[str, str]) -> Row:
+    rec: Row = {"model_params": {}, "option_params": {}}
+    for key, text in raw.items():
+        if text is None or text == "":
+            continue
+        if key in ("id", "model", "option"):
+            rec[key] = _scalar(text) if key == "id" else text
+        elif key.startswith("model."):
+            rec["model_params"][key[len("model."):]] = _scalar(text)
+        else:
+            rec["option_params"][key] = _scalar(text)
+    return rec
+
+
+# ----------------------------------------------------------------------
+# Pricing (runs in the worker processes)
+
+def price_rows(rows: Sequence[Row]) -> Tuple[List[Row], Timings]:
+    """
+    Price one chunk. Rows sharing model name and parameters are priced with
+    one model instance through `price_many`; a failing row only fails itself.
+    """
+    results: List[Optional[Row]] = [None] * len(rows)
+    groups: Dict[str, List[int]] = {}
+    for i, row in enumerate(rows):
+        if "error" in row:          # unreadable input row, reported as is
+            results[i] = {"id": row["id"], "error": row["error"]}
+            continue
+        key = json.dumps([row["model"], row["model_params"]], sort_keys=True, default=str)
+        groups.setdefault(key, []).append(i)
+
+    timings: Timings = {}
+    for idx in groups.values():
+        name = rows[idx[0]]["model"]
+        start = time.perf_counter()
+        _price_group(rows, idx, results)
+        entry = timings.setdefault(name, [0, 0.0])
+        entry[0] += len(idx)
+        entry[1] += time.perf_counter() - start
+    return results, timings
+
+
+def _price_group(rows: Sequence[Row], idx: List[int], results: List[Optional[Row]]) -> None:
+    """Price the rows `idx` sharing one model into `results`."""
+    try:
+        model = create_model(rows[idx[0]]["model"], **rows[idx[0]]["model_params"])
+    except Exception as exc:
+        for i in idx:
+            results[i] = _error(rows[i], exc)
+        return
+
+    options, ok = [], []
+    for i in idx:
+        try:
+            options.append(create_option(rows[i]["option"], **rows[i]["option_params"]))
+            ok.append(i)
+        except Exception as exc:
+            results[i] = _error(rows[i], exc)
+    try:
+        prices = [float(p) for p in model.price_many(options)] if options else []
+    except Exception:
+        prices = None       # price row by row to isolate the failure
+    for k, i in enumerate(ok):
+        if prices is not None:
+            results[i] = {"id": rows[i]["id"], "price": prices[k]}
+            continue
+        try:
+            results[i] = {"id": rows[i]["id"], "price": float(model.price(options[k]))}
+        except Exception as exc:
+            results[i] = _error(rows[i], exc)
+
+
+def _error(row: Row, exc: Exception) -> Row:
+    return {"id": row["id"], "error": f"{type(exc).__name__}: {exc}"}
+
+
+# ----------------------------------------------------------------------
+# Output
+
+class _Writer:
+    def __init__(self, stream, fmt: str):
+        self.stream = stream
+        self.csv = csv.writer(stream) if fmt == "csv" else None
+        if self.csv is not None:
+            self.csv.writerow(["id", "price", "error"])
+
+    def write(self, results: Iterable[Row]) -> None:
+        for r in results:
+            if self.csv is not None:
+                self.csv.writerow([r["id"], r.get("price", ""), r.get("error", "")])
+            else:
+                self.stream.write(json.dumps(r) + "\n")
+        self.stream.flush()
+
+
+def _chunks(rows: Iterator[Row], size: int) -> Iterator[List[Row]]:
+    while True:
+        chunk = list(islice(rows, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run(rows: Iterable[Row], writer: _Writer, workers: int = 0, chunk: int = 1000
+        ) -> Tuple[int, int, Timings]:
+    """Price a row stream and write results in input order; returns (rows, errors, timings)."""
+    total = errors = 0
+    timings: Timings = {}
+
+    def collect(fut: Future) -> None:
+        nonlocal total, errors
+        results, chunk_timings = fut.result()
+        writer.write(results)
+        total += len(results)
+        errors += sum("error" in r for r in results)
+        for name, (n, secs) in chunk_timings.items():
+            entry = timings.setdefault(name, [0, 0.0])
+            entry[0] += n
+            entry[1] += secs
+
+    if workers <= 0:
+        for rows_chunk in _chunks(iter(rows), chunk):
+            fut: Future = Future()
+            fut.set_result(price_rows(rows_chunk))
+            collect(fut)
+        return total, errors, timings
+
+    pending: deque = deque()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for rows_chunk in _chunks(iter(rows), chunk):
+            pending.append(pool.submit(price_rows, rows_chunk))
+            while len(pending) >= 2 * workers or (pending and pending[0].done()):
+                collect(pending.popleft())
+        while pending:
+            collect(pending.popleft())
+    return total, errors, timings
+
+
+def _summary(total: int, errors: int, timings: Timings, elapsed: float) -> str:
+    lines = [f"priced {total} rows ({errors} errors) in {elapsed:.2f}s: "
+             f"{total / elapsed if elapsed > 0 else 0.0:,.0f} rows/s"]
+    for name, (n, secs) in sorted(timings.items()):
+        rate = n / secs if secs > 0 else 0.0
+        lines.append(f"  {name:<24} {n:>10} rows {secs:>9.2f}s worker time {rate:>12,.0f} rows/s")
+    return "\n".join(lines)
+
+
+# ----------------------------------------------------------------------
+
+def _parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(prog="optionkit", description="Price option rows in batch.")
+    p.add_argument("input", nargs="?", default="-", help="input file, or - for stdin (default)")
+    p.add_argument("-o", "--output", default="-", help="output file, or - for stdout (default)")
+    p.add_argument("--format", choices=("jsonl", "csv"), default=None,
+                   help="input format (default: from the file extension, else jsonl)")
+    p.add_argument("--output-format", choices=("jsonl", "csv"), default=None,
+                   help="output format (default: same as the input)")
+    p.add_argument("--model", default="BlackScholes", help="default model name")
+    p.add_argument("--model-params", default="{}", help="default model parameters (JSON)")
+    p.add_argument("--option", default="EuropeanOption", help="default option type")
+    p.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                   help="worker processes; 0 prices in-process")
+    p.add_argument("--chunk", type=int, default=1000, help="rows per work unit")
+    p.add_argument("--quiet", action="store_true", help="no summary on stderr")
+    return p
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = _parser()
+    args = parser.parse_args(argv)
+    if args.chunk < 1:
+        parser.error("--chunk must be at least 1")
+    try:
+        model_params = json.loads(args.model_params)
+    except json.JSONDecodeError as exc:
+        parser.error(f"--model-params is not valid JSON: {exc}")
+    if not isinstance(model_params, dict):
+        parser.error("--model-params must be a JSON object")
+    fmt = args.format or ("csv" if args.input.endswith(".csv") else "jsonl")
+    out_fmt = args.output_format or (
+        "csv" if args.output.endswith(".csv") else "jsonl" if args.output.endswith(".jsonl") else fmt)
+    defaults = {"model": args.model, "model_params": model_params, "option": args.option}
+
+    src = sys.stdin if args.input == "-" else open(args.input, newline="")
+    dst = sys.stdout if args.output == "-" else open(args.output, "w", newline="")
+    start = time.perf_counter()
+    try:
+        total, errors, timings = run(read_rows(src, fmt, defaults), _Writer(dst, out_fmt),
+                                     workers=args.workers, chunk=args.chunk)
+    finally:
+        if src is not sys.stdin:
+            src.close()
+        if dst is not sys.stdout:
+            dst.close()
+    if not args.quiet:
+        print(_summary(total, errors, timings, time.perf_counter() - start), file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
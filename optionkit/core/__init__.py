@@ -2,7 +2,10 @@
 from .model import Model
 from .tree_model import TreeModel
 from .option import Option
-from .protocols import SupportsSpotPayoff, SupportsPathPayoff
+from .batch import OptionBatch
+from .protocols import (
+    SupportsSpotPayoff, SupportsPathPayoff, SupportsVolLookup, is_terminal_payoff, check_single_asset,
+)
 
 from .factory import (
     MODEL_REGISTRY, OPTION_REGISTRY,
@@ -13,8 +16,9 @@ from .factory import (
 )
 
 __all__ = [
-    "Model", "TreeModel", "Option",
-    "SupportsSpotPayoff", "SupportsPathPayoff",
+    "Model", "TreeModel", "Option", "OptionBatch",
+    "SupportsSpotPayoff", "SupportsPathPayoff", "SupportsVolLookup", "is_terminal_payoff",
+    "check_single_asset",
     "MODEL_REGISTRY", "OPTION_REGISTRY",
     "register_model", "register_option",
     "create_model", "create_option",
@@ -0,0 +1,268 @@
+# optionkit/core/batch.py
+from __future__ import annotations
+
+import contextlib
+import csv
+from dataclasses import fields, is_dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .factory import OPTION_REGISTRY
+from .option import Option
+
+_TRUE = {"1", "true", "t", "yes", "y", "call", "c"}
+
+
+def _parse_bool(values) -> np.ndarray:
+    arr = np.asarray(values)
+    if arr.dtype.kind in "biuf":
+        return arr.astype(bool)
+    return np.isin(np.char.lower(np.char.strip(arr.astype(str))), list(_TRUE))
+
+
+class OptionBatch:
+    """
+    Struct-of-arrays container for many options.
+
+    Every option is one row: `strike`, `maturity` and `is_call` are NumPy
+    arrays, the registered option type is stored as integer codes into
+    `types` (names from `OPTION_REGISTRY`), and type-specific fields
+    (`payout`, `barrier`, `direction`, ...) live in `columns`. Rows where a
+    column does not apply hold NaN (numeric) or "" (text).
+
+    Slicing with a `slice` returns a batch of views (no copy); boolean or
+    integer-array indexing copies. Row objects are only built on request:
+    `batch[i]`, `option(i)`, iteration or `to_options()`.
+
+    Vectorized engines read the arrays directly, e.g.
+    ``BlackScholesModel.price_many(batch)``.
+    """
+
+    __slots__ = ("strike", "maturity", "is_call", "type_code", "types", "columns")
+
+    def __init__(self, strike, maturity, is_call=True,
+                 type: Union[str, Sequence[str]] = "EuropeanOption",
+                 **columns):
+        self.strike = np.asarray(strike, dtype=float)
+        n = self.strike.shape[0]
+        self.maturity = np.broadcast_to(np.asarray(maturity, dtype=float), (n,))
+        self.is_call = np.broadcast_to(_parse_bool(is_call), (n,))
+        if isinstance(type, str):
+            self.types: Tuple[str, ...] = (type,)
+            self.type_code = np.zeros(n, dtype=np.int16)
+        else:
+            names, codes = np.unique(np.asarray(type, dtype=str), return_inverse=True)
+            self.types = tuple(str(t) for t in names)
+            self.type_code = codes.astype(np.int16)
+        self.columns: Dict[str, np.ndarray] = {
+            k: np.broadcast_to(np.asarray(v), (n,)) for k, v in columns.items()
+        }
+
+    @classmethod
+    def _from_arrays(cls, strike, maturity, is_call, type_code, types, columns) -> "OptionBatch":
+        obj = cls.__new__(cls)
+        obj.strike, obj.maturity, obj.is_call = strike, maturity, is_call
+        obj.type_code, obj.types, obj.columns = type_code, types, columns
+        return obj
+
+    # ------------------------------------------------------------------
+    # Row access (builds objects)
+
+    def __len__(self) -> int:
+        return self.strike.shape[0]
+
+    def __repr__(self) -> str:
+        return f"OptionBatch(n={len(self)}, types={list(self.types)}, columns={list(self.columns)})"
+
+    @property
+    def type(self) -> np.ndarray:
+        """Type name of every row."""
+        return np.asarray(self.types)[self.type_code]
+
+    def option(self, i: int) -> Option:
+        """Build the option object for row `i` (bypasses the creation log)."""
+        cls = OPTION_REGISTRY[self.types[self.type_code[i]]]
+        kwargs = {}
+        if is_dataclass(cls):
+            for f in fields(cls):
+                if f.name in self.columns:
+                    value = self.columns[f.name][i].item()
+                    if value == value and value != "":     # skip NaN / empty
+                        kwargs[f.name] = value
+        return cls(strike=float(self.strike[i]), maturity=float(self.maturity[i]),
+                   is_call=bool(self.is_call[i]), **kwargs)
+
+    def to_options(self) -> List[Option]:
+        return [self.option(i) for i in range(len(self))]
+
+    def __iter__(self) -> Iterator[Option]:
+        return (self.option(i) for i in range(len(self)))
+
+    def __getitem__(self, idx):
+        if isinstance(idx, (int, np.integer)):
+            return self.option(int(idx))
+        return self._from_arrays(
+            self.strike[idx], self.maturity[idx], self.is_call[idx], self.type_code[idx],
+            self.types, {k: v[idx] for k, v in self.columns.items()},
+        )
+
+    # ------------------------------------------------------------------
+    # Construction and grouping
+
+    @classmethod
+    def from_options(cls, options: Iterable[Option]) -> "OptionBatch":
+        """
+        Columnar copy of a sequence of option objects. Only scalar fields
+        fit a column; options with sequence fields (`BasketOption.weights`,
+        `SpreadOption.legs`) are rejected with a ValueError.
+        """
+        options = list(options)
+        names = {v: k for k, v in OPTION_REGISTRY.items()}
+        extra: Dict[str, list] = {}
+        for i, o in enumerate(options):
+            if is_dataclass(o):
+                for f in fields(o):
+                    if f.name in ("strike", "maturity", "is_call"):
+                        continue
+                    value = getattr(o, f.name)
+                    if not isinstance(value, (str, int, float, np.number)):
+                        raise ValueError(
+                            f"OptionBatch holds scalar fields only; {type(o).__name__}.{f.name} "
+                            f"is a {type(value).__name__}."
+                        )
+                    extra.setdefault(f.name, [None] * len(options))[i] = value
+        columns = {}
+        for k, vals in extra.items():
+            sample = next(v for v in vals if v is not None)
+            if isinstance(sample, str):
+                columns[k] = np.array(["" if v is None else v for v in vals])
+            else:
+                columns[k] = np.array([np.nan if v is None else v for v in vals], dtype=float)
+        return cls(
+            [o.strike for o in options], [o.maturity for o in options],
+            [o.is_call for o in options],
+            [names.get(type(o), type(o).__name__) for o in options], **columns,
+        )
+
+    def mask(self, type: str) -> np.ndarray:
+        """Boolean mask of the rows of one registered type."""
+        if type not in self.types:
+            return np.zeros(len(self), dtype=bool)
+        return self.type_code == self.types.index(type)
+
+    def groupby(self, by: Sequence[str] = ("type", "maturity")) -> Iterator[Tuple[tuple, "OptionBatch"]]:
+        """
+        Yield ((key values), sub-batch) per distinct key. Rows are sorted once
+        (one copy) and every group is then a slice view of the sorted batch.
+        """
+        keys = [self.type_code if k == "type" else self._column(k) for k in by]
+        order = np.lexsort(keys[::-1])
+        ordered = self[order]
+        sorted_keys = [k[order] for k in keys]
+        change = np.zeros(len(self), dtype=bool)
+        if len(self):
+            change[0] = True
+        for k in sorted_keys:
+            change[1:] |= k[1:] != k[:-1]
+        starts = np.flatnonzero(change)
+        ends = np.append(starts[1:], len(self))
+        for s, e in zip(starts, ends):
+            key = tuple(self.types[k[s]] if name == "type" else k[s].item()
+                        for name, k in zip(by, sorted_keys))
+            yield key, ordered[s:e]
+
+    def _column(self, name: str) -> np.ndarray:
+        if name in ("strike", "maturity", "is_call", "type_code"):
+            return getattr(self, name)
+        return self.columns[name]
+
+    # ------------------------------------------------------------------
+    # I/O
+
+    def _table(self) -> Dict[str, np.ndarray]:
+        table = {"type": self.type, "strike": self.strike, "maturity": self.maturity,
+                 "is_call": self.is_call}
+        table.update(self.columns)
+        return table
+
+    @classmethod
+    def _from_table(cls, table: Dict[str, np.ndarray]) -> "OptionBatch":
+        table = dict(table)
+        kind = table.pop("type", "EuropeanOption")
+        strike, maturity = table.pop("strike"), table.pop("maturity")
+        is_call = table.pop("is_call", True)
+        return cls(strike, maturity, is_call, kind, **table)
+
+    def to_npz(self, path) -> None:
+        table = self._table()
+        np.savez(path, **{k: np.ascontiguousarray(v) for k, v in table.items()})
+
+    @classmethod
+    def from_npz(cls, path) -> "OptionBatch":
+        with np.load(path, allow_pickle=False) as data:
+            return cls._from_table({k: data[k] for k in data.files})
+
+    def to_csv(self, path) -> None:
+        table = self._table()
+        cols = []
+        for v in table.values():
+            v = v.tolist()
+            cols.append(["" if x != x else x for x in v])    # NaN -> empty cell
+        with open(path, "w", newline="") as fh:
+            w = csv.writer(fh)
+            w.writerow(table.keys())
+            w.writerows(zip(*cols))
+
+    @classmethod
+    def from_csv(cls, path) -> "OptionBatch":
+        """
+        Read a CSV with a header row from a path or an open text file (read
+        once, front to back). Required columns: strike, maturity; optional:
+        is_call (1/0, true/false, call/put), type (registered name); any
+        other column is kept as a type-specific column (numeric when every
+        non-empty value parses as a number, text otherwise).
+        """
+        source = contextlib.nullcontext(path) if hasattr(path, "read") else open(path, newline="")
+        with source as fh:
+            reader = csv.reader(fh)
+            header = next(reader)
+            rows = list(reader)
+        if not rows:
+            return cls._from_table({h: np.array([], dtype=float) for h in header})
+        try:
+            cells = np.array(rows, dtype=str)
+        except ValueError:
+            raise ValueError(f"CSV rows must all have {len(header)} fields.") from None
+        if cells.shape[1] != len(header):
+            raise ValueError(f"CSV rows must all have {len(header)} fields.")
+        return cls._from_table({name: cells[:, j] if name == "type" else _numeric_or_text(cells[:, j])
+                                for j, name in enumerate(header)})
+
+    def to_parquet(self, path) -> None:
+        pa, pq = _pyarrow()
+        pq.write_table(pa.table({k: np.asarray(v) for k, v in self._table().items()}), path)
+
+    @classmethod
+    def from_parquet(cls, path) -> "OptionBatch":
+        _, pq = _pyarrow()
+        table = pq.read_table(path)
+        return cls._from_table({name: table.column(name).to_numpy(zero_copy_only=False)
+                                for name in table.column_names})
+
+
+def _numeric_or_text(col: np.ndarray) -> np.ndarray:
+    filled = np.where(col == "", "nan", col)
+    try:
+        return filled.astype(float)
+    except ValueError:
+        return col
+
+
+def _pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise ImportError("Parquet support requires pyarrow (pip install pyarrow).") from exc
+    return pa, pq
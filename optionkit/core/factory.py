@@ -1,8 +1,9 @@
 # optionkit/core/factory.py
 from __future__ import annotations
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Type
+from typing import Any, Deque, Dict, List, Type
 
 from .model import Model
 from .option import Option
@@ -19,7 +20,8 @@ class CreationRecord:
     name: str
     kwargs: Dict[str, Any]
 
-_CREATION_LOG: List[CreationRecord] = []
+# Bounded, so long-running batch jobs and services do not grow it without limit
+_CREATION_LOG: Deque[CreationRecord] = deque(maxlen=10_000)
 
 # === Decorators ===
 def register_model(name: str):
@@ -81,5 +83,5 @@ def describe_registry() -> str:
 
 def recent_creations(n: int = 20) -> List[CreationRecord]:
     """Most recent creations (models and options) with kwargs."""
-    return _CREATION_LOG[-n:]
+    return list(_CREATION_LOG)[-n:]
 
@@ -1,4 +1,5 @@
 import math
+import numpy as np
 from scipy.stats import norm
 
 def d1_d2(S, K, T, r, sigma):
@@ -12,3 +13,109 @@ def discount(r, T):
 
 def std_norm_cdf(x):
     return norm.cdf(x)
+
+def bs_price(S, K, T, r, sigma, is_call=True):
+    """Closed-form Black–Scholes price of a vanilla call or put."""
+    d1, d2 = d1_d2(S, K, T, r, sigma)
+    if is_call:
+        return S * norm.cdf(d1) - K * discount(r, T) * norm.cdf(d2)
+    return K * discount(r, T) * norm.cdf(-d2) - S * norm.cdf(-d1)
+
+def bs_price_vec(S, K, T, r, sigma, is_call=True):
+    """
+    Vectorized Black–Scholes prices of vanilla calls/puts: the one array
+    kernel behind `BlackScholesModel.price_batch` and the trees' BBS step.
+    All arguments broadcast against each other.
+    """
+    S, K = np.asarray(S, dtype=float), np.asarray(K, dtype=float)
+    T, sigma = np.asarray(T, dtype=float), np.asarray(sigma, dtype=float)
+    vol_T = sigma * np.sqrt(T)
+    d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / vol_T
+    d2 = d1 - vol_T
+    df = np.exp(-r * T)
+    calls = S * norm.cdf(d1) - K * df * norm.cdf(d2)
+    puts = K * df * norm.cdf(-d2) - S * norm.cdf(-d1)
+    return np.where(np.asarray(is_call, dtype=bool), calls, puts)
+
+def bs_digital_price(S, K, T, r, sigma, is_call=True, payout=1.0):
+    """Closed-form Black–Scholes price of a cash-or-nothing digital."""
+    _, d2 = d1_d2(S, K, T, r, sigma)
+    return payout * discount(r, T) * norm.cdf(d2 if is_call else -d2)
+
+def bs_barrier_price(S, K, H, T, r, sigma, is_call=True, direction="down", knock="out",
+                     rebate=0.0):
+    """
+    Closed-form Black–Scholes price of a continuously monitored single-barrier
+    option (Reiner–Rubinstein, as tabulated by Haug). The rebate is paid at
+    expiry: to knock-outs if the barrier was hit, to knock-ins if it was not.
+    """
+    down = direction == "down"
+    df = discount(r, T)
+    if (S <= H) if down else (S >= H):
+        # Already breached: knocked in (vanilla) or knocked out (rebate)
+        return bs_price(S, K, T, r, sigma, is_call) if knock == "in" else rebate * df
+
+    phi = 1.0 if is_call else -1.0
+    eta = 1.0 if down else -1.0
+    vol_T = sigma * math.sqrt(T)
+    mu = (r - 0.5 * sigma**2) / sigma**2
+    x1 = math.log(S / K) / vol_T + (1 + mu) * vol_T
+    x2 = math.log(S / H) / vol_T + (1 + mu) * vol_T
+    y1 = math.log(H**2 / (S * K)) / vol_T + (1 + mu) * vol_T
+    y2 = math.log(H / S) / vol_T + (1 + mu) * vol_T
+    hs, hs2 = (H / S) ** (2 * (mu + 1)), (H / S) ** (2 * mu)
+    N = norm.cdf
+
+    A = phi * S * N(phi * x1) - phi * K * df * N(phi * (x1 - vol_T))
+    B = phi * S * N(phi * x2) - phi * K * df * N(phi * (x2 - vol_T))
+    C = phi * S * hs * N(eta * y1) - phi * K * df * hs2 * N(eta * (y1 - vol_T))
+    D = phi * S * hs * N(eta * y2) - phi * K * df * hs2 * N(eta * (y2 - vol_T))
+
+    # Knock-in value without rebate; the knock-out follows from in + out = vanilla
+    above = K > H
+    if is_call:
+        knock_in = (C if above else A - B + D) if down else (A if above else B - C + D)
+    else:
+        knock_in = (B - C + D if above else A) if down else (A - B + D if above else C)
+    survival = N(eta * (x2 - vol_T)) - hs2 * N(eta * (y2 - vol_T))
+
+    if knock == "in":
+        return knock_in + rebate * df * survival
+    vanilla = bs_price(S, K, T, r, sigma, is_call)
+    return vanilla - knock_in + rebate * df * (1 - survival)
+
+def mc_dtype(dtype):
+    """Validate a Monte Carlo precision setting; returns "float32" or "float64"."""
+    name = np.dtype(dtype).name
+    if name not in ("float32", "float64"):
+        raise ValueError(f"Unsupported Monte Carlo dtype: {dtype!r} (use float32 or float64)")
+    return name
+
+def margrabe_price(S1, S2, T, sigma1, sigma2, rho, is_call=True):
+    """
+    Margrabe price of the option to exchange asset 2 for asset 1,
+    max(S1 - S2, 0) (call) or max(S2 - S1, 0) (put), under correlated GBM.
+    """
+    sigma = math.sqrt(max(sigma1**2 - 2 * rho * sigma1 * sigma2 + sigma2**2, 1e-300))
+    vol_T = sigma * math.sqrt(T)
+    d1 = (math.log(S1 / S2) + 0.5 * vol_T**2) / vol_T
+    d2 = d1 - vol_T
+    if is_call:
+        return S1 * norm.cdf(d1) - S2 * norm.cdf(d2)
+    return S2 * norm.cdf(-d2) - S1 * norm.cdf(-d1)
+
+def kirk_spread_price(S1, S2, K, T, r, sigma1, sigma2, rho, is_call=True):
+    """
+    Kirk's approximation to a spread option max(S1 - S2 - K, 0) (put:
+    max(K + S2 - S1, 0)) under correlated GBM. Exact (Margrabe) for K = 0;
+    puts follow from spread put-call parity.
+    """
+    df = discount(r, T)
+    F1, F2 = S1 / df, S2 / df
+    b = F2 / (F2 + K)
+    sigma = math.sqrt(sigma1**2 - 2 * rho * sigma1 * sigma2 * b + (sigma2 * b) ** 2)
+    vol_T = sigma * math.sqrt(T)
+    d1 = (math.log(F1 / (F2 + K)) + 0.5 * vol_T**2) / vol_T
+    d2 = d1 - vol_T
+    call = df * (F1 * norm.cdf(d1) - (F2 + K) * norm.cdf(d2))
+    return call if is_call else call - (S1 - S2 - K * df)
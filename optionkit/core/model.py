@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 import copy
+import numpy as np
 from dataclasses import is_dataclass, fields
 
 class Model(ABC):
@@ -24,6 +25,13 @@ class Model(ABC):
         """Return option price."""
         pass
 
+    def price_many(self, options):
+        """
+        Price a sequence of options under this model; returns an array.
+        Engines with a vectorized path override this.
+        """
+        return np.array([self.price(o) for o in options], dtype=float)
+
     # ===== Default Greeks (finite difference) =====
     def _fd(self, option, attr, h=1e-4, second=False):
         model1 = copy.deepcopy(self)
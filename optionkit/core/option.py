@@ -3,6 +3,9 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from typing import ClassVar
+
+import numpy as np
 
 @dataclass(slots=True, repr=True, eq=True)
 class Option(ABC):
@@ -15,6 +18,12 @@ class Option(ABC):
     maturity: float
     is_call: bool = True
 
+    # Payoff classification for simulation engines (see
+    # optionkit.core.protocols.is_terminal_payoff)
+    path_dependent: ClassVar[bool] = False
+    early_exercise: ClassVar[bool] = False
+    multi_asset: ClassVar[bool] = False
+
     @abstractmethod
     def payoff(self, x, /) -> float:
         """
@@ -26,6 +35,15 @@ class Option(ABC):
         """
         raise NotImplementedError
 
+    def payoff_array(self, spots):
+        """
+        Payoff evaluated elementwise over an array of terminal spots.
+        Spot-based options override this with a vectorized expression.
+        """
+        spots = np.asarray(spots, dtype=float)
+        flat = np.fromiter((self.payoff(s) for s in spots.ravel()), dtype=float, count=spots.size)
+        return flat.reshape(spots.shape)
+
     def describe(self) -> str:
         kind = "Call" if self.is_call else "Put"
         return f"{kind} Option: strike={self.strike}, maturity={self.maturity}"
@@ -23,3 +23,31 @@ class SupportsPathPayoff(Protocol):
     `payoff(path: Sequence[float]) -> float`.
     """
     def payoff(self, path: Sequence[float]) -> float: ...
+
+def is_terminal_payoff(option) -> bool:
+    """
+    True if `option` is a `SupportsSpotPayoff` whose value only depends on
+    the terminal spot of a single asset: no path dependence, no early
+    exercise and not a multi-asset payoff. Simulation engines may then
+    sample S_T directly instead of whole paths.
+    """
+    return (isinstance(option, SupportsSpotPayoff)
+            and not getattr(option, "path_dependent", False)
+            and not getattr(option, "early_exercise", False)
+            and not getattr(option, "multi_asset", False))
+
+def check_single_asset(option, engine) -> None:
+    """Raise TypeError if a single-asset `engine` is given a multi-asset option."""
+    if getattr(option, "multi_asset", False):
+        raise TypeError(f"{type(engine).__name__} prices single-asset options, got "
+                        f"{type(option).__name__}; use MultiAssetMonteCarlo.")
+
+@runtime_checkable
+class SupportsVolLookup(Protocol):
+    """
+    Protocol for volatility surfaces usable in place of a scalar `vol`.
+
+    Batch engines (e.g., `BlackScholesModel.price_batch`) accept any object
+    implementing vectorized `vol(strike, maturity) -> np.ndarray`.
+    """
+    def vol(self, strike, maturity): ...
@@ -1,26 +1,170 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
 from .model import Model
+from .math_utils import bs_price_vec
+from .protocols import check_single_asset
+
+# Lattice geometry shared by all tree models, keyed on
+# (model type, spot, steps, lattice params); LRU with a byte budget.
+_LATTICE_CACHE: "OrderedDict[tuple, tuple]" = OrderedDict()
+_LATTICE_CACHE_BYTES = 64 * 2**20
+_LATTICE_LOCK = threading.Lock()
+_cache_bytes = 0
+
 
 class TreeModel(Model):
-    """Generic tree scaffold for binomial/trinomial-like models."""
+    """
+    Generic tree scaffold for binomial/trinomial-like models.
 
-    def __init__(self, steps=100):
+    Subclasses provide `_lattice_params(maturity, steps)`, returning the
+    step count actually used and an immutable, hashable parameter object
+    (with at least `dt`), `_level(t, params)`, the node prices at time step
+    t in ascending order, and `_step(values, params)`, one backward step on
+    a (nodes, options) array. They are expected to expose `spot`, `rate` and
+    `vol` attributes. No per-call state is stored on the model, so pricing is
+    re-entrant and one instance can be shared across threads.
+
+    Backward induction runs on a 2-D array with one column per option, so
+    `price_many` prices every option sharing a maturity (a strike ladder,
+    calls and puts, European and American) on one lattice; early exercise
+    is applied column by column. The node prices only depend on the model
+    parameters, the maturity and the step count, and are cached across
+    calls (see `lattice`).
+
+    Acceleration flags
+    ------------------
+    smoothing : bool
+        Broadie–Detemple BBS method: replace the continuation value at the
+        penultimate step by the closed-form Black–Scholes value over the last
+        time step. Removes the odd/even oscillation of vanilla payoffs.
+    richardson : bool
+        Two-point Richardson extrapolation, 2 * P(2N) - P(N). Combined with
+        `smoothing` this is the BBSR method.
+    """
+
+    def __init__(self, steps=100, smoothing=False, richardson=False):
         self.steps = steps
+        self.smoothing = smoothing
+        self.richardson = richardson
 
-    def _build_tree(self, option):
-        """Each subclass must return a 2D tree of stock prices."""
+    def _lattice_params(self, maturity, steps):
+        """Each subclass must return (steps used, lattice params)."""
         raise NotImplementedError
 
-    def _payoff(self, stock_price, option):
-        return option.payoff(stock_price)
+    def _level(self, t, params):
+        """Each subclass must return the node prices at time step t."""
+        raise NotImplementedError
 
-    def price(self, option):
-        tree = self._build_tree(option)
-        payoffs = [self._payoff(s, option) for s in tree[-1]]
-        # backward induction
-        for t in range(len(tree) - 2, -1, -1):
-            payoffs = [self._step(i, t, payoffs, option) for i in range(len(tree[t]))]
-        return payoffs[0]
-
-    def _step(self, i, t, payoffs, option):
-        """Discount expected payoff at node i,t."""
+    def _step(self, values, params):
+        """Discounted expectation over the children of every node."""
         raise NotImplementedError
+
+    def lattice(self, maturity, steps):
+        """(node prices per time step, lattice params), from the shared cache."""
+        global _cache_bytes
+        steps, params = self._lattice_params(maturity, steps)
+        key = (type(self), float(self.spot), steps, params)
+        with _LATTICE_LOCK:
+            levels = _LATTICE_CACHE.get(key)
+            if levels is not None:
+                _LATTICE_CACHE.move_to_end(key)
+                return levels, params
+
+        levels = tuple(self._level(t, params) for t in range(steps + 1))
+        for level in levels:
+            level.setflags(write=False)
+        size = sum(level.nbytes for level in levels)
+        if size <= _LATTICE_CACHE_BYTES // 4:
+            with _LATTICE_LOCK:
+                if key not in _LATTICE_CACHE:
+                    _LATTICE_CACHE[key] = levels
+                    _cache_bytes += size
+                while _cache_bytes > _LATTICE_CACHE_BYTES:
+                    _, old = _LATTICE_CACHE.popitem(last=False)
+                    _cache_bytes -= sum(level.nbytes for level in old)
+        return levels, params
+
+    # ------------------------------------------------------------------
+
+    def price(self, option):
+        return float(self._price_group([option])[0])
+
+    def price_many(self, options):
+        """Prices of many options; options sharing a maturity share one lattice."""
+        options = list(options)
+        prices = np.empty(len(options))
+        groups = {}
+        for i, option in enumerate(options):
+            groups.setdefault(float(option.maturity), []).append(i)
+        for idx in groups.values():
+            prices[idx] = self._price_group([options[i] for i in idx])
+        return prices
+
+    def _price_group(self, options):
+        for option in options:
+            check_single_asset(option, self)
+        if self.richardson:
+            return 2 * self._induce_many(options, 2 * self.steps) - self._induce_many(options, self.steps)
+        return self._induce_many(options, self.steps)
+
+    def _induce(self, option, steps):
+        """Backward induction for one option on a tree with `steps` time steps."""
+        return float(self._induce_many([option], steps)[0])
+
+    def _induce_many(self, options, steps):
+        """Backward induction on (nodes, options) for options sharing a maturity."""
+        levels, params = self.lattice(options[0].maturity, steps)
+        american = np.array([_is_american(o) for o in options])
+        exercise = _Intrinsic([o for o, a in zip(options, american) if a])
+        last = len(levels) - 1
+
+        if self.smoothing:
+            # BBS: analytic Black–Scholes values one step before maturity
+            for option in options:
+                _check_vanilla(option)
+            last -= 1
+            strike = np.array([o.strike for o in options])
+            is_call = np.array([o.is_call for o in options])
+            values = bs_price_vec(levels[last][:, None], strike, params.dt, self.rate, self.vol, is_call)
+        else:
+            values = np.column_stack([o.payoff_array(levels[last]) for o in options]).astype(float)
+
+        for t in range(last, -1, -1):
+            if t < last:
+                values = self._step(values, params)
+            if exercise:
+                values[:, american] = np.maximum(values[:, american], exercise(levels[t]))
+        return values[0]
+
+
+class _Intrinsic:
+    """Exercise values of vanilla calls/puts on a vector of node prices."""
+
+    def __init__(self, options):
+        self.n = len(options)
+        self.strike = np.array([o.strike for o in options], dtype=float)
+        self.sign = np.array([1.0 if o.is_call else -1.0 for o in options])
+
+    def __bool__(self):
+        return self.n > 0
+
+    def __call__(self, spots):
+        return np.maximum(self.sign * (spots[:, None] - self.strike), 0.0)
+
+
+def _is_american(option):
+    # Imported lazily: payoffs depend on core, not the other way round.
+    from optionkit.payoffs.american import AmericanOption
+    return isinstance(option, AmericanOption)
+
+
+def _check_vanilla(option):
+    from optionkit.payoffs.american import AmericanOption
+    from optionkit.payoffs.european import EuropeanOption
+    if not isinstance(option, (EuropeanOption, AmericanOption)):
+        raise ValueError(
+            f"BBS smoothing needs a vanilla call/put payoff, got {type(option).__name__}."
+        )
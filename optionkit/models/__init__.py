@@ -5,8 +5,12 @@ from .merton import MertonModel
 from .montecarlo import MonteCarloModel
 from .binomial import BinomialTreeModel
 from .trinomial import TrinomialTreeModel
+from .finite_difference import FiniteDifferenceModel
+from .heston_fd import HestonFDModel
+from .multi_asset import MultiAssetMonteCarloModel
 
 __all__ = [
     "BlackScholesModel", "HestonModel", "MertonModel",
     "MonteCarloModel", "BinomialTreeModel", "TrinomialTreeModel",
+    "FiniteDifferenceModel", "HestonFDModel", "MultiAssetMonteCarloModel",
 ]
@@ -1,35 +1,49 @@
 # optionkit/models/binomial.py
 import math
+from dataclasses import dataclass
+
+import numpy as np
 from optionkit.core.tree_model import TreeModel
 from optionkit.core.factory import register_model
 
+@dataclass(slots=True, frozen=True)
+class BinomialParams:
+    """Per-call lattice parameters: up/down factors, up probability, step size, discount."""
+    u: float
+    d: float
+    q: float
+    dt: float
+    disc: float
+
 @register_model("BinomialTree")
 class BinomialTreeModel(TreeModel):
-    """Binomial tree option pricing model."""
+    """
+    Binomial (CRR) tree option pricing model.
 
-    def __init__(self, spot: float, rate: float, vol: float, steps: int = 100):
-        super().__init__(steps)
+    Supports early exercise for `AmericanOption`. Set `smoothing=True` for the
+    BBS method and `richardson=True` for two-point Richardson extrapolation
+    (see `TreeModel`).
+    """
+
+    def __init__(self, spot: float, rate: float, vol: float, steps: int = 100,
+                 smoothing: bool = False, richardson: bool = False):
+        super().__init__(steps, smoothing, richardson)
         self.spot = spot
         self.rate = rate
         self.vol = vol
 
-    def _build_tree(self, option):
-        dt = option.maturity / self.steps
+    def _lattice_params(self, maturity, steps):
+        dt = maturity / steps
         u = math.exp(self.vol * math.sqrt(dt))
         d = 1 / u
         q = (math.exp(self.rate * dt) - d) / (u - d)
+        return steps, BinomialParams(u, d, q, dt, math.exp(-self.rate * dt))
+
+    def _level(self, t, params):
+        j = np.arange(t + 1)
+        return self.spot * params.u ** j * params.d ** (t - j)
 
-        tree = [[0] * (i + 1) for i in range(self.steps + 1)]
-        tree[0][0] = self.spot
-        for i in range(1, self.steps + 1):
-            for j in range(i + 1):
-                tree[i][j] = self.spot * (u ** j) * (d ** (i - j))
-        self.u, self.d, self.q, self.dt = u, d, q, dt
-        return tree
-
-    def _step(self, i, t, payoffs, option):
-        # backward induction step
-        return math.exp(-self.rate * self.dt) * (
-            self.q * payoffs[i + 1] + (1 - self.q) * payoffs[i]
-        )
+    def _step(self, values, params):
+        # backward induction step: node j has children j (down) and j+1 (up)
+        return params.disc * (params.q * values[1:] + (1 - params.q) * values[:-1])
 
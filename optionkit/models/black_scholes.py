@@ -1,11 +1,23 @@
+import math
+
+import numpy as np
 from scipy.stats import norm
 from optionkit.core import Model
-from optionkit.core.math_utils import d1_d2, discount
+from optionkit.core.math_utils import d1_d2, bs_price, bs_price_vec, bs_digital_price, bs_barrier_price
 from optionkit.core import register_model
+from optionkit.core.protocols import SupportsVolLookup, check_single_asset
+from optionkit.core.batch import OptionBatch
+from optionkit.payoffs.digital import DigitalOption
+from optionkit.payoffs.barrier import BarrierOption
 
 @register_model("BlackScholes")
 class BlackScholesModel(Model):
-    """Black-Scholes-Merton closed-form pricing with Greeks."""
+    """
+    Black-Scholes-Merton closed-form pricing with Greeks.
+    Vanilla options and cash-or-nothing `DigitalOption`s (price, delta,
+    gamma, vega, theta and rho in closed form) are supported, as are
+    continuously monitored `BarrierOption`s (closed-form price).
+    """
 
     def __init__(self, spot: float, rate: float, vol: float):
         self.spot = spot
@@ -13,16 +25,110 @@ class BlackScholesModel(Model):
         self.vol = vol
 
     def price(self, option):
-        S, K, T, r, sigma = self.spot, option.strike, option.maturity, self.rate, self.vol
-        d1, d2 = d1_d2(S, K, T, r, sigma)
-        if option.is_call:
-            return S * norm.cdf(d1) - K * discount(r, T) * norm.cdf(d2)
-        else:
-            return K * discount(r, T) * norm.cdf(-d2) - S * norm.cdf(-d1)
+        check_single_asset(option, self)
+        if isinstance(option, DigitalOption):
+            return bs_digital_price(self.spot, option.strike, option.maturity, self.rate,
+                                    self.vol, option.is_call, option.payout)
+        if isinstance(option, BarrierOption):
+            return bs_barrier_price(self.spot, option.strike, option.barrier, option.maturity,
+                                    self.rate, self.vol, option.is_call, option.direction,
+                                    option.knock, option.rebate)
+        return bs_price(self.spot, option.strike, option.maturity,
+                        self.rate, self.vol, option.is_call)
+
+    def price_batch(self, strike, maturity, is_call, vol=None):
+        """
+        Vectorized closed-form prices for arrays of strikes, maturities and
+        call/put flags (broadcast against each other).
+
+        `vol` overrides the model volatility: a scalar, an array broadcast
+        with the strikes, or a surface implementing `vol(K, T)`
+        (`SupportsVolLookup`, e.g. `optionkit.calibration.VolSurface`).
+        """
+        K = np.asarray(strike, dtype=float)
+        T = np.asarray(maturity, dtype=float)
+        return bs_price_vec(self.spot, K, T, self.rate, self._sigma(K, T, vol), is_call)
+
+    def _sigma(self, K, T, vol):
+        if vol is None:
+            return self.vol
+        if isinstance(vol, SupportsVolLookup):
+            return vol.vol(K, T)
+        return np.asarray(vol, dtype=float)
+
+    def price_many(self, options, vol=None):
+        """
+        Prices of a sequence of options or an `OptionBatch`; batches are
+        priced straight from their columns without building row objects.
+        """
+        if not isinstance(options, OptionBatch):
+            options = list(options)
+            for option in options:
+                check_single_asset(option, self)
+        batch = options if isinstance(options, OptionBatch) else OptionBatch.from_options(options)
+        K, T, call = batch.strike, batch.maturity, batch.is_call
+        sigma = np.broadcast_to(self._sigma(K, T, vol), K.shape)
+        prices = self.price_batch(K, T, call, sigma)
+
+        digital = batch.mask("DigitalOption")
+        if digital.any():
+            k, t, s = K[digital], T[digital], sigma[digital]
+            d2 = (np.log(self.spot / k) + (self.rate - 0.5 * s**2) * t) / (s * np.sqrt(t))
+            payout = batch.columns["payout"][digital]
+            prices[digital] = payout * np.exp(-self.rate * t) * norm.cdf(np.where(call[digital], d2, -d2))
+
+        # Barriers are rare in a batch; price them one by one
+        for i in np.flatnonzero(batch.mask("BarrierOption")):
+            c = {name: batch.columns[name][i].item()
+                 for name in ("barrier", "direction", "knock", "rebate")}
+            prices[i] = bs_barrier_price(self.spot, K[i], c["barrier"], T[i], self.rate,
+                                         float(sigma[i]), bool(call[i]), c["direction"],
+                                         c["knock"], c["rebate"])
+        return prices
 
     # override Greeks for closed form
     def delta(self, option):
+        if isinstance(option, DigitalOption):
+            return self._digital_greeks(option)["delta"]
         d1, _ = d1_d2(self.spot, option.strike, option.maturity, self.rate, self.vol)
         return norm.cdf(d1) if option.is_call else norm.cdf(d1) - 1
 
+    def gamma(self, option):
+        if isinstance(option, DigitalOption):
+            return self._digital_greeks(option)["gamma"]
+        return super().gamma(option)
+
+    def vega(self, option):
+        if isinstance(option, DigitalOption):
+            return self._digital_greeks(option)["vega"]
+        return super().vega(option)
+
+    def theta(self, option):
+        if isinstance(option, DigitalOption):
+            return self._digital_greeks(option)["theta"]
+        return super().theta(option)
+
+    def rho(self, option):
+        if isinstance(option, DigitalOption):
+            return self._digital_greeks(option)["rho"]
+        return super().rho(option)
+
+    def _digital_greeks(self, option):
+        """Closed-form Greeks of a cash-or-nothing digital (theta = -dV/dT)."""
+        S, K, T, r, sigma = self.spot, option.strike, option.maturity, self.rate, self.vol
+        d1, d2 = d1_d2(S, K, T, r, sigma)
+        sqrt_T = math.sqrt(T)
+        A = option.payout * math.exp(-r * T)
+        sign = 1.0 if option.is_call else -1.0
+        n2 = norm.pdf(d2)
+        N2 = norm.cdf(sign * d2)
+        dd2_dT = (-math.log(S / K) / T + r - 0.5 * sigma**2) / (2 * sigma * sqrt_T)
+        return {
+            "delta": sign * A * n2 / (S * sigma * sqrt_T),
+            "gamma": -sign * A * n2 * d1 / (S**2 * sigma**2 * T),
+            "vega": -sign * A * n2 * d1 / sigma,
+            "theta": r * A * N2 - sign * A * n2 * dd2_dT,
+            "rho": -T * A * N2 + sign * A * n2 * sqrt_T / sigma,
+        }
+
 
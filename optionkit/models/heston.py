@@ -1,17 +1,36 @@
+import math
+from typing import Optional
+
 import numpy as np
+from optionkit.core.math_utils import mc_dtype
 from optionkit.core.model import Model
 from optionkit.core.option import Option
 from optionkit.core.factory import register_model
+from optionkit.core.protocols import check_single_asset, is_terminal_payoff
+from optionkit.core.tree_model import _is_american
+from optionkit.models.lsm import price_american
+from optionkit.models.sequential import MCEstimate, sequential_estimate
+from optionkit.models.adjoint import ADJOINT_PAYOFFS, AdjointGreeks, heston_adjoint
+from optionkit.payoffs.barrier import BarrierOption
+from optionkit.simulation.path_store import PathStore
 
 @register_model("Heston")
 class HestonModel(Model):
     """
     Heston stochastic volatility model.
-    Priced via Monte Carlo simulation.
+    Priced via Monte Carlo simulation; ``HestonFDModel.from_heston(model)``
+    solves the PDE instead.
     """
 
+    # Attributes that determine the simulated paths (path-store key)
+    SIMULATION_PARAMS = ("spot", "rate", "v0", "kappa", "theta", "sigma_v", "rho",
+                         "steps", "paths", "seed", "dtype")
+
     def __init__(self, spot: float, rate: float, v0: float, kappa: float, theta: float,
-                 sigma_v: float, rho: float, steps: int = 200, paths: int = 100_000, seed: int = 42):
+                 sigma_v: float, rho: float, steps: int = 200, paths: int = 100_000, seed: int = 42,
+                 lsm_basis: str = "laguerre", lsm_degree: int = 3,
+                 lsm_chunk: Optional[int] = None, path_store: Optional[PathStore] = None,
+                 dtype: str = "float64"):
         self.spot = spot
         self.rate = rate
         self.v0 = v0          # initial variance
@@ -22,41 +41,151 @@ class HestonModel(Model):
         self.steps = steps
         self.paths = paths
         self.seed = seed
+        self.lsm_basis = lsm_basis    # early exercise: regression basis
+        self.lsm_degree = lsm_degree
+        self.lsm_chunk = lsm_chunk    # None: in-sample LSM; int: two-pass, chunked
+        self.path_store = path_store
+        self.dtype = mc_dtype(dtype)
 
-    def simulate_paths(self, T: float) -> np.ndarray:
+    def simulate_paths(self, T: float, paths: Optional[int] = None,
+                       rng: Optional[np.random.Generator] = None,
+                       return_variance: bool = False) -> np.ndarray:
         """
         Simulate asset price paths under Heston dynamics.
-        Returns array of shape (steps+1, paths).
+        Returns array of shape (steps+1, paths), or (S, v) with the variance
+        paths as well if `return_variance` is set.
+        """
+        n = self.paths if paths is None else paths
+        if rng is None:
+            rng = np.random.default_rng(self.seed)
+        S, v = self._simulate(T, n, rng)
+        return (S, v) if return_variance else S
+
+    def _evolve(self, T: float, n: int, rng: np.random.Generator,
+                state: Optional[tuple] = None, count: Optional[int] = None):
+        """
+        Per step: the new (S, v) slice and the two normals that drove it.
+        Runs `count` steps (default all) from `state`, an (S, v) pair of
+        slices (default the initial spot and variance).
         """
-        np.random.seed(self.seed)
         dt = T / self.steps
+        c = math.sqrt(1 - self.rho**2)
+        if state is None:
+            S = np.full(n, self.spot, dtype=self.dtype)
+            v = np.full(n, self.v0, dtype=self.dtype)
+        else:
+            S, v = state
+        for _ in range(self.steps if count is None else count):
+            # Correlated Brownian increments
+            Z1 = rng.standard_normal(n, dtype=self.dtype)
+            Z2 = rng.standard_normal(n, dtype=self.dtype)
+            W2 = self.rho * Z1 + c * Z2
 
-        S = np.zeros((self.steps + 1, self.paths))
-        v = np.zeros((self.steps + 1, self.paths))
+            v_prev = np.maximum(v, 0)  # ensure non-negativity
+            sq = np.sqrt(v_prev * dt)
+            v = np.maximum(v_prev + self.kappa * (self.theta - v_prev) * dt + self.sigma_v * sq * W2, 0)
+            S = S * np.exp((self.rate - 0.5 * v_prev) * dt + sq * Z1)
+            yield S, v, Z1, Z2
+
+    def _simulate(self, T: float, n: int, rng: np.random.Generator):
+        """Price and variance paths, each (steps+1, n)."""
+        S = np.zeros((self.steps + 1, n), dtype=self.dtype)
+        v = np.zeros((self.steps + 1, n), dtype=self.dtype)
         S[0] = self.spot
         v[0] = self.v0
+        for t, (S_t, v_t, _, _) in enumerate(self._evolve(T, n, rng), start=1):
+            S[t], v[t] = S_t, v_t
+        return S, v
 
-        # Correlated Brownian increments
-        Z1 = np.random.normal(size=(self.steps, self.paths))
-        Z2 = np.random.normal(size=(self.steps, self.paths))
-        W1 = Z1
-        W2 = self.rho * Z1 + np.sqrt(1 - self.rho**2) * Z2
-
-        for t in range(1, self.steps + 1):
-            v_prev = np.maximum(v[t-1], 0)  # ensure non-negativity
-            v[t] = np.maximum(
-                v_prev + self.kappa * (self.theta - v_prev) * dt + self.sigma_v * np.sqrt(v_prev * dt) * W2[t-1],
-                0
-            )
-            S[t] = S[t-1] * np.exp((self.rate - 0.5 * v_prev) * dt + np.sqrt(v_prev * dt) * W1[t-1])
-
+    def sample_terminal(self, T: float, paths: Optional[int] = None,
+                        rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        """
+        S_T only, shape (paths,). Same random stream and values as
+        `simulate_paths(T)[-1]`, without storing the grid.
+        """
+        n = self.paths if paths is None else paths
+        if rng is None:
+            rng = np.random.default_rng(self.seed)
+        S = np.full(n, self.spot, dtype=self.dtype)
+        for S, _, _, _ in self._evolve(T, n, rng):
+            pass
         return S
 
+    def load_paths(self, T: float, kind: str = "paths") -> np.ndarray:
+        """Full paths (or the terminal row, kind="terminal"), via `path_store` if set."""
+        if self.path_store is not None:
+            return self.path_store.get(self, T, kind)
+        return self.sample_terminal(T) if kind == "terminal" else self.simulate_paths(T)
+
     def price(self, option: Option) -> float:
         """
-        Monte Carlo pricing of a European-style option.
+        Monte Carlo pricing. Terminal payoffs are priced on S_T from the
+        trimmed-state simulation; `AmericanOption` by Longstaff–Schwartz
+        regression (see `optionkit.models.lsm`); `BarrierOption` on full
+        paths with a Brownian-bridge crossing correction using each step's
+        variance; other path-dependent payoffs path by path.
+        """
+        check_single_asset(option, self)
+        if is_terminal_payoff(option):
+            S_T = self.load_paths(option.maturity, kind="terminal")
+            payoffs = option.payoff_array(S_T)
+            return np.exp(-self.rate * option.maturity) * np.mean(payoffs, dtype=np.float64)
+        if _is_american(option):
+            return price_american(self, option)
+        if isinstance(option, BarrierOption):
+            S, v = self.simulate_paths(option.maturity, return_variance=True)
+        else:
+            S, v = self.load_paths(option.maturity), None
+        payoffs = self._path_payoffs(option, S, v)
+        return math.exp(-self.rate * option.maturity) * float(np.mean(payoffs, dtype=np.float64))
+
+    def _path_payoffs(self, option: Option, S: np.ndarray, v: Optional[np.ndarray]) -> np.ndarray:
+        if isinstance(option, BarrierOption):
+            var_dt = np.maximum(v[:-1], 0) * (option.maturity / self.steps)
+            return option.path_values(S, var_dt)
+        return np.array([option.payoff(S[:, j]) for j in range(S.shape[1])])
+
+    def _discounted_payoffs(self, option: Option, n: int, rng: np.random.Generator) -> np.ndarray:
+        check_single_asset(option, self)
+        T = option.maturity
+        if is_terminal_payoff(option):
+            payoffs = option.payoff_array(self.sample_terminal(T, paths=n, rng=rng))
+        else:
+            S, v = self.simulate_paths(T, paths=n, rng=rng, return_variance=True)
+            payoffs = self._path_payoffs(option, S, v)
+        return math.exp(-self.rate * T) * np.asarray(payoffs, dtype=np.float64)
+
+    def price_to_precision(self, option: Option, abs_tol: Optional[float] = None,
+                           rel_tol: Optional[float] = None, max_paths: int = 1_000_000,
+                           batch: int = 10_000, confidence: float = 0.95) -> MCEstimate:
+        """
+        Price with batches of `batch` paths until the standard error meets
+        the target (see `optionkit.models.sequential`). `AmericanOption` is
+        not supported: in-sample LSM cash flows are not independent per path.
         """
-        S_paths = self.simulate_paths(option.maturity)
-        S_T = S_paths[-1, :]
-        payoffs = [option.payoff(s) for s in S_T]
-        return np.exp(-self.rate * option.maturity) * np.mean(payoffs)
+        if _is_american(option):
+            raise ValueError("Sequential pricing needs independent per-path payoffs; "
+                             "price AmericanOption with price().")
+        return sequential_estimate(
+            lambda n, rng: self._discounted_payoffs(option, n, rng), self.seed,
+            abs_tol, rel_tol, max_paths, batch, confidence,
+        )
+
+    def sensitivities(self, option: Option) -> AdjointGreeks:
+        """Adjoint pathwise price and sensitivities of a terminal payoff."""
+        return heston_adjoint(self, option)
+
+    def delta(self, option: Option) -> float:
+        if isinstance(option, ADJOINT_PAYOFFS):
+            return self.sensitivities(option).delta
+        return super().delta(option)
+
+    def gamma(self, option: Option) -> float:
+        if isinstance(option, ADJOINT_PAYOFFS):
+            return self.sensitivities(option).gamma
+        return super().gamma(option)
+
+    def rho(self, option: Option) -> float:
+        if isinstance(option, ADJOINT_PAYOFFS):
+            return self.sensitivities(option).rho
+        return super().rho(option)
@@ -0,0 +1,128 @@
+# optionkit/models/lsm.py
+"""
+Longstaff–Schwartz least-squares Monte Carlo for early exercise.
+
+Works on any path matrix of shape (steps+1, paths) as produced by
+`HestonModel.simulate_paths` / `MertonModel.simulate_paths`; every simulation
+time step after t=0 is an exercise date. Continuation values are regressed on
+a polynomial or weighted-Laguerre basis in moneyness S/K, using in-the-money
+paths only.
+"""
+from __future__ import annotations
+
+import math
+from typing import List, Optional
+
+import numpy as np
+
+
+def polynomial_basis(x: np.ndarray, degree: int) -> np.ndarray:
+    """Columns 1, x, ..., x**degree."""
+    return np.vander(x, degree + 1, increasing=True)
+
+
+def laguerre_basis(x: np.ndarray, degree: int) -> np.ndarray:
+    """Weighted Laguerre functions exp(-x/2) L_n(x), n = 0..degree."""
+    out = np.empty((x.size, degree + 1))
+    w = np.exp(-0.5 * x)
+    L_prev, L = np.ones_like(x), 1.0 - x
+    out[:, 0] = w
+    if degree >= 1:
+        out[:, 1] = w * L
+    for n in range(1, degree):
+        L_prev, L = L, ((2 * n + 1 - x) * L - n * L_prev) / (n + 1)
+        out[:, n + 1] = w * L
+    return out
+
+
+BASES = {"polynomial": polynomial_basis, "laguerre": laguerre_basis}
+
+
+def lsm_fit(paths: np.ndarray, option, rate: float, basis: str = "laguerre",
+            degree: int = 3):
+    """
+    Backward regression pass. Returns (price estimate, coefficients), where
+    coefficients[t] is None for dates without enough in-the-money paths.
+    """
+    steps = paths.shape[0] - 1
+    disc = math.exp(-rate * option.maturity / steps)
+    phi = BASES[basis]
+
+    value = option.payoff_array(paths[-1])
+    coefs: List[Optional[np.ndarray]] = [None] * (steps + 1)
+    for t in range(steps - 1, 0, -1):
+        value = value * disc
+        exercise = option.payoff_array(paths[t])
+        itm = exercise > 0
+        if itm.sum() <= degree + 1:
+            continue
+        X = phi(paths[t, itm] / option.strike, degree)
+        beta, *_ = np.linalg.lstsq(X, value[itm], rcond=None)
+        coefs[t] = beta
+        stop = exercise[itm] > X @ beta
+        idx = np.flatnonzero(itm)[stop]
+        value[idx] = exercise[idx]
+
+    price = max(disc * float(np.mean(value, dtype=np.float64)), float(option.payoff_array(paths[0, :1])[0]))
+    return price, coefs
+
+
+def lsm_apply(paths: np.ndarray, option, rate: float, coefs, basis: str = "laguerre",
+              degree: int = 3) -> np.ndarray:
+    """
+    Forward pass with a fitted exercise rule: discounted cashflow per path.
+    Used on fresh paths, so the estimate is free of in-sample bias.
+    """
+    steps = paths.shape[0] - 1
+    dt = option.maturity / steps
+    phi = BASES[basis]
+
+    cash = np.zeros(paths.shape[1])
+    alive = np.ones(paths.shape[1], dtype=bool)
+    for t in range(1, steps):
+        if coefs[t] is None:
+            continue
+        exercise = option.payoff_array(paths[t])
+        cand = alive & (exercise > 0)
+        if not cand.any():
+            continue
+        cont = phi(paths[t, cand] / option.strike, degree) @ coefs[t]
+        idx = np.flatnonzero(cand)[exercise[cand] > cont]
+        cash[idx] = exercise[idx] * math.exp(-rate * t * dt)
+        alive[idx] = False
+
+    cash[alive] = option.payoff_array(paths[-1, alive]) * math.exp(-rate * option.maturity)
+    return cash
+
+
+def price_american(model, option) -> float:
+    """
+    LSM price of an early-exercise option under a path-simulating model.
+
+    `model` must provide `simulate_paths(T, paths=, rng=)`, `load_paths(T)`,
+    `rate`, `paths`, `seed`, `lsm_basis`, `lsm_degree` and `lsm_chunk`. With
+    `lsm_chunk=None` the rule is fitted and priced in-sample on `model.paths`
+    paths (served from the model's path store, if any). Otherwise
+    a two-pass estimate is used: the rule is fitted on one chunk of
+    `lsm_chunk` paths, then applied to `model.paths` fresh paths simulated
+    chunk by chunk, so at most one chunk of paths is held in memory.
+    """
+    T = option.maturity
+    basis, degree, chunk = model.lsm_basis, model.lsm_degree, model.lsm_chunk
+    if chunk is None:
+        paths = model.load_paths(T)
+        return lsm_fit(paths, option, model.rate, basis, degree)[0]
+
+    n_chunks = -(-model.paths // chunk)
+    streams = np.random.SeedSequence(model.seed).spawn(n_chunks + 1)
+    fit_paths = model.simulate_paths(T, paths=chunk, rng=np.random.default_rng(streams[0]))
+    _, coefs = lsm_fit(fit_paths, option, model.rate, basis, degree)
+    del fit_paths
+
+    total, done = 0.0, 0
+    for k in range(n_chunks):
+        n = min(chunk, model.paths - done)
+        paths = model.simulate_paths(T, paths=n, rng=np.random.default_rng(streams[k + 1]))
+        total += float(lsm_apply(paths, option, model.rate, coefs, basis, degree).sum())
+        done += n
+    return max(total / done, float(option.payoff(model.spot)))
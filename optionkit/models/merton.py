@@ -1,7 +1,18 @@
+import math
+from typing import Optional
+
 import numpy as np
+from optionkit.core.math_utils import mc_dtype
 from optionkit.core.model import Model
 from optionkit.core.option import Option
 from optionkit.core.factory import register_model
+from optionkit.core.protocols import check_single_asset, is_terminal_payoff
+from optionkit.core.tree_model import _is_american
+from optionkit.models.lsm import price_american
+from optionkit.models.sequential import MCEstimate, sequential_estimate
+from optionkit.models.adjoint import ADJOINT_PAYOFFS, AdjointGreeks, merton_adjoint
+from optionkit.payoffs.barrier import BarrierOption
+from optionkit.simulation.path_store import PathStore
 
 @register_model("Merton")
 class MertonModel(Model):
@@ -10,9 +21,16 @@ class MertonModel(Model):
     Priced via Monte Carlo simulation.
     """
 
+    # Attributes that determine the simulated paths (path-store key)
+    SIMULATION_PARAMS = ("spot", "rate", "vol", "lam", "mu_j", "sigma_j",
+                         "steps", "paths", "seed", "dtype")
+
     def __init__(self, spot: float, rate: float, vol: float,
                  lam: float, mu_j: float, sigma_j: float,
-                 steps: int = 200, paths: int = 100_000, seed: int = 42):
+                 steps: int = 200, paths: int = 100_000, seed: int = 42,
+                 lsm_basis: str = "laguerre", lsm_degree: int = 3,
+                 lsm_chunk: Optional[int] = None, path_store: Optional[PathStore] = None,
+                 dtype: str = "float64"):
         """
         lam    : jump intensity (expected # jumps per year)
         mu_j   : mean jump size (lognormal mean)
@@ -27,29 +45,133 @@ class MertonModel(Model):
         self.steps = steps
         self.paths = paths
         self.seed = seed
+        self.lsm_basis = lsm_basis    # early exercise: regression basis
+        self.lsm_degree = lsm_degree
+        self.lsm_chunk = lsm_chunk    # None: in-sample LSM; int: two-pass, chunked
+        self.path_store = path_store
+        self.dtype = mc_dtype(dtype)
 
-    def simulate_paths(self, T: float) -> np.ndarray:
-        np.random.seed(self.seed)
-        dt = T / self.steps
-
-        S = np.zeros((self.steps + 1, self.paths))
+    def simulate_paths(self, T: float, paths: Optional[int] = None,
+                       rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        n = self.paths if paths is None else paths
+        if rng is None:
+            rng = np.random.default_rng(self.seed)
+        S = np.zeros((self.steps + 1, n), dtype=self.dtype)
         S[0] = self.spot
+        for t, (_, _, _, growth) in enumerate(self._increments(T, n, rng), start=1):
+            S[t] = S[t-1] * growth
 
-        for t in range(1, self.steps + 1):
-            Z = np.random.normal(size=self.paths)
-            N_jumps = np.random.poisson(self.lam * dt, size=self.paths)
+        return S
 
-            jump_sizes = np.exp(self.mu_j * N_jumps + self.sigma_j * np.sqrt(N_jumps) * np.random.normal(size=self.paths))
+    def _compensated_drift(self) -> float:
+        return self.rate - 0.5 * self.vol**2 - self.lam * (math.exp(self.mu_j + 0.5 * self.sigma_j**2) - 1)
 
-            drift = (self.rate - 0.5 * self.vol**2 - self.lam * (np.exp(self.mu_j + 0.5*self.sigma_j**2) - 1)) * dt
-            diffusion = self.vol * np.sqrt(dt) * Z
+    def _terminal_draws(self, T: float, n: int, rng: np.random.Generator):
+        """Exact terminal sample: diffusion normals, total jump counts, jump normals and S_T."""
+        Z = rng.standard_normal(n, dtype=self.dtype)
+        N_jumps = rng.poisson(self.lam * T, size=n).astype(self.dtype)
+        Z_j = rng.standard_normal(n, dtype=self.dtype)
+        log_growth = (self._compensated_drift() * T + self.vol * math.sqrt(T) * Z
+                      + self.mu_j * N_jumps + self.sigma_j * np.sqrt(N_jumps) * Z_j)
+        return Z, N_jumps, Z_j, self.spot * np.exp(log_growth)
 
-            S[t] = S[t-1] * np.exp(drift + diffusion) * jump_sizes
+    def sample_terminal(self, T: float, paths: Optional[int] = None,
+                        rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        """Exact sample of S_T, shape (paths,)."""
+        n = self.paths if paths is None else paths
+        if rng is None:
+            rng = np.random.default_rng(self.seed)
+        return self._terminal_draws(T, n, rng)[3]
 
-        return S
+    def _increments(self, T: float, n: int, rng: np.random.Generator):
+        """Per step: diffusion normals, jump counts, jump normals and the growth factor S[t]/S[t-1]."""
+        dt = T / self.steps
+        for _ in range(self.steps):
+            Z = rng.standard_normal(n, dtype=self.dtype)
+            N_jumps = rng.poisson(self.lam * dt, size=n).astype(self.dtype)
+            Z_j = rng.standard_normal(n, dtype=self.dtype)
+
+            jump_sizes = np.exp(self.mu_j * N_jumps + self.sigma_j * np.sqrt(N_jumps) * Z_j)
+
+            drift = self._compensated_drift() * dt
+            diffusion = self.vol * math.sqrt(dt) * Z
+
+            yield Z, N_jumps, Z_j, np.exp(drift + diffusion) * jump_sizes
+
+    def load_paths(self, T: float, kind: str = "paths") -> np.ndarray:
+        """Full paths (or an exact terminal sample, kind="terminal"), via `path_store` if set."""
+        if self.path_store is not None:
+            return self.path_store.get(self, T, kind)
+        return self.sample_terminal(T) if kind == "terminal" else self.simulate_paths(T)
 
     def price(self, option: Option) -> float:
-        S_paths = self.simulate_paths(option.maturity)
-        S_T = S_paths[-1, :]
-        payoffs = [option.payoff(s) for s in S_T]
-        return np.exp(-self.rate * option.maturity) * np.mean(payoffs)
+        """
+        Terminal payoffs from the exact S_T sample; `AmericanOption` via
+        Longstaff–Schwartz; `BarrierOption` on full paths with a
+        Brownian-bridge crossing correction for the diffusive part (jumps
+        across the barrier show up at the grid points); other path-dependent
+        payoffs path by path on the full grid.
+        """
+        check_single_asset(option, self)
+        if is_terminal_payoff(option):
+            S_T = self.load_paths(option.maturity, kind="terminal")
+            payoffs = option.payoff_array(S_T)
+            return np.exp(-self.rate * option.maturity) * np.mean(payoffs, dtype=np.float64)
+        if _is_american(option):
+            return price_american(self, option)
+        payoffs = self._path_payoffs(option, self.load_paths(option.maturity))
+        return math.exp(-self.rate * option.maturity) * float(np.mean(payoffs, dtype=np.float64))
+
+    def _path_payoffs(self, option: Option, S: np.ndarray) -> np.ndarray:
+        if isinstance(option, BarrierOption):
+            return option.path_values(S, self.vol**2 * option.maturity / self.steps)
+        return np.array([option.payoff(S[:, j]) for j in range(S.shape[1])])
+
+    def _discounted_payoffs(self, option: Option, n: int, rng: np.random.Generator) -> np.ndarray:
+        check_single_asset(option, self)
+        T = option.maturity
+        if is_terminal_payoff(option):
+            payoffs = option.payoff_array(self.sample_terminal(T, paths=n, rng=rng))
+        else:
+            payoffs = self._path_payoffs(option, self.simulate_paths(T, paths=n, rng=rng))
+        return math.exp(-self.rate * T) * np.asarray(payoffs, dtype=np.float64)
+
+    def price_to_precision(self, option: Option, abs_tol: Optional[float] = None,
+                           rel_tol: Optional[float] = None, max_paths: int = 1_000_000,
+                           batch: int = 10_000, confidence: float = 0.95) -> MCEstimate:
+        """
+        Price with batches of `batch` paths until the standard error meets
+        the target (see `optionkit.models.sequential`). `AmericanOption` is
+        not supported: in-sample LSM cash flows are not independent per path.
+        """
+        if _is_american(option):
+            raise ValueError("Sequential pricing needs independent per-path payoffs; "
+                             "price AmericanOption with price().")
+        return sequential_estimate(
+            lambda n, rng: self._discounted_payoffs(option, n, rng), self.seed,
+            abs_tol, rel_tol, max_paths, batch, confidence,
+        )
+
+    def sensitivities(self, option: Option) -> AdjointGreeks:
+        """Adjoint pathwise price and sensitivities of a terminal payoff."""
+        return merton_adjoint(self, option)
+
+    def delta(self, option: Option) -> float:
+        if isinstance(option, ADJOINT_PAYOFFS):
+            return self.sensitivities(option).delta
+        return super().delta(option)
+
+    def gamma(self, option: Option) -> float:
+        if isinstance(option, ADJOINT_PAYOFFS):
+            return self.sensitivities(option).gamma
+        return super().gamma(option)
+
+    def rho(self, option: Option) -> float:
+        if isinstance(option, ADJOINT_PAYOFFS):
+            return self.sensitivities(option).rho
+        return super().rho(option)
+
+    def vega(self, option: Option) -> float:
+        if isinstance(option, ADJOINT_PAYOFFS):
+            return self.sensitivities(option).params["vol"]
+        return super().vega(option)
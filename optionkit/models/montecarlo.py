@@ -1,61 +1,142 @@
+import math
+
+from typing import Optional
+
 import numpy as np
+from optionkit.core.math_utils import mc_dtype
 from optionkit.core.model import Model
 from optionkit.core.option import Option
 from optionkit.core.factory import register_model
+from optionkit.core.protocols import check_single_asset
+from optionkit.payoffs.digital import DigitalOption
+from optionkit.payoffs.barrier import BarrierOption
+from optionkit.models.sequential import MCEstimate, sequential_estimate
 
 @register_model("MonteCarlo")
 class MonteCarloModel(Model):
     """
     Monte Carlo pricing under GBM dynamics.
-    Includes pathwise Greeks estimators.
+    Includes pathwise Greeks estimators (likelihood-ratio for `DigitalOption`);
+    `BarrierOption` uses the exact Brownian-bridge crossing probability.
     """
 
-    def __init__(self, spot: float, rate: float, vol: float, paths: int = 100_000, seed: int = 42):
+    def __init__(self, spot: float, rate: float, vol: float, paths: int = 100_000, seed: int = 42,
+                 dtype: str = "float64"):
         self.spot = spot
         self.rate = rate
         self.vol = vol
         self.paths = paths
         self.seed = seed
+        self.dtype = mc_dtype(dtype)
 
-    def simulate_terminal(self, T: float) -> np.ndarray:
-        np.random.seed(self.seed)
-        Z = np.random.normal(size=self.paths)
-        S0, r, sigma = self.spot, self.rate, self.vol
-        ST = S0 * np.exp((r - 0.5 * sigma**2) * T + sigma * np.sqrt(T) * Z)
+    def simulate_terminal(self, T: float, paths: Optional[int] = None,
+                          rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        n = self.paths if paths is None else paths
+        if rng is None:
+            rng = np.random.default_rng(self.seed)
+        Z = rng.standard_normal(n, dtype=self.dtype)
+        S0, r, sigma = float(self.spot), float(self.rate), float(self.vol)
+        ST = S0 * np.exp((r - 0.5 * sigma**2) * T + sigma * math.sqrt(T) * Z)
         return ST, Z
 
+    def _payoffs(self, option: Option, ST: np.ndarray) -> np.ndarray:
+        check_single_asset(option, self)
+        if isinstance(option, BarrierOption):
+            paths = np.stack([np.full_like(ST, self.spot), ST])
+            return option.path_values(paths, var_dt=self.vol**2 * option.maturity)
+        return option.payoff_array(ST)
+
     def price(self, option: Option) -> float:
         ST, _ = self.simulate_terminal(option.maturity)
-        payoffs = np.maximum(ST - option.strike, 0) if option.is_call else np.maximum(option.strike - ST, 0)
-        return np.exp(-self.rate * option.maturity) * np.mean(payoffs)
+        payoffs = self._payoffs(option, ST)
+        return np.exp(-self.rate * option.maturity) * np.mean(payoffs, dtype=np.float64)
+
+    def _discounted_payoffs(self, option: Option, n: int, rng: np.random.Generator) -> np.ndarray:
+        ST, _ = self.simulate_terminal(option.maturity, paths=n, rng=rng)
+        return math.exp(-self.rate * option.maturity) * self._payoffs(option, ST).astype(np.float64)
+
+    def price_to_precision(self, option: Option, abs_tol: Optional[float] = None,
+                           rel_tol: Optional[float] = None, max_paths: int = 1_000_000,
+                           batch: int = 10_000, confidence: float = 0.95) -> MCEstimate:
+        """Price with batches of `batch` paths until the standard error meets the target."""
+        return sequential_estimate(
+            lambda n, rng: self._discounted_payoffs(option, n, rng), self.seed,
+            abs_tol, rel_tol, max_paths, batch, confidence,
+        )
+
+    # ====================
+    # Likelihood-ratio Greeks
+    # ====================
+    def _lr_greek(self, option: Option, greek: str) -> float:
+        """
+        E[payoff * score] for the lognormal density of S_T, where the score
+        is the derivative of the log-density with respect to the parameter.
+        Valid for any terminal payoff, discontinuous ones included.
+        """
+        T = option.maturity
+        ST, Z = self.simulate_terminal(T)
+        Z = Z.astype(np.float64)
+        payoff = option.payoff_array(ST)
+        sqrt_T = math.sqrt(T)
+        sig_sqrt_T = self.vol * sqrt_T
+        disc = math.exp(-self.rate * T)
+        if greek == "delta":
+            weight = Z / (self.spot * sig_sqrt_T)
+        elif greek == "gamma":
+            weight = (Z * Z - 1 - sig_sqrt_T * Z) / (self.spot * sig_sqrt_T) ** 2
+        elif greek == "vega":
+            weight = (Z * Z - 1) / self.vol - Z * sqrt_T
+        elif greek == "rho":
+            weight = Z * sqrt_T / self.vol - T
+        elif greek == "theta":
+            # -dV/dT: discounting plus the score of the maturity
+            weight = self.rate - ((Z * Z - 1) / (2 * T)
+                                  + Z * (self.rate - 0.5 * self.vol**2) / sig_sqrt_T)
+        else:
+            raise ValueError(f"Unknown Greek: {greek}")
+        return disc * float(np.mean(payoff * weight, dtype=np.float64))
 
     # ====================
     # Pathwise Greeks
     # ====================
     def delta(self, option: Option, **kwargs) -> float:
+        if isinstance(option, DigitalOption):
+            return self._lr_greek(option, "delta")
         ST, Z = self.simulate_terminal(option.maturity)
-        payoff_indicator = (ST > option.strike).astype(float) if option.is_call else -(ST < option.strike).astype(float)
-        delta_est = np.exp(-self.rate * option.maturity) * np.mean(payoff_indicator * ST / self.spot)
+        payoff_indicator = (ST > option.strike).astype(ST.dtype) if option.is_call else -(ST < option.strike).astype(ST.dtype)
+        delta_est = np.exp(-self.rate * option.maturity) * np.mean(payoff_indicator * ST / self.spot, dtype=np.float64)
         return delta_est
 
+    def gamma(self, option: Option, **kwargs) -> float:
+        if isinstance(option, DigitalOption):
+            return self._lr_greek(option, "gamma")
+        return super().gamma(option)
+
     def vega(self, option: Option, **kwargs) -> float:
+        if isinstance(option, DigitalOption):
+            return self._lr_greek(option, "vega")
         ST, Z = self.simulate_terminal(option.maturity)
-        payoff_indicator = (ST > option.strike).astype(float) if option.is_call else -(ST < option.strike).astype(float)
+        payoff_indicator = (ST > option.strike).astype(ST.dtype) if option.is_call else -(ST < option.strike).astype(ST.dtype)
         vega_est = np.exp(-self.rate * option.maturity) * np.mean(
-            payoff_indicator * ST * (Z * np.sqrt(option.maturity) - self.vol * option.maturity) / self.vol
+            payoff_indicator * ST * (Z * math.sqrt(option.maturity) - self.vol * option.maturity) / self.vol,
+            dtype=np.float64,
         )
         return vega_est
 
     def rho(self, option: Option, **kwargs) -> float:
+        if isinstance(option, DigitalOption):
+            return self._lr_greek(option, "rho")
         ST, Z = self.simulate_terminal(option.maturity)
         payoff = np.maximum(ST - option.strike, 0) if option.is_call else np.maximum(option.strike - ST, 0)
-        rho_est = option.maturity * np.exp(-self.rate * option.maturity) * np.mean(payoff)
+        rho_est = option.maturity * np.exp(-self.rate * option.maturity) * np.mean(payoff, dtype=np.float64)
         return rho_est
 
     def theta(self, option: Option, **kwargs) -> float:
+        if isinstance(option, DigitalOption):
+            return self._lr_greek(option, "theta")
         ST, Z = self.simulate_terminal(option.maturity)
         payoff = np.maximum(ST - option.strike, 0) if option.is_call else np.maximum(option.strike - ST, 0)
-        discounted = np.exp(-self.rate * option.maturity) * np.mean(payoff)
+        discounted = np.exp(-self.rate * option.maturity) * np.mean(payoff, dtype=np.float64)
         theta_est = (discounted - self.price(option)) / 1e-4  # crude FD around maturity
         return theta_est
 
@@ -0,0 +1,96 @@
+# optionkit/models/sequential.py
+"""
+Sequential Monte Carlo: simulate in batches until the standard error of the
+price reaches a target, instead of a fixed path count.
+
+Engines provide a sampler ``sample(n, rng) -> discounted payoffs`` for one
+batch of independent paths; `sequential_estimate` draws batches from a single
+generator seeded with the model's seed, merges each batch into running
+mean/variance statistics (Welford's update, batch form due to Chan et al.)
+and stops as soon as
+
+    stderr <= max(abs_tol, rel_tol * |price|)
+
+or the path budget is spent. A payoff that has been identically zero so far
+(e.g. a deep out-of-the-money option with no hits yet) never satisfies the
+target: its zero standard error carries no information.
+"""
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import numpy as np
+from scipy.stats import norm
+
+Sampler = Callable[[int, np.random.Generator], np.ndarray]
+
+
+@dataclass(slots=True)
+class RunningStats:
+    """Count, mean and sum of squared deviations, updated batch by batch."""
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    def update(self, x) -> None:
+        x = np.asarray(x, dtype=np.float64).ravel()
+        n_b = x.size
+        if n_b == 0:
+            return
+        mean_b = float(x.mean())
+        m2_b = float(np.dot(x - mean_b, x - mean_b))
+        n = self.count + n_b
+        delta = mean_b - self.mean
+        self.mean += delta * n_b / n
+        self.m2 += m2_b + delta * delta * self.count * n_b / n
+        self.count = n
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.count - 1) if self.count > 1 else math.inf
+
+    @property
+    def stderr(self) -> float:
+        return math.sqrt(self.variance / self.count) if self.count > 1 else math.inf
+
+
+@dataclass(slots=True, frozen=True)
+class MCEstimate:
+    """Monte Carlo price with its sampling error."""
+    price: float
+    stderr: float
+    ci_low: float
+    ci_high: float
+    paths: int          # paths actually simulated
+    converged: bool     # False if the budget ran out before the target was met
+
+    def __float__(self) -> float:
+        return self.price
+
+
+def sequential_estimate(sample: Sampler, seed: Optional[int], abs_tol: Optional[float] = None,
+                        rel_tol: Optional[float] = None, max_paths: int = 1_000_000,
+                        batch: int = 10_000, confidence: float = 0.95) -> MCEstimate:
+    """Run `sample` batch by batch until the standard-error target is met."""
+    if abs_tol is None and rel_tol is None:
+        raise ValueError("Give a target standard error: abs_tol and/or rel_tol.")
+    if batch < 2 or max_paths < 2:
+        raise ValueError("batch and max_paths must be at least 2.")
+    if not 0 < confidence < 1:
+        raise ValueError(f"confidence must be in (0, 1), got {confidence}")
+
+    rng = np.random.default_rng(seed)
+    stats = RunningStats()
+    converged = False
+    while stats.count < max_paths:
+        stats.update(sample(min(batch, max_paths - stats.count), rng))
+        target = max(abs_tol or 0.0, (rel_tol or 0.0) * abs(stats.mean))
+        if stats.stderr <= target and not (stats.mean == 0.0 and stats.m2 == 0.0):
+            converged = True
+            break
+
+    half = float(norm.ppf(0.5 + confidence / 2)) * stats.stderr
+    return MCEstimate(price=stats.mean, stderr=stats.stderr, ci_low=stats.mean - half,
+                      ci_high=stats.mean + half, paths=stats.count, converged=converged)
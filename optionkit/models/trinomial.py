@@ -1,9 +1,27 @@
+import copy
 import math
 import warnings
+from dataclasses import dataclass
+
+import numpy as np
+from optionkit.core.model import Model
 from optionkit.core.tree_model import TreeModel
 from optionkit.core.factory import register_model
+from optionkit.core.protocols import check_single_asset
 from optionkit.models.trinomial_schemes import TrinomialSchemes
 
+@dataclass(slots=True, frozen=True)
+class TrinomialParams:
+    """Per-call lattice parameters of a trinomial tree."""
+    u: float
+    d: float
+    m: float
+    pu: float
+    pm: float
+    pd: float
+    dt: float
+    disc: float
+
 @register_model("TrinomialTree")
 class TrinomialTreeModel(TreeModel):
     """
@@ -37,24 +55,28 @@ class TrinomialTreeModel(TreeModel):
 
     adaptive : bool, optional
         If True, automatically increase steps until probabilities are valid
-        and/or prices converge. Default is False.
+        and refine N, 2N, 4N, ... until the Richardson-extrapolated price
+        converges (see `price_adaptive`). Default is False.
     tol : float, optional
-        Convergence tolerance for adaptive refinement. Default is 1e-6.
+        Tolerance on the extrapolated error estimate in adaptive mode.
+        Default is 1e-6.
     max_steps : int, optional
         Maximum number of steps to try in adaptive mode. Default is 5000.
+    smoothing : bool, optional
+        Use the BBS method (Black–Scholes values at the penultimate step).
+        Default is False.
+    richardson : bool, optional
+        Use two-point Richardson extrapolation on N and 2N steps.
+        Default is False.
 
-    Attributes
-    ----------
-    u, d, m : float
-        Up, down, and middle movement multipliers for stock prices.
-    pu, pm, pd : float
-        Risk-neutral probabilities of up, middle, and down moves.
-    dt : float
-        Size of a single time step.
+    Lattice parameters (u, d, m, pu, pm, pd, dt) are computed per call and
+    returned as an immutable `TrinomialParams`; the model itself holds only
+    its configuration, so one instance can be shared across threads.
 
     Notes
     -----
-    - The model supports only European-style options via backward induction.
+    - European and American (early exercise) options are priced via
+      backward induction.
     - For large `steps`, the tree price converges to the Black–Scholes price.
     - Default scheme is `"kr"` since it balances robustness and accuracy.
     """
@@ -62,8 +84,9 @@ class TrinomialTreeModel(TreeModel):
     def __init__(self, spot: float, rate: float, vol: float,
                  steps: int = 100, method: str = "kr",
                  adaptive: bool = False, tol: float = 1e-6,
-                 max_steps: int = 5000):
-        super().__init__(steps)
+                 max_steps: int = 5000, smoothing: bool = False,
+                 richardson: bool = False):
+        super().__init__(steps, smoothing, richardson)
         self.spot = spot
         self.rate = rate
         self.vol = vol
@@ -93,61 +116,65 @@ class TrinomialTreeModel(TreeModel):
 
     # ------------------------------------------------------------------
 
-    def _build_tree(self, option):
-        dt = option.maturity / self.steps
-        valid, params = self._validate_params(dt)
-
-        if not valid:
-            if self.adaptive:
-                # Increase steps until probabilities are valid
-                while not valid and self.steps < self.max_steps:
-                    self.steps *= 2
-                    dt = option.maturity / self.steps
-                    valid, params = self._validate_params(dt)
-
-                if not valid:
-                    warnings.warn(
-                        f"Scheme '{self.method}' failed to produce valid probabilities "
-                        f"even with {self.steps} steps. Falling back to 'kr'."
-                    )
-                    params = TrinomialSchemes.kamrad_ritchken(self.spot, self.rate, self.vol, dt)
-            else:
-                raise ValueError(
-                    f"Scheme '{self.method}' produced invalid probabilities at "
-                    f"N={self.steps}, dt={dt:.4e}. Try more steps or method='kr'."
-                )
+    def _resolve_scheme(self, maturity, steps):
+        """
+        Return (steps, method) giving valid probabilities.
+
+        In adaptive mode the step count is doubled until the scheme yields
+        valid probabilities; if it never does within `max_steps`, the
+        Kamrad–Ritchken scheme is used at the requested step count instead.
+        """
+        dt = maturity / steps
+        if self._validate_params(dt)[0]:
+            return steps, self.method
+
+        if not self.adaptive:
+            raise ValueError(
+                f"Scheme '{self.method}' produced invalid probabilities at "
+                f"N={steps}, dt={dt:.4e}. Try more steps or method='kr'."
+            )
+
+        # Increase steps until probabilities are valid
+        n = steps
+        while n < self.max_steps:
+            n *= 2
+            if self._validate_params(maturity / n)[0]:
+                return n, self.method
+
+        warnings.warn(
+            f"Scheme '{self.method}' failed to produce valid probabilities "
+            f"up to max_steps={self.max_steps}. Falling back to 'kr'."
+        )
+        return steps, "kr"
+
+    def _resolve_params(self, maturity, steps):
+        """Return (steps, params) with valid probabilities (see `_resolve_scheme`)."""
+        steps, method = self._resolve_scheme(maturity, steps)
+        if method != self.method:
+            return steps, TrinomialSchemes.kamrad_ritchken(self.spot, self.rate, self.vol,
+                                                           maturity / steps)
+        return steps, self._validate_params(maturity / steps)[1]
+
+    # ------------------------------------------------------------------
 
+    def _lattice_params(self, maturity, steps):
+        steps, params = self._resolve_params(maturity, steps)
+        dt = maturity / steps
         u, d, m, pu, pm, pd = params
-        self.u, self.d, self.m = u, d, m
-        self.pu, self.pm, self.pd = pu, pm, pd
-        self.dt = dt
-
-        # Build recombining tree with 2t+1 nodes at each level
-        tree = [[self.spot]]
-        for t in range(1, self.steps + 1):
-            level = []
-            for j in range(2 * t + 1):
-                k = j - t
-                price = (
-                    self.spot
-                    * (u ** max(0, k))
-                    * (d ** max(0, -k))
-                    * (m ** (t - abs(k)))
-                )
-                level.append(price)
-            tree.append(level)
-
-        return tree
+        return steps, TrinomialParams(u, d, m, pu, pm, pd, dt, math.exp(-self.rate * dt))
+
+    def _level(self, t, params):
+        # Recombining tree with 2t+1 nodes at each level
+        k = np.arange(-t, t + 1)
+        return (self.spot * params.u ** np.maximum(k, 0) * params.d ** np.maximum(-k, 0)
+                * params.m ** (t - np.abs(k)))
 
     # ------------------------------------------------------------------
 
-    def _step(self, i, t, payoffs, option):
+    def _step(self, values, params):
         """Backward induction step: parent depends on 3 children."""
-        disc = math.exp(-self.rate * self.dt)
-        down = payoffs[i]
-        mid = payoffs[i + 1]
-        up = payoffs[i + 2]
-        return disc * (self.pu * up + self.pm * mid + self.pd * down)
+        return params.disc * (params.pu * values[2:] + params.pm * values[1:-1]
+                              + params.pd * values[:-2])
 
     # ------------------------------------------------------------------
 
@@ -155,20 +182,54 @@ class TrinomialTreeModel(TreeModel):
         """Compute option price, with adaptive refinement if enabled."""
         if not self.adaptive:
             return super().price(option)
+        return self.price_adaptive(option).price
 
-        # Adaptive refinement loop
-        prev_price = None
-        while True:
-            price = super().price(option)
-            if prev_price is not None and abs(price - prev_price) < self.tol:
-                return price
-            prev_price = price
-            if self.steps >= self.max_steps:
-                warnings.warn(
-                    f"Adaptive refinement reached max_steps={self.max_steps} "
-                    f"without convergence. Returning last price."
-                )
-                return price
-            self.steps *= 2
-
-
+    def price_many(self, options):
+        if not self.adaptive:
+            return super().price_many(options)
+        return Model.price_many(self, options)   # refinement is per option
+
+    def price_adaptive(self, option) -> "AdaptiveResult":
+        """
+        Adaptive refinement on N, 2N, 4N, ... steps.
+
+        Successive prices are combined by Richardson extrapolation,
+        R_k = 2 P(2^k N) - P(2^(k-1) N), and the error of R_k is estimated
+        by |R_k - R_(k-1)|. Refinement stops as soon as that estimate drops
+        below `tol` or the next level would exceed `max_steps`. The model
+        itself is never modified. The scheme is resolved once, so a fallback
+        to Kamrad–Ritchken warns once rather than at every level.
+        """
+        check_single_asset(option, self)
+        steps, method = self._resolve_scheme(option.maturity, self.steps)
+        tree = self
+        if method != self.method:
+            tree = copy.copy(self)
+            tree.method = method
+        prev_price = tree._induce(option, steps)
+        prev_extrap = None
+        extrap, error = prev_price, math.inf
+
+        while 2 * steps <= self.max_steps:
+            steps *= 2
+            price = tree._induce(option, steps)
+            extrap = 2 * price - prev_price
+            error = abs(extrap - prev_extrap) if prev_extrap is not None else abs(price - prev_price)
+            if prev_extrap is not None and error < self.tol:
+                return AdaptiveResult(extrap, steps, error, True)
+            prev_price, prev_extrap = price, extrap
+
+        warnings.warn(
+            f"Adaptive refinement reached max_steps={self.max_steps} "
+            f"without convergence (error estimate {error:.2e}). Returning last price."
+        )
+        return AdaptiveResult(extrap, steps, error, False)
+
+
+@dataclass(slots=True, frozen=True)
+class AdaptiveResult:
+    """Outcome of `TrinomialTreeModel.price_adaptive`."""
+    price: float
+    steps: int          # finest step count used
+    error: float        # extrapolated error estimate
+    converged: bool
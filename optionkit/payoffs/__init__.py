@@ -4,5 +4,8 @@ from .european import EuropeanOption
 from .american import AmericanOption
 from .asian import AsianOption
 from .digital import DigitalOption
+from .barrier import BarrierOption
+from .basket import BasketOption, SpreadOption
 
-__all__ = ["EuropeanOption", "AmericanOption", "AsianOption", "DigitalOption"]
+__all__ = ["EuropeanOption", "AmericanOption", "AsianOption", "DigitalOption",
+           "BarrierOption", "BasketOption", "SpreadOption"]
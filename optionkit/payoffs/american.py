@@ -1,3 +1,4 @@
+import numpy as np
 from optionkit.core.option import Option
 from optionkit.core.factory import register_option
 
@@ -5,8 +6,14 @@ from optionkit.core.factory import register_option
 class AmericanOption(Option):
     """
     American option — exercise allowed any time before maturity.
-    Used with tree models (binomial/trinomial).
+    Early exercise is honoured by the tree models, the finite-difference
+    engine and the Heston/Merton Monte Carlo engines (Longstaff–Schwartz).
     """
+    early_exercise = True
 
     def payoff(self, spot: float) -> float:
         return max(spot - self.strike, 0) if self.is_call else max(self.strike - spot, 0)
+
+    def payoff_array(self, spots):
+        spots = np.asarray(spots)
+        return np.maximum(spots - self.strike, 0.0) if self.is_call else np.maximum(self.strike - spots, 0.0)
@@ -8,6 +8,7 @@ class AsianOption(Option):
     Arithmetic average Asian option.
     Payoff depends on the average price of the underlying.
     """
+    path_dependent = True
 
     def payoff(self, path: np.ndarray) -> float:
         """
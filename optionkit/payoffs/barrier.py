@@ -0,0 +1,77 @@
+# optionkit/payoffs/barrier.py
+import math
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+from optionkit.core.option import Option
+from optionkit.core.factory import register_option
+
+@register_option("BarrierOption")
+@dataclass(slots=True, repr=False, eq=True)
+class BarrierOption(Option):
+    """
+    Single-barrier knock-in/knock-out call or put.
+
+    `direction` is "up" or "down" (barrier above or below the spot), `knock`
+    is "in" or "out". The `rebate` is paid at expiry: to a knock-out if the
+    barrier was hit, to a knock-in if it was not. The barrier is monitored
+    continuously; path engines apply a Brownian-bridge crossing correction
+    between simulation steps (`path_values`).
+    """
+    barrier: Optional[float] = None
+    direction: str = "down"
+    knock: str = "out"
+    rebate: float = 0.0
+
+    path_dependent = True
+
+    def __post_init__(self):
+        if self.barrier is None or self.barrier <= 0:
+            raise ValueError("BarrierOption needs a positive barrier level.")
+        if self.direction not in ("up", "down"):
+            raise ValueError(f"direction must be 'up' or 'down', got {self.direction!r}")
+        if self.knock not in ("in", "out"):
+            raise ValueError(f"knock must be 'in' or 'out', got {self.knock!r}")
+
+    def payoff(self, path: np.ndarray) -> float:
+        """Payoff of one path, with the barrier monitored at the path points only."""
+        return float(self.path_values(np.asarray(path, dtype=float)[:, None])[0])
+
+    def payoff_array(self, spots):
+        raise ValueError(
+            "BarrierOption is path-dependent: price it on simulated paths or with BlackScholesModel."
+        )
+
+    def survival(self, paths: np.ndarray, var_dt=None) -> np.ndarray:
+        """
+        Probability that each path of a (steps+1, paths) matrix never touches
+        the barrier. Without `var_dt` only the grid points are monitored.
+        With `var_dt` (the diffusive variance of log S over each step: a
+        scalar, or a (steps, paths) array) the Brownian-bridge probability
+        exp(-2 a b / var_dt) of crossing between two grid points at log
+        distances a, b from the barrier is taken into account.
+        """
+        log_h = math.log(self.barrier)
+        sign = 1.0 if self.direction == "down" else -1.0
+        dist = sign * (np.log(paths[0]) - log_h)
+        alive = (dist > 0).astype(float)
+        for t in range(1, paths.shape[0]):
+            nxt = sign * (np.log(paths[t]) - log_h)
+            alive *= nxt > 0
+            if var_dt is not None:
+                v = var_dt[t - 1] if np.ndim(var_dt) == 2 else var_dt
+                cross = np.exp(-2.0 * np.maximum(dist, 0) * np.maximum(nxt, 0)
+                               / np.maximum(v, 1e-300))
+                alive *= 1.0 - cross
+            dist = nxt
+        return alive
+
+    def path_values(self, paths: np.ndarray, var_dt=None) -> np.ndarray:
+        """Expected (undiscounted) payoff of each path given its survival probability."""
+        ST = paths[-1]
+        vanilla = np.maximum(ST - self.strike, 0.0) if self.is_call else np.maximum(self.strike - ST, 0.0)
+        alive = self.survival(paths, var_dt)
+        if self.knock == "out":
+            return vanilla * alive + self.rebate * (1.0 - alive)
+        return vanilla * (1.0 - alive) + self.rebate * alive
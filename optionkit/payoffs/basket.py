@@ -0,0 +1,66 @@
+# optionkit/payoffs/basket.py
+from dataclasses import dataclass
+from typing import Tuple
+
+import numpy as np
+from optionkit.core.option import Option
+from optionkit.core.factory import register_option
+
+@register_option("BasketOption")
+@dataclass(slots=True, repr=False, eq=True)
+class BasketOption(Option):
+    """
+    Call or put on a weighted sum of terminal asset prices,
+    max(sum_i w_i S_i - K, 0).
+
+    Multi-asset engines evaluate `payoff_array` on an (assets, paths) block
+    of terminal prices; `payoff` takes one vector of asset prices.
+    """
+    weights: Tuple[float, ...] = ()
+    multi_asset = True
+
+    def __post_init__(self):
+        if len(self.weights) == 0:
+            raise ValueError("BasketOption needs at least one weight.")
+        self.weights = tuple(float(w) for w in self.weights)
+
+    def basket(self, spots) -> np.ndarray:
+        spots = np.asarray(spots)
+        if spots.shape[0] != len(self.weights):
+            raise ValueError(f"BasketOption has {len(self.weights)} weights, got {spots.shape[0]} assets.")
+        return np.tensordot(np.asarray(self.weights, dtype=spots.dtype), spots, axes=1)
+
+    def payoff(self, spots) -> float:
+        return float(self.payoff_array(np.asarray(spots, dtype=float)))
+
+    def payoff_array(self, spots):
+        value = self.basket(spots)
+        return np.maximum(value - self.strike, 0.0) if self.is_call else np.maximum(self.strike - value, 0.0)
+
+
+@register_option("SpreadOption")
+@dataclass(slots=True, repr=False, eq=True)
+class SpreadOption(Option):
+    """
+    Spread call max(S_long - S_short - K, 0) or put max(K - S_long + S_short, 0)
+    between two assets of a multi-asset model, selected by index in `legs`.
+    With K = 0 this is Margrabe's exchange option.
+    """
+    legs: Tuple[int, int] = (0, 1)
+    multi_asset = True
+
+    def __post_init__(self):
+        if len(self.legs) != 2 or self.legs[0] == self.legs[1]:
+            raise ValueError(f"SpreadOption needs two distinct asset indices, got {self.legs!r}")
+        self.legs = (int(self.legs[0]), int(self.legs[1]))
+
+    def spread(self, spots) -> np.ndarray:
+        spots = np.asarray(spots)
+        return spots[self.legs[0]] - spots[self.legs[1]]
+
+    def payoff(self, spots) -> float:
+        return float(self.payoff_array(np.asarray(spots, dtype=float)))
+
+    def payoff_array(self, spots):
+        value = self.spread(spots)
+        return np.maximum(value - self.strike, 0.0) if self.is_call else np.maximum(self.strike - value, 0.0)
@@ -1,5 +1,6 @@
 # optionkit/payoffs/digital.py
 from dataclasses import dataclass
+import numpy as np
 from optionkit.core.option import Option
 from optionkit.core.factory import register_option
 
@@ -11,3 +12,8 @@ class DigitalOption(Option):
 
     def payoff(self, spot: float) -> float:
         return self.payout if ((spot > self.strike) if self.is_call else (spot < self.strike)) else 0.0
+
+    def payoff_array(self, spots):
+        spots = np.asarray(spots)
+        hit = (spots > self.strike) if self.is_call else (spots < self.strike)
+        return np.where(hit, self.payout, 0.0)
@@ -1,3 +1,4 @@
+import numpy as np
 from optionkit.core.option import Option
 from optionkit.core.factory import register_option
 
@@ -9,3 +10,7 @@ class EuropeanOption(Option):
 
     def payoff(self, spot: float) -> float:
         return max(spot - self.strike, 0.0) if self.is_call else max(self.strike - spot, 0.0)
+
+    def payoff_array(self, spots):
+        spots = np.asarray(spots)
+        return np.maximum(spots - self.strike, 0.0) if self.is_call else np.maximum(self.strike - spots, 0.0)
@@ -0,0 +1,12 @@
+# optionkit/profiling/__init__.py
+from .memory import (
+    ENGINE_CASES, EngineCase, MemoryBudget, MemoryBudgetExceeded, MemoryProfile,
+    format_profiles, measure, profile_engine, profile_engines, profile_scaling,
+    scaling_exponent,
+)
+
+__all__ = [
+    "ENGINE_CASES", "EngineCase", "MemoryBudget", "MemoryBudgetExceeded", "MemoryProfile",
+    "format_profiles", "measure", "profile_engine", "profile_engines", "profile_scaling",
+    "scaling_exponent",
+]
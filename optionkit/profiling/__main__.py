@@ -0,0 +1,25 @@
+# python -m optionkit.profiling [--models M ...] [--scale X] [--peak-mb N] [--bytes-per-unit N]
+import argparse
+import sys
+
+import optionkit.models  # noqa: F401  (populates MODEL_REGISTRY)
+
+from .memory import MemoryBudget, format_profiles, profile_engines
+
+parser = argparse.ArgumentParser(description="Profile peak memory of the pricing engines.")
+parser.add_argument("--models", nargs="*", default=None, help="model names (default: all registered)")
+parser.add_argument("--scale", type=float, default=1.0, help="multiplier on each workload's base size")
+parser.add_argument("--peak-mb", type=float, default=None, help="budget on peak memory")
+parser.add_argument("--bytes-per-unit", type=float, default=None, help="budget on peak bytes per path/node")
+parser.add_argument("--retained-mb", type=float, default=None, help="budget on memory retained after pricing")
+args = parser.parse_args()
+
+mb = lambda x: None if x is None else int(x * 2**20)
+budget = MemoryBudget(mb(args.peak_mb), args.bytes_per_unit, mb(args.retained_mb))
+profiles = profile_engines(args.scale, args.models)
+print(format_profiles(profiles))
+
+broken = [f"{p.label}: " + "; ".join(budget.violations(p)) for p in profiles if budget.violations(p)]
+if broken:
+    print("memory budget exceeded:\n  " + "\n  ".join(broken), file=sys.stderr)
+    sys.exit(1)
@@ -0,0 +1,250 @@
+# optionkit/profiling/memory.py
+"""
+Peak-memory profiling of the pricing engines.
+
+`measure` runs a callable under `tracemalloc` and records the peak traced
+memory above the starting level, plus what is still allocated afterwards
+(bytes and blocks; retained memory is how caches and logs that grow
+without bound show up). NumPy routes array data through its own
+tracemalloc domain (`np.lib.tracemalloc_domain`), so the retained part is
+also broken out for arrays. tracemalloc only exposes live blocks, so
+allocation counts are those of blocks still alive at the end of the run.
+
+`ENGINE_CASES` holds one workload per registered model, parametrized by a
+problem size (paths, tree steps or grid intervals) together with the number
+of units (paths or nodes) that size stands for, so that results are
+comparable as bytes per unit::
+
+    profiles = profile_engines(scale=2.0, budget=MemoryBudget(bytes_per_unit=512))
+
+`MemoryBudget.check` raises `MemoryBudgetExceeded` when a profile breaks a
+limit, and `scaling_exponent` fits peak ~ size^p across sizes, so memory
+growth can be asserted in tests.
+"""
+from __future__ import annotations
+
+import gc
+import math
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from optionkit.core.factory import MODEL_REGISTRY, create_model
+from optionkit.core.option import Option
+from optionkit.payoffs.basket import BasketOption
+from optionkit.payoffs.european import EuropeanOption
+
+
+@dataclass(slots=True, frozen=True)
+class MemoryProfile:
+    """Memory used by one run of a workload."""
+    label: str
+    size: int               # problem size the workload was built with
+    units: int              # paths or nodes the size stands for
+    unit: str
+    peak_bytes: int         # peak traced memory above the starting level
+    retained_bytes: int     # still allocated after the run
+    retained_blocks: int
+    numpy_retained_bytes: int
+    seconds: float
+
+    @property
+    def bytes_per_unit(self) -> float:
+        return self.peak_bytes / self.units if self.units else math.inf
+
+
+class MemoryBudgetExceeded(AssertionError):
+    """A profile broke a `MemoryBudget` limit."""
+
+
+@dataclass(slots=True, frozen=True)
+class MemoryBudget:
+    """Limits on a profile; None disables a limit."""
+    peak_bytes: Optional[int] = None
+    bytes_per_unit: Optional[float] = None
+    retained_bytes: Optional[int] = None
+
+    def violations(self, profile: MemoryProfile) -> List[str]:
+        out = []
+        if self.peak_bytes is not None and profile.peak_bytes > self.peak_bytes:
+            out.append(f"peak {_mb(profile.peak_bytes)} > {_mb(self.peak_bytes)}")
+        if self.bytes_per_unit is not None and profile.bytes_per_unit > self.bytes_per_unit:
+            out.append(f"{profile.bytes_per_unit:,.0f} B/{profile.unit[:-1] or profile.unit} "
+                       f"> {self.bytes_per_unit:,.0f}")
+        if self.retained_bytes is not None and profile.retained_bytes > self.retained_bytes:
+            out.append(f"retained {_mb(profile.retained_bytes)} > {_mb(self.retained_bytes)}")
+        return out
+
+    def check(self, profile: MemoryProfile) -> MemoryProfile:
+        broken = self.violations(profile)
+        if broken:
+            raise MemoryBudgetExceeded(f"{profile.label} (size {profile.size}): " + "; ".join(broken))
+        return profile
+
+
+def _mb(n: float) -> str:
+    return f"{n / 2**20:,.2f} MB"
+
+
+def _numpy_bytes(snapshot: tracemalloc.Snapshot) -> int:
+    numpy_only = snapshot.filter_traces([tracemalloc.DomainFilter(True, np.lib.tracemalloc_domain)])
+    return sum(stat.size for stat in numpy_only.statistics("filename"))
+
+
+def measure(fn: Callable[[], object], label: str = "", size: int = 1, units: Optional[int] = None,
+            unit: str = "calls") -> MemoryProfile:
+    """
+    Run `fn` once under tracemalloc and profile it. Works whether or not
+    tracing is already on (it is left as it was found); the result of `fn`
+    is dropped before the retained memory is measured. Retained figures
+    are net of blocks freed during the run, which only counts frees of
+    blocks allocated while tracing was on.
+    """
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        gc.collect()
+        before = tracemalloc.take_snapshot()
+        base = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        t0 = time.perf_counter()
+        fn()
+        seconds = time.perf_counter() - t0
+        peak = tracemalloc.get_traced_memory()[1]
+        gc.collect()
+        after = tracemalloc.take_snapshot()
+    finally:
+        if started:
+            tracemalloc.stop()
+
+    diff = after.compare_to(before, "filename")
+    return MemoryProfile(
+        label=label, size=size, units=size if units is None else units, unit=unit,
+        peak_bytes=max(peak - base, 0),
+        retained_bytes=max(sum(s.size_diff for s in diff), 0),
+        retained_blocks=max(sum(s.count_diff for s in diff), 0),
+        numpy_retained_bytes=max(_numpy_bytes(after) - _numpy_bytes(before), 0),
+        seconds=seconds,
+    )
+
+
+# ----------------------------------------------------------------------
+# Engine workloads
+
+@dataclass(slots=True, frozen=True)
+class EngineCase:
+    """
+    Workload for one model: `build(size)` returns (model, options), priced
+    with `price_many`; `units(size)` is the number of paths or nodes.
+    """
+    build: Callable[[int], Tuple[object, Sequence[Option]]]
+    units: Callable[[int], int]
+    unit: str
+    base_size: int
+
+
+_MARKET = dict(spot=100.0, rate=0.03)
+_HESTON = dict(v0=0.04, kappa=1.5, theta=0.04, sigma_v=0.5, rho=-0.7)
+_CALL = EuropeanOption(strike=100.0, maturity=1.0, is_call=True)
+
+
+def _single(name: str, **params) -> Callable[[int], Tuple[object, Sequence[Option]]]:
+    size_param = params.pop("size_param")
+
+    def build(size):
+        extra = {size_param: size} if isinstance(size_param, str) else size_param(size)
+        return create_model(name, **params, **extra), [_CALL]
+    return build
+
+
+ENGINE_CASES: Dict[str, EngineCase] = {
+    "BlackScholes": EngineCase(
+        lambda n: (create_model("BlackScholes", **_MARKET, vol=0.2),
+                   [EuropeanOption(strike=50.0 + 100.0 * i / n, maturity=1.0) for i in range(n)]),
+        lambda n: n, "options", 1_000),
+    "MonteCarlo": EngineCase(
+        _single("MonteCarlo", **_MARKET, vol=0.2, size_param="paths"),
+        lambda n: n, "paths", 100_000),
+    "Heston": EngineCase(
+        _single("Heston", **_MARKET, **_HESTON, steps=50, size_param="paths"),
+        lambda n: n, "paths", 50_000),
+    "Merton": EngineCase(
+        _single("Merton", **_MARKET, vol=0.2, lam=0.5, mu_j=-0.1, sigma_j=0.15,
+                steps=50, size_param="paths"),
+        lambda n: n, "paths", 50_000),
+    "MultiAssetMonteCarlo": EngineCase(
+        lambda n: (create_model("MultiAssetMonteCarlo", spots=[100.0] * 3, vols=[0.2, 0.25, 0.3],
+                                corr=[[1, 0.5, 0.3], [0.5, 1, 0.4], [0.3, 0.4, 1]],
+                                rate=0.03, paths=n),
+                   [BasketOption(strike=100.0, maturity=1.0, weights=(1 / 3,) * 3)]),
+        lambda n: n, "paths", 100_000),
+    "BinomialTree": EngineCase(
+        _single("BinomialTree", **_MARKET, vol=0.2, size_param="steps"),
+        lambda n: (n + 1) * (n + 2) // 2, "nodes", 500),
+    "TrinomialTree": EngineCase(
+        _single("TrinomialTree", **_MARKET, vol=0.2, size_param="steps"),
+        lambda n: (n + 1) ** 2, "nodes", 500),
+    "FiniteDifference": EngineCase(
+        _single("FiniteDifference", **_MARKET, vol=0.2,
+                size_param=lambda n: {"space_steps": n, "time_steps": max(n // 2, 1)}),
+        lambda n: n + 1, "nodes", 400),
+    "HestonFiniteDifference": EngineCase(
+        _single("HestonFiniteDifference", **_MARKET, **_HESTON,
+                size_param=lambda n: {"s_steps": n, "v_steps": max(n // 2, 2), "time_steps": 20}),
+        lambda n: (n + 1) * (max(n // 2, 2) + 1), "nodes", 100),
+}
+
+
+def profile_engine(name: str, size: Optional[int] = None, case: Optional[EngineCase] = None,
+                   budget: Optional[MemoryBudget] = None) -> MemoryProfile:
+    """Profile pricing with one engine at `size` (default: the case's base size)."""
+    case = case or ENGINE_CASES.get(name)
+    if case is None:
+        raise ValueError(f"No memory workload for model '{name}'. Available: {sorted(ENGINE_CASES)}")
+    size = case.base_size if size is None else int(size)
+    model, options = case.build(size)
+    profile = measure(lambda: model.price_many(options), label=name, size=size,
+                      units=case.units(size), unit=case.unit)
+    return budget.check(profile) if budget is not None else profile
+
+
+def profile_engines(scale: float = 1.0, names: Optional[Iterable[str]] = None,
+                    budget: Optional[MemoryBudget] = None) -> List[MemoryProfile]:
+    """Profile every registered model (or `names`) at `scale` times its base size."""
+    names = list(MODEL_REGISTRY) if names is None else list(names)
+    profiles = []
+    for name in names:
+        case = ENGINE_CASES.get(name)
+        size = None if case is None else max(int(case.base_size * scale), 1)
+        profiles.append(profile_engine(name, size, budget=budget))
+    return profiles
+
+
+def profile_scaling(name: str, sizes: Sequence[int], case: Optional[EngineCase] = None
+                    ) -> List[MemoryProfile]:
+    """Profiles of one engine across problem sizes."""
+    return [profile_engine(name, n, case=case) for n in sizes]
+
+
+def scaling_exponent(profiles: Sequence[MemoryProfile]) -> float:
+    """Least-squares slope p of log(peak) against log(units): peak ~ units^p."""
+    if len(profiles) < 2:
+        raise ValueError("Need profiles at two or more sizes.")
+    x = np.log([p.units for p in profiles])
+    y = np.log([max(p.peak_bytes, 1) for p in profiles])
+    return float(np.polyfit(x, y, 1)[0])
+
+
+def format_profiles(profiles: Iterable[MemoryProfile]) -> str:
+    """Fixed-width table of profiles."""
+    lines = [f"{'engine':<24} {'size':>9} {'units':>11} {'peak':>12} {'B/unit':>10} "
+             f"{'retained':>12} {'blocks':>8} {'seconds':>8}"]
+    for p in profiles:
+        lines.append(f"{p.label:<24} {p.size:>9} {p.units:>11} {_mb(p.peak_bytes):>12} "
+                     f"{p.bytes_per_unit:>10,.1f} {_mb(p.retained_bytes):>12} "
+                     f"{p.retained_blocks:>8} {p.seconds:>8.3f}")
+    return "\n".join(lines)
@@ -0,0 +1,8 @@
+# optionkit/service/__init__.py
+from .metrics import ServiceMetrics
+from .batcher import MicroBatcher, price_batch, price_each
+from .server import PricingService, serve
+from .incremental import IncrementalRepricer, RepriceReport
+
+__all__ = ["ServiceMetrics", "MicroBatcher", "price_batch", "price_each", "PricingService",
+           "serve", "IncrementalRepricer", "RepriceReport"]
@@ -0,0 +1,16 @@
+# python -m optionkit.service [--host H] [--port P] [--unix PATH]
+import argparse
+
+from .server import serve
+
+parser = argparse.ArgumentParser(description="Run the optionkit JSON-lines pricing service.")
+parser.add_argument("--host", default="127.0.0.1")
+parser.add_argument("--port", type=int, default=8765)
+parser.add_argument("--unix", default=None, help="serve on a Unix socket instead of TCP")
+parser.add_argument("--window", type=float, default=0.002, help="batching window in seconds")
+parser.add_argument("--max-batch", type=int, default=256)
+parser.add_argument("--max-pending", type=int, default=10_000)
+args = parser.parse_args()
+
+serve(args.host, args.port, args.unix, window=args.window,
+      max_batch=args.max_batch, max_pending=args.max_pending)
@@ -0,0 +1,128 @@
+# optionkit/service/batcher.py
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import optionkit.models  # noqa: F401  (populates MODEL_REGISTRY)
+import optionkit.payoffs  # noqa: F401  (populates OPTION_REGISTRY)
+from optionkit.core.factory import create_model
+from optionkit.core.option import Option
+from .metrics import ServiceMetrics
+
+
+def price_batch(model_name: str, model_kwargs: Dict[str, Any],
+                options: Sequence[Option]) -> List[float]:
+    """Build the model once and price every option of a batch with it."""
+    model = create_model(model_name, **model_kwargs)
+    return [float(p) for p in model.price_many(options)]
+
+
+def price_each(model_name: str, model_kwargs: Dict[str, Any],
+               options: Sequence[Option]) -> List[Union[float, Exception]]:
+    """Price a batch option by option; a failing option yields its exception."""
+    model = create_model(model_name, **model_kwargs)
+    results: List[Union[float, Exception]] = []
+    for option in options:
+        try:
+            results.append(float(model.price(option)))
+        except Exception as exc:
+            results.append(exc)
+    return results
+
+
+@dataclass(slots=True)
+class _Batch:
+    model_name: str
+    model_kwargs: Dict[str, Any]
+    options: List[Option] = field(default_factory=list)
+    futures: List[asyncio.Future] = field(default_factory=list)
+    timer: Optional[asyncio.TimerHandle] = None
+
+
+class MicroBatcher:
+    """
+    Coalesce concurrent pricing requests that share model parameters.
+
+    The first request for a given (model, parameters) key opens a batch and
+    arms a timer of `window` seconds; later requests with the same key join
+    it. The batch is flushed when the timer fires or `max_batch` requests
+    have joined, and is priced in `executor` (default: the loop's executor)
+    through `Model.price_many`, so vectorized engines price it in one call.
+    If the batch fails, its options are re-priced one by one so only the
+    offending requests get the error.
+    """
+
+    def __init__(self, window: float = 0.002, max_batch: int = 256,
+                 executor: Optional[Executor] = None,
+                 metrics: Optional[ServiceMetrics] = None):
+        if window < 0 or max_batch < 1:
+            raise ValueError("window must be >= 0 and max_batch >= 1")
+        self.window = window
+        self.max_batch = max_batch
+        self.executor = executor
+        self.metrics = metrics if metrics is not None else ServiceMetrics()
+        self._open: Dict[str, _Batch] = {}
+        self._running: set = set()
+
+    @staticmethod
+    def batch_key(model_name: str, model_kwargs: Dict[str, Any]) -> str:
+        return json.dumps([model_name, model_kwargs], sort_keys=True)
+
+    async def submit(self, model_name: str, model_kwargs: Dict[str, Any],
+                     option: Option) -> float:
+        """Queue one option and wait for its price."""
+        loop = asyncio.get_running_loop()
+        key = self.batch_key(model_name, model_kwargs)
+        batch = self._open.get(key)
+        if batch is None:
+            batch = self._open[key] = _Batch(model_name, dict(model_kwargs))
+            batch.timer = loop.call_later(self.window, self._flush, key)
+
+        fut = loop.create_future()
+        batch.options.append(option)
+        batch.futures.append(fut)
+        if len(batch.options) >= self.max_batch:
+            self._flush(key)
+        return await fut
+
+    def _flush(self, key: str) -> None:
+        batch = self._open.pop(key, None)
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+        task = asyncio.get_running_loop().create_task(self._run(batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _run(self, batch: _Batch) -> None:
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        args = (batch.model_name, batch.model_kwargs, batch.options)
+        try:
+            results = await loop.run_in_executor(self.executor, price_batch, *args)
+        except Exception:
+            try:
+                results = await loop.run_in_executor(self.executor, price_each, *args)
+            except Exception as exc:        # the model itself cannot be built
+                results = [exc] * len(batch.futures)
+        for fut, result in zip(batch.futures, results):
+            if fut.done():
+                continue
+            if isinstance(result, Exception):
+                fut.set_exception(result)
+            else:
+                fut.set_result(result)
+        self.metrics.batch_finished(len(batch.options), time.perf_counter() - start)
+
+    async def drain(self) -> None:
+        """Flush every open batch and wait for all running batches."""
+        for key in list(self._open):
+            self._flush(key)
+        if self._running:
+            await asyncio.gather(*self._running, return_exceptions=True)
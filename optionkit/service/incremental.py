@@ -0,0 +1,169 @@
+# optionkit/service/incremental.py
+from __future__ import annotations
+
+import copy
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Hashable, List, Optional
+
+import numpy as np
+
+from optionkit.core.model import Model
+from optionkit.core.option import Option
+
+
+@dataclass(slots=True)
+class RepriceReport:
+    """Outcome of one market update: position values and how each was obtained."""
+    values: Dict[Hashable, float]
+    approximated: List[Hashable] = field(default_factory=list)
+    revalued: List[Hashable] = field(default_factory=list)
+    max_error: float = 0.0      # largest estimated error among approximated positions
+    seconds: float = 0.0
+
+    @property
+    def total(self) -> float:
+        return float(sum(self.values.values()))
+
+
+class IncrementalRepricer:
+    """
+    Tick-driven repricing of a book of positions under one model.
+
+    Every position keeps the price and Greeks of its last full revaluation.
+    On `update(spot=..., vol=...)` each value is first estimated by the
+    Taylor expansion
+
+        P + delta dS + gamma dS^2 / 2 + vega dsigma
+
+    around that reference point. Only positions whose estimated truncation
+    error exceeds their budget, or whose last revaluation is older than
+    `max_age` seconds, are repriced through the model.
+
+    The truncation error is estimated from the leading omitted terms,
+    |speed| |dS|^3 / 6 + |volga| dsigma^2 / 2 + |vanna dS dsigma|, which are
+    computed at each revaluation by bumping spot (`spot_bump`, relative) and
+    vol (`vol_bump`, absolute) once. Budgets are in position value
+    (quantity times price).
+
+    The repricer owns a copy of `model`; updates change its `spot` and, for
+    models with one, its `vol`.
+    """
+
+    def __init__(self, model: Model, budget: float = 0.01, max_age: float = 60.0,
+                 spot_bump: float = 0.01, vol_bump: float = 0.01,
+                 clock: Callable[[], float] = time.monotonic):
+        self.model = copy.deepcopy(model)
+        self.budget = budget
+        self.max_age = max_age
+        self.spot_bump = spot_bump
+        self.vol_bump = vol_bump
+        self.clock = clock
+        self._keys: List[Hashable] = []
+        self._index: Dict[Hashable, int] = {}
+        self._options: List[Option] = []
+        self._quantity: List[float] = []
+        self._budget: List[float] = []
+        self._state: Optional[Dict[str, np.ndarray]] = None   # built lazily
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    # ------------------------------------------------------------------
+
+    def add(self, key: Hashable, option: Option, quantity: float = 1.0,
+            budget: Optional[float] = None) -> None:
+        """Add a position; it is fully valued on the next update."""
+        if key in self._index:
+            raise ValueError(f"Duplicate position key: {key!r}")
+        self._index[key] = len(self._keys)
+        self._keys.append(key)
+        self._options.append(option)
+        self._quantity.append(float(quantity))
+        self._budget.append(self.budget if budget is None else float(budget))
+        self._state = None
+
+    def _has_vol(self) -> bool:
+        return hasattr(self.model, "vol")
+
+    def _vol(self) -> float:
+        return float(self.model.vol) if self._has_vol() else 0.0
+
+    def _bumped(self, attr: str, h: float) -> Model:
+        bumped = copy.deepcopy(self.model)
+        setattr(bumped, attr, getattr(bumped, attr) + h)
+        return bumped
+
+    def _revalue(self, idx: np.ndarray, now: float) -> None:
+        st, model = self._state, self.model
+        spot, vol = float(model.spot), self._vol()
+        h_spot = self.spot_bump * spot
+        up_spot = self._bumped("spot", h_spot)
+        up_vol = self._bumped("vol", self.vol_bump) if self._has_vol() else None
+
+        st["price"][idx] = model.price_many([self._options[i] for i in idx])
+        for i in idx:
+            option = self._options[i]
+            delta, gamma = float(model.delta(option)), float(model.gamma(option))
+            st["delta"][i], st["gamma"][i] = delta, gamma
+            st["speed"][i] = (float(up_spot.gamma(option)) - gamma) / h_spot
+            if up_vol is not None:
+                vega = float(model.vega(option))
+                st["vega"][i] = vega
+                st["volga"][i] = (float(up_vol.vega(option)) - vega) / self.vol_bump
+                st["vanna"][i] = (float(up_vol.delta(option)) - delta) / self.vol_bump
+        st["spot"][idx], st["vol"][idx], st["time"][idx] = spot, vol, now
+        st["fresh"][idx] = False
+
+    def _build_state(self) -> Dict[str, np.ndarray]:
+        n = len(self._keys)
+        old, old_n = self._state, 0
+        st = {k: np.zeros(n) for k in ("price", "delta", "gamma", "vega", "speed", "volga",
+                                        "vanna", "spot", "vol", "time")}
+        st["fresh"] = np.ones(n, dtype=bool)
+        if old is not None:
+            old_n = old["price"].size
+            for k, v in old.items():
+                st[k][:old_n] = v
+        st["quantity"] = np.array(self._quantity)
+        st["budget"] = np.array(self._budget)
+        return st
+
+    # ------------------------------------------------------------------
+
+    def update(self, spot: Optional[float] = None, vol: Optional[float] = None) -> RepriceReport:
+        """Apply a market move and return the new position values."""
+        start = time.perf_counter()
+        now = self.clock()
+        if spot is not None:
+            self.model.spot = spot
+        if vol is not None:
+            if not self._has_vol():
+                raise ValueError(f"{type(self.model).__name__} has no `vol` to update.")
+            self.model.vol = vol
+        if self._state is None or self._state["price"].size != len(self._keys):
+            self._state = self._build_state()
+        st = self._state
+
+        dS = float(self.model.spot) - st["spot"]
+        dv = self._vol() - st["vol"]
+        error = (np.abs(st["speed"]) * np.abs(dS) ** 3 / 6 + np.abs(st["volga"]) * dv**2 / 2
+                 + np.abs(st["vanna"] * dS * dv))
+        stale = st["fresh"] | (now - st["time"] > self.max_age)
+        revalue = stale | (error * np.abs(st["quantity"]) > st["budget"])
+
+        estimate = st["price"] + st["delta"] * dS + 0.5 * st["gamma"] * dS**2 + st["vega"] * dv
+        idx = np.flatnonzero(revalue)
+        if idx.size:
+            self._revalue(idx, now)
+        price = np.where(revalue, st["price"], estimate)
+
+        values = dict(zip(self._keys, (st["quantity"] * price).tolist()))
+        keys = self._keys
+        return RepriceReport(
+            values=values,
+            approximated=[keys[i] for i in np.flatnonzero(~revalue)],
+            revalued=[keys[i] for i in idx],
+            max_error=float(np.max(error * np.abs(st["quantity"]), where=~revalue, initial=0.0)),
+            seconds=time.perf_counter() - start,
+        )
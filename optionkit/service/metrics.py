@@ -0,0 +1,67 @@
+# optionkit/service/metrics.py
+from __future__ import annotations
+
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict
+
+import numpy as np
+
+
+@dataclass(slots=True)
+class ServiceMetrics:
+    """
+    Latency/throughput counters for the pricing service.
+
+    Latencies are kept in a bounded window (`window` most recent requests),
+    so memory stays constant under sustained load.
+    """
+    window: int = 10_000
+    started: float = field(default_factory=time.perf_counter)
+    requests: int = 0
+    errors: int = 0
+    batches: int = 0
+    batched_requests: int = 0
+    in_flight: int = 0
+    max_in_flight: int = 0
+    _latencies: Deque[float] = field(init=False)
+    _batch_seconds: float = 0.0
+
+    def __post_init__(self):
+        self._latencies = deque(maxlen=self.window)
+
+    def request_started(self) -> None:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def request_finished(self, latency: float, ok: bool = True) -> None:
+        self.in_flight -= 1
+        self.requests += 1
+        if not ok:
+            self.errors += 1
+        self._latencies.append(latency)
+
+    def batch_finished(self, size: int, seconds: float) -> None:
+        self.batches += 1
+        self.batched_requests += size
+        self._batch_seconds += seconds
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Plain-dict view (JSON serialisable) of the current counters."""
+        elapsed = time.perf_counter() - self.started
+        lat = np.fromiter(self._latencies, dtype=float)
+        p50, p99 = (np.percentile(lat, [50, 99]) * 1e3) if lat.size else (0.0, 0.0)
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "batches": self.batches,
+            "mean_batch_size": self.batched_requests / self.batches if self.batches else 0.0,
+            "mean_batch_ms": 1e3 * self._batch_seconds / self.batches if self.batches else 0.0,
+            "latency_p50_ms": float(p50),
+            "latency_p99_ms": float(p99),
+            "throughput_rps": self.requests / elapsed if elapsed > 0 else 0.0,
+            "uptime_s": elapsed,
+        }
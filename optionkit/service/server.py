@@ -0,0 +1,131 @@
+# optionkit/service/server.py
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from concurrent.futures import Executor
+from typing import Any, Dict, Optional
+
+from optionkit.core.factory import create_option
+from .batcher import MicroBatcher
+from .metrics import ServiceMetrics
+
+
+class PricingService:
+    """
+    Local asyncio pricing service speaking JSON lines.
+
+    Each request line is an object::
+
+        {"id": 1,
+         "model": "BlackScholes", "model_params": {"spot": 100, "rate": 0.05, "vol": 0.2},
+         "option": "EuropeanOption", "option_params": {"strike": 100, "maturity": 1.0}}
+
+    and is answered (possibly out of order) by ``{"id": 1, "price": ...}`` or
+    ``{"id": 1, "error": "..."}``. ``{"op": "metrics"}`` returns the metrics
+    snapshot. Requests sharing model name and parameters are coalesced by a
+    `MicroBatcher`.
+
+    Backpressure: at most `max_pending` requests are in flight across all
+    connections; once the limit is reached connections stop being read until
+    earlier requests complete, which pushes back on clients through the
+    socket buffers.
+    """
+
+    def __init__(self, window: float = 0.002, max_batch: int = 256,
+                 max_pending: int = 10_000, executor: Optional[Executor] = None):
+        self.metrics = ServiceMetrics()
+        self.batcher = MicroBatcher(window, max_batch, executor, self.metrics)
+        self._slots = asyncio.Semaphore(max_pending)
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    # ------------------------------------------------------------------
+
+    async def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Answer one decoded request (in-process entry point)."""
+        async with self._slots:
+            return await self._handle(request)
+
+    async def _handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        if request.get("op") == "metrics":
+            return {"id": request.get("id"), "metrics": self.metrics.snapshot()}
+
+        start = time.perf_counter()
+        self.metrics.request_started()
+        ok = False
+        try:
+            option = create_option(request["option"], **request.get("option_params", {}))
+            price = await self.batcher.submit(
+                request["model"], request.get("model_params", {}), option
+            )
+            ok = True
+            return {"id": request.get("id"), "price": price}
+        except Exception as exc:
+            return {"id": request.get("id"), "error": f"{type(exc).__name__}: {exc}"}
+        finally:
+            self.metrics.request_finished(time.perf_counter() - start, ok)
+
+    async def _connection(self, reader: asyncio.StreamReader,
+                          writer: asyncio.StreamWriter) -> None:
+        write_lock = asyncio.Lock()
+        tasks = set()
+
+        async def respond(line: bytes) -> None:
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError(f"request must be a JSON object, got {type(request).__name__}")
+                reply = await self._handle(request)
+            except Exception as exc:
+                reply = {"id": None, "error": f"{type(exc).__name__}: {exc}"}
+            finally:
+                self._slots.release()
+            async with write_lock:
+                writer.write(json.dumps(reply).encode() + b"\n")
+                await writer.drain()
+
+        try:
+            while line := await reader.readline():
+                if not line.strip():
+                    continue
+                # Wait for a free slot before reading further (backpressure)
+                await self._slots.acquire()
+                task = asyncio.create_task(respond(line))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            writer.close()
+
+    # ------------------------------------------------------------------
+
+    async def start_tcp(self, host: str = "127.0.0.1", port: int = 8765):
+        self._server = await asyncio.start_server(self._connection, host, port)
+        return self._server
+
+    async def start_unix(self, path: str):
+        self._server = await asyncio.start_unix_server(self._connection, path)
+        return self._server
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        await self.batcher.drain()
+
+
+def serve(host: str = "127.0.0.1", port: int = 8765, path: Optional[str] = None,
+          **kwargs) -> None:
+    """Run a `PricingService` until interrupted (TCP, or Unix socket if `path`)."""
+    async def main():
+        service = PricingService(**kwargs)
+        server = await (service.start_unix(path) if path else service.start_tcp(host, port))
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
@@ -1 +1,5 @@
- 
+# optionkit/simulation/__init__.py
+from .path_store import PathStore
+from .multi_asset import CorrelatedGBM, correlation_factor
+
+__all__ = ["PathStore", "CorrelatedGBM", "correlation_factor"]
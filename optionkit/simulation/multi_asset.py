@@ -0,0 +1,122 @@
+# optionkit/simulation/multi_asset.py
+from __future__ import annotations
+
+import math
+import warnings
+from typing import Iterator, Optional
+
+import numpy as np
+from scipy.stats import norm, qmc
+
+from optionkit.core.math_utils import mc_dtype
+
+FACTORIZATIONS = ("cholesky", "pca")
+
+
+def correlation_factor(corr, method: str = "cholesky") -> np.ndarray:
+    """
+    Matrix L with L @ L.T == corr, so L @ Z turns independent normals Z
+    into correlated ones.
+
+    "cholesky" gives the lower-triangular factor and needs a positive
+    definite matrix. "pca" uses the eigendecomposition V diag(sqrt(lam)),
+    with columns ordered by explained variance; it accepts semi-definite
+    matrices (e.g. perfectly correlated assets) and puts the dominant factor
+    on the first Sobol dimension.
+    """
+    corr = np.asarray(corr, dtype=float)
+    if corr.ndim != 2 or corr.shape[0] != corr.shape[1]:
+        raise ValueError(f"Correlation matrix must be square, got shape {corr.shape}")
+    if not np.allclose(corr, corr.T) or not np.allclose(np.diag(corr), 1.0):
+        raise ValueError("Correlation matrix must be symmetric with a unit diagonal.")
+    if method == "cholesky":
+        try:
+            return np.linalg.cholesky(corr)
+        except np.linalg.LinAlgError:
+            raise ValueError("Correlation matrix is not positive definite; "
+                             "use factorization='pca' for semi-definite matrices.") from None
+    if method == "pca":
+        lam, V = np.linalg.eigh(corr)
+        if lam[0] < -1e-10:
+            raise ValueError("Correlation matrix is not positive semi-definite.")
+        order = np.argsort(lam)[::-1]
+        return V[:, order] * np.sqrt(np.clip(lam[order], 0.0, None))
+    raise ValueError(f"Unknown factorization: {method!r} (use one of {FACTORIZATIONS})")
+
+
+class CorrelatedGBM:
+    """
+    Terminal values of several correlated geometric Brownian motions,
+
+        S_i(T) = S_i(0) exp((r - sigma_i^2 / 2) T + sigma_i sqrt(T) X_i),
+
+    with X = L Z and L a factor of the correlation matrix
+    (`correlation_factor`).
+
+    Draws are produced in chunks of at most `chunk` paths as (assets, n)
+    blocks, so memory grows with assets x chunk rather than assets x paths.
+    Pseudo-random normals come from one `np.random.Generator` seeded with
+    `seed` (drawn path-major, so the stream does not depend on `chunk`);
+    with ``sobol=True`` a scrambled Sobol sequence of dimension `assets`
+    is mapped through the normal inverse CDF instead. Sobol chunks that are
+    powers of two keep the sequence's balance properties.
+    """
+
+    def __init__(self, spots, vols, corr, rate: float, paths: int = 100_000,
+                 chunk: int = 16_384, seed: Optional[int] = 42,
+                 factorization: str = "cholesky", sobol: bool = False,
+                 dtype: str = "float64"):
+        self.spots = np.asarray(spots, dtype=float)
+        self.vols = np.asarray(vols, dtype=float)
+        if self.spots.ndim != 1 or self.spots.shape != self.vols.shape:
+            raise ValueError("spots and vols must be 1-D arrays of the same length.")
+        self.factor = correlation_factor(corr, factorization)
+        if self.factor.shape[0] != self.spots.size:
+            raise ValueError(f"Correlation matrix is {self.factor.shape[0]}x{self.factor.shape[0]}, "
+                             f"expected {self.spots.size}x{self.spots.size}.")
+        if chunk <= 0:
+            raise ValueError("chunk must be positive.")
+        self.rate = rate
+        self.paths = paths
+        self.chunk = chunk
+        self.seed = seed
+        self.sobol = sobol
+        self.dtype = mc_dtype(dtype)
+
+    @property
+    def assets(self) -> int:
+        return self.spots.size
+
+    def normal_chunks(self) -> Iterator[np.ndarray]:
+        """Independent standard normals as (assets, n) blocks."""
+        if self.sobol:
+            sampler = qmc.Sobol(d=self.assets, scramble=True, seed=self.seed)
+        else:
+            rng = np.random.default_rng(self.seed)
+        done = 0
+        while done < self.paths:
+            n = min(self.chunk, self.paths - done)
+            if self.sobol:
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore", UserWarning)   # non power-of-two chunk
+                    U = sampler.random(n)
+                Z = norm.ppf(np.clip(U, 1e-12, 1 - 1e-12)).astype(self.dtype)
+            else:
+                Z = rng.standard_normal((n, self.assets), dtype=self.dtype)
+            yield Z.T
+            done += n
+
+    def terminal_chunks(self, T: float) -> Iterator[np.ndarray]:
+        """Terminal prices S_i(T) as (assets, n) blocks."""
+        drift = np.log(self.spots) + (self.rate - 0.5 * self.vols**2) * T
+        scale = self.vols[:, None] * self.factor * math.sqrt(T)
+        drift = drift.astype(self.dtype)[:, None]
+        scale = scale.astype(self.dtype)
+        for Z in self.normal_chunks():
+            X = scale @ Z
+            X += drift
+            yield np.exp(X, out=X)
+
+    def simulate_terminal(self, T: float) -> np.ndarray:
+        """All terminal prices at once, shape (assets, paths)."""
+        return np.concatenate(list(self.terminal_chunks(T)), axis=1)
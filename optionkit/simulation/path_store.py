@@ -0,0 +1,165 @@
+# optionkit/simulation/path_store.py
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+import numpy as np
+
+KINDS = ("paths", "terminal")
+
+# Part of every key: bump whenever the engines change how a given seed maps
+# to samples, so entries written under the old scheme miss instead of being
+# served to models that would now draw something else.
+FORMAT_VERSION = 2     # 2: Heston normals drawn per step, exact Merton terminal sample
+
+
+class PathStore:
+    """
+    On-disk cache of simulated path matrices, read back via memory mapping.
+
+    Entries are `.npy` files keyed by a hash of the model class, its
+    simulation parameters (`model.SIMULATION_PARAMS`, which include the seed
+    and time grid), the maturity and the store's `FORMAT_VERSION`. `kind="paths"` stores the full
+    (steps+1, paths) matrix; `kind="terminal"` stores only a sample of S_T
+    (from the model's `sample_terminal` when it has one), which is a
+    sufficient statistic for terminal payoffs.
+
+    Loads return read-only `np.memmap` views, so several worker processes
+    pointing at the same directory share the pages through the OS cache
+    without copying; the directory may be read-only. Data and `.json`
+    metadata are each written to a temporary file followed by an atomic
+    rename, so readers never see partial entries.
+
+    Parameters
+    ----------
+    root : str or Path
+        Cache directory (created if missing).
+    max_bytes : int, optional
+        Size budget; least-recently-used entries are evicted beyond it.
+    max_age : float, optional
+        Entries not used for more than `max_age` seconds are evicted.
+    """
+
+    def __init__(self, root: Union[str, Path], max_bytes: Optional[int] = None,
+                 max_age: Optional[float] = None):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+
+    def __repr__(self):
+        return (f"PathStore(root={str(self.root)!r}, max_bytes={self.max_bytes}, "
+                f"max_age={self.max_age})")
+
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def describe(model, T: float, kind: str = "paths") -> Dict[str, Any]:
+        """The parameters an entry is keyed on."""
+        if kind not in KINDS:
+            raise ValueError(f"Unknown path-store kind: {kind}")
+        params = {name: getattr(model, name) for name in model.SIMULATION_PARAMS}
+        return {"version": FORMAT_VERSION, "model": type(model).__name__, "params": params,
+                "maturity": float(T), "kind": kind}
+
+    def key(self, model, T: float, kind: str = "paths") -> str:
+        blob = json.dumps(self.describe(model, T, kind), sort_keys=True, default=str)
+        return hashlib.sha256(blob.encode()).hexdigest()[:24]
+
+    def _file(self, key: str) -> Path:
+        return self.root / f"{key}.npy"
+
+    # ------------------------------------------------------------------
+
+    def load(self, model, T: float, kind: str = "paths") -> Optional[np.memmap]:
+        """Memory-mapped entry, or None if absent."""
+        f = self._file(self.key(model, T, kind))
+        try:
+            arr = np.load(f, mmap_mode="r")
+        except FileNotFoundError:
+            return None
+        try:
+            os.utime(f)  # mark as recently used; best effort on read-only stores
+        except OSError:
+            pass
+        return arr
+
+    def save(self, model, T: float, data: np.ndarray, kind: str = "paths") -> np.memmap:
+        key = self.key(model, T, kind)
+        stem = f"{key}.{os.getpid()}.{time.monotonic_ns()}"
+        tmp_data, tmp_meta = self.root / f"{stem}.tmp.npy", self.root / f"{stem}.tmp.json"
+        np.save(tmp_data, np.ascontiguousarray(data))
+        meta = self.describe(model, T, kind)
+        meta.update(shape=list(data.shape), dtype=str(data.dtype), created=time.time())
+        tmp_meta.write_text(json.dumps(meta, default=str))
+        os.replace(tmp_data, self._file(key))
+        os.replace(tmp_meta, self.root / f"{key}.json")
+        arr = np.load(self._file(key), mmap_mode="r")
+        self.evict()    # the mapping stays valid even if the new entry is evicted
+        return arr
+
+    def get(self, model, T: float, kind: str = "paths") -> np.ndarray:
+        """Load the entry for (model, T), simulating and storing it on a miss."""
+        arr = self.load(model, T, kind)
+        if arr is not None:
+            return arr
+        if kind == "terminal":
+            sample = getattr(model, "sample_terminal", None)
+            data = sample(T) if sample is not None else model.simulate_paths(T)[-1]
+        else:
+            data = model.simulate_paths(T)
+        return self.save(model, T, data, kind)
+
+    # ------------------------------------------------------------------
+
+    def entries(self):
+        """(path, size, last_used) of every stored entry, oldest first."""
+        out = []
+        for f in self.root.glob("*.npy"):
+            if f.name.endswith(".tmp.npy"):
+                continue
+            try:
+                st = f.stat()
+            except FileNotFoundError:
+                continue
+            out.append((f, st.st_size, st.st_mtime))
+        return sorted(out, key=lambda e: e[2])
+
+    def _remove(self, f: Path) -> None:
+        for p in (f, f.with_suffix(".json")):
+            try:
+                p.unlink()
+            except FileNotFoundError:
+                pass
+
+    def evict(self) -> int:
+        """Apply age and size limits; returns the number of entries removed."""
+        entries = self.entries()
+        removed = 0
+        if self.max_age is not None:
+            cutoff = time.time() - self.max_age
+            for e in [e for e in entries if e[2] < cutoff]:
+                self._remove(e[0])
+                entries.remove(e)
+                removed += 1
+        if self.max_bytes is not None:
+            total = sum(e[1] for e in entries)
+            while entries and total > self.max_bytes:
+                f, size, _ = entries.pop(0)
+                self._remove(f)
+                total -= size
+                removed += 1
+        return removed
+
+    def clear(self) -> None:
+        for f, _, _ in self.entries():
+            self._remove(f)
+
+    @property
+    def size(self) -> int:
+        return sum(e[1] for e in self.entries())
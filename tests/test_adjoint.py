@@ -0,0 +1,68 @@
+import copy
+
+import numpy as np
+import pytest
+from optionkit.payoffs import EuropeanOption, DigitalOption, AsianOption
+from optionkit.models import HestonModel, MertonModel
+from optionkit.calibration.fourier import heston_prices, merton_prices
+
+CALL = EuropeanOption(strike=100, maturity=1, is_call=True)
+HESTON = dict(v0=0.04, kappa=1.5, theta=0.05, sigma_v=0.2, rho=-0.7)
+MERTON = dict(vol=0.2, lam=0.5, mu_j=-0.1, sigma_j=0.15)
+
+
+def _analytic(pricer, params, name, h=1e-5):
+    up, dn = dict(params), dict(params)
+    up[name] += h
+    dn[name] -= h
+    diff = pricer(100, 0.03, [100], [1], True, **up) - pricer(100, 0.03, [100], [1], True, **dn)
+    return float(np.squeeze(diff)) / (2 * h)
+
+
+def _bump(model, attr, h):
+    """Central difference of the MC price with common random numbers."""
+    up, dn = copy.copy(model), copy.copy(model)
+    setattr(up, attr, getattr(model, attr) + h)
+    setattr(dn, attr, getattr(model, attr) - h)
+    return (up.price(CALL) - dn.price(CALL)) / (2 * h)
+
+
+def test_heston_adjoint_matches_bumped_prices_and_fourier():
+    model = HestonModel(spot=100, rate=0.03, steps=50, paths=50_000, seed=3, **HESTON)
+    g = model.sensitivities(CALL)
+    assert g.price == model.price(CALL)
+    # Same paths: the adjoint is the exact derivative of the simulated price
+    assert g.delta == pytest.approx(_bump(model, "spot", 0.01), rel=1e-3)
+    assert g.rho == pytest.approx(_bump(model, "rate", 1e-4), rel=1e-3)
+    for name in HESTON:
+        assert g.params[name] == pytest.approx(_bump(model, name, 1e-5), rel=1e-4, abs=1e-6)
+    # ... and the dominant sensitivities agree with the semi-analytic model
+    for name in ("v0", "theta"):
+        assert g.params[name] == pytest.approx(_analytic(heston_prices, HESTON, name), rel=0.1)
+
+
+def test_merton_adjoint_matches_fourier():
+    model = MertonModel(spot=100, rate=0.03, steps=50, paths=100_000, seed=2, **MERTON)
+    g = model.sensitivities(CALL)
+    assert g.price == model.price(CALL)
+    assert g.delta == pytest.approx(_bump(model, "spot", 0.01), rel=1e-3)
+    for name in MERTON:
+        # lam carries a likelihood-ratio term, hence the looser tolerance
+        assert g.params[name] == pytest.approx(_analytic(merton_prices, MERTON, name), rel=0.05)
+    assert model.vega(CALL) == g.params["vol"]
+
+
+def test_gamma_from_smoothed_payoff():
+    model = MertonModel(spot=100, rate=0.03, steps=20, paths=100_000, seed=2, **MERTON)
+    h = 0.5
+    up, dn = copy.copy(model), copy.copy(model)
+    up.spot, dn.spot = 100 + h, 100 - h
+    fd = (up.price(CALL) - 2 * model.price(CALL) + dn.price(CALL)) / h**2
+    assert model.gamma(CALL) == pytest.approx(fd, rel=0.05)
+
+
+def test_adjoint_rejects_unsupported_payoffs():
+    model = MertonModel(spot=100, rate=0.03, steps=10, paths=1_000, **MERTON)
+    with pytest.raises(ValueError):
+        model.sensitivities(AsianOption(strike=100, maturity=1))
+    assert model.sensitivities(DigitalOption(strike=100, maturity=1)).delta > 0
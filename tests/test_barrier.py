@@ -0,0 +1,66 @@
+import math
+
+import numpy as np
+import pytest
+from optionkit.core.factory import create_option
+from optionkit.payoffs import BarrierOption, EuropeanOption
+from optionkit.models import BlackScholesModel, MonteCarloModel, HestonModel, MertonModel
+
+BS = BlackScholesModel(spot=100, rate=0.05, vol=0.25)
+DOWN_OUT = BarrierOption(strike=100, maturity=1, is_call=True, barrier=90,
+                         direction="down", knock="out")
+
+
+@pytest.mark.parametrize("is_call", [True, False])
+@pytest.mark.parametrize("direction,barrier", [("down", 90), ("up", 115)])
+@pytest.mark.parametrize("strike", [95, 110])
+def test_analytic_in_out_parity_and_exact_bridge(is_call, direction, barrier, strike):
+    kw = dict(strike=strike, maturity=1, is_call=is_call, barrier=barrier, direction=direction)
+    knock_in = BarrierOption(knock="in", rebate=2.0, **kw)
+    knock_out = BarrierOption(knock="out", rebate=2.0, **kw)
+    vanilla = BS.price(EuropeanOption(strike=strike, maturity=1, is_call=is_call))
+    # the rebate is paid exactly once, at expiry
+    assert BS.price(knock_in) + BS.price(knock_out) == pytest.approx(vanilla + 2 * math.exp(-0.05))
+
+    # Under GBM the one-step bridge from S0 to S_T is exact for continuous monitoring
+    mc = MonteCarloModel(spot=100, rate=0.05, vol=0.25, paths=200_000, seed=4)
+    for option in (knock_in, knock_out):
+        assert mc.price(option) == pytest.approx(BS.price(option), rel=0.01, abs=0.05)
+
+
+def test_already_breached_barrier():
+    hit = BarrierOption(strike=100, maturity=1, barrier=110, direction="down", knock="out", rebate=1.5)
+    assert BS.price(hit) == pytest.approx(1.5 * math.exp(-0.05))
+    knocked_in = BarrierOption(strike=100, maturity=1, barrier=110, direction="down", knock="in")
+    assert BS.price(knocked_in) == pytest.approx(BS.price(EuropeanOption(strike=100, maturity=1)))
+
+
+def test_bridge_removes_monitoring_bias_on_coarse_grid():
+    # lam=0: Merton reduces to GBM, so the analytic price is the target
+    model = MertonModel(spot=100, rate=0.05, vol=0.25, lam=0.0, mu_j=0.0, sigma_j=0.1,
+                        steps=50, paths=100_000, seed=1)
+    exact = BS.price(DOWN_OUT)
+    discrete = math.exp(-0.05) * float(np.mean(DOWN_OUT.path_values(model.simulate_paths(1.0))))
+    assert discrete - exact > 0.5                       # 50 monitoring dates miss crossings
+    assert model.price(DOWN_OUT) == pytest.approx(exact, abs=0.12)
+
+
+def test_heston_barrier_uses_stepwise_variance():
+    # sigma_v = 0 with theta = v0 keeps variance constant at 0.25**2
+    model = HestonModel(spot=100, rate=0.05, v0=0.0625, kappa=1.5, theta=0.0625, sigma_v=0.0,
+                        rho=0.0, steps=50, paths=100_000, seed=1)
+    assert model.price(DOWN_OUT) == pytest.approx(BS.price(DOWN_OUT), abs=0.15)
+
+
+def test_barrier_validation_and_factory():
+    opt = create_option("BarrierOption", strike=100, maturity=1, barrier=120,
+                        direction="up", knock="in")
+    assert isinstance(opt, BarrierOption)
+    assert opt.payoff(np.array([100.0, 125.0, 105.0])) == pytest.approx(5.0)
+    assert opt.payoff(np.array([100.0, 115.0, 105.0])) == 0.0
+    with pytest.raises(ValueError):
+        BarrierOption(strike=100, maturity=1)
+    with pytest.raises(ValueError):
+        BarrierOption(strike=100, maturity=1, barrier=90, direction="sideways")
+    with pytest.raises(ValueError):
+        DOWN_OUT.payoff_array(np.array([100.0]))
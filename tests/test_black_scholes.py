@@ -16,3 +16,14 @@ def test_call_price():
     price = model.price(option)
     # Reference value ~10.45 for S=100, K=100, r=5%, sigma=20%, T=1
     assert math.isclose(price, 10.45, rel_tol=1e-2)
+
+
+def test_price_batch_uses_the_shared_vectorized_kernel():
+    from optionkit.core.math_utils import bs_price, bs_price_vec
+    model = BlackScholesModel(spot=100, rate=0.05, vol=0.2)
+    K = [60.0, 100.0, 160.0]
+    for is_call in (True, False):
+        batch = model.price_batch(K, 1.0, is_call)
+        assert list(batch) == list(bs_price_vec(100, K, 1.0, 0.05, 0.2, is_call))
+        for k, p in zip(K, batch):
+            assert math.isclose(p, bs_price(100, k, 1.0, 0.05, 0.2, is_call), rel_tol=1e-12)
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+from optionkit.calibration import (
+    heston_prices, merton_prices, calibrate_heston, calibrate_merton,
+)
+from optionkit.models import BlackScholesModel, HestonModel, MertonModel
+from optionkit.payoffs import EuropeanOption
+
+SPOT, RATE = 100.0, 0.03
+MATURITIES = np.repeat([0.1, 0.25, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0], 25)
+STRIKES = np.tile(np.linspace(70, 140, 25), 8)
+IS_CALL = STRIKES >= SPOT
+
+HESTON_TRUE = dict(v0=0.05, kappa=1.8, theta=0.06, sigma_v=0.6, rho=-0.65)
+MERTON_TRUE = dict(vol=0.18, lam=0.6, mu_j=-0.2, sigma_j=0.25)
+
+
+def test_fourier_pricers_match_black_scholes_without_jumps():
+    K = np.array([70.0, 100.0, 130.0])
+    bs = BlackScholesModel(spot=SPOT, rate=RATE, vol=0.2)
+    for is_call in (True, False):
+        ref = bs.price_batch(K, 1.0, is_call)
+        got = merton_prices(SPOT, RATE, K, 1.0, is_call, vol=0.2, lam=0.0, mu_j=0.0, sigma_j=0.1)
+        assert got == pytest.approx(ref, abs=1e-8)
+
+
+def test_fourier_pricers_agree_with_monte_carlo():
+    option = EuropeanOption(strike=100, maturity=1.0, is_call=True)
+    heston = HestonModel(spot=SPOT, rate=RATE, **HESTON_TRUE, steps=100, paths=50_000, seed=1)
+    merton = MertonModel(spot=SPOT, rate=RATE, **MERTON_TRUE, steps=50, paths=50_000, seed=1)
+    assert heston.price(option) == pytest.approx(
+        heston_prices(SPOT, RATE, 100.0, 1.0, True, **HESTON_TRUE)[0], rel=0.02)
+    assert merton.price(option) == pytest.approx(
+        merton_prices(SPOT, RATE, 100.0, 1.0, True, **MERTON_TRUE)[0], rel=0.02)
+
+
+def test_heston_calibration_recovers_parameters():
+    quotes = heston_prices(SPOT, RATE, STRIKES, MATURITIES, IS_CALL, **HESTON_TRUE,
+                           n_nodes=512, u_max=400.0)
+    result = calibrate_heston(SPOT, RATE, STRIKES, MATURITIES, quotes, IS_CALL)
+    assert result.success and result.rmse < 1e-4
+    for name, value in HESTON_TRUE.items():
+        assert result.params[name] == pytest.approx(value, rel=1e-3)
+    assert isinstance(result.to_model(paths=1000), HestonModel)
+
+    # Warm start from the previous fit after a small market move
+    moved = calibrate_heston(SPOT, RATE, STRIKES, MATURITIES, quotes * 1.002, IS_CALL,
+                             x0=result.params)
+    assert moved.nfev <= result.nfev
+
+
+def test_merton_calibration_with_fixed_parameter():
+    quotes = merton_prices(SPOT, RATE, STRIKES, MATURITIES, IS_CALL, **MERTON_TRUE,
+                           n_nodes=512, u_max=400.0)
+    result = calibrate_merton(SPOT, RATE, STRIKES, MATURITIES, quotes, IS_CALL,
+                              fixed={"vol": 0.18})
+    assert result.params["vol"] == 0.18
+    for name in ("lam", "mu_j", "sigma_j"):
+        assert result.params[name] == pytest.approx(MERTON_TRUE[name], rel=1e-3)
+
+
+def test_calibration_rmse_with_zero_weights():
+    quotes = merton_prices(SPOT, RATE, STRIKES, MATURITIES, IS_CALL, **MERTON_TRUE)
+    weights = np.ones_like(quotes)
+    weights[::7] = 0.0
+    quotes[::7] += 5.0          # ignored quotes: only they carry pricing error
+    result = calibrate_merton(SPOT, RATE, STRIKES, MATURITIES, quotes, IS_CALL, weights=weights)
+    assert np.isfinite(result.rmse)
+    assert result.rmse == pytest.approx(5.0 * np.sqrt(np.mean(weights == 0)), rel=1e-3)
@@ -0,0 +1,89 @@
+import csv
+import io
+import json
+
+import pytest
+from optionkit.cli import main, price_rows
+from optionkit.models import BlackScholesModel
+from optionkit.payoffs import DigitalOption, EuropeanOption
+
+BS_PARAMS = {"spot": 100, "rate": 0.05, "vol": 0.2}
+BS = BlackScholesModel(**BS_PARAMS)
+
+
+def _jsonl_rows(n):
+    rows = [{"id": f"r{i}", "option_params": {"strike": 80 + i, "maturity": 1.0, "is_call": i % 2 == 0}}
+            for i in range(n)]
+    rows.append({"id": "bad", "option": "NoSuchOption", "option_params": {}})
+    rows.append({"id": "dig", "model": "BlackScholes", "model_params": {**BS_PARAMS, "vol": 0.3},
+                 "option": "DigitalOption", "option_params": {"strike": 100, "maturity": 1.0}})
+    return rows
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_jsonl_file_in_order_with_errors(tmp_path, capsys, workers):
+    src, dst = tmp_path / "rows.jsonl", tmp_path / "out.jsonl"
+    rows = _jsonl_rows(25)
+    src.write_text("".join(json.dumps(r) + "\n" for r in rows))
+    code = main([str(src), "-o", str(dst), "--workers", str(workers), "--chunk", "4",
+                 "--model-params", json.dumps(BS_PARAMS)])
+    out = [json.loads(line) for line in dst.read_text().splitlines()]
+
+    assert code == 1                                    # one row failed
+    assert [r["id"] for r in out] == [r["id"] for r in rows]
+    for row, res in zip(rows[:25], out):
+        expected = BS.price(EuropeanOption(**row["option_params"]))
+        assert res["price"] == pytest.approx(expected)
+    assert "NoSuchOption" in out[25]["error"]
+    digital = DigitalOption(strike=100, maturity=1.0)
+    assert out[26]["price"] == pytest.approx(BlackScholesModel(spot=100, rate=0.05, vol=0.3).price(digital))
+
+    summary = capsys.readouterr().err
+    assert "priced 27 rows (1 errors)" in summary and "rows/s" in summary
+    assert "BlackScholes" in summary
+
+
+def test_malformed_json_line_is_a_row_error(tmp_path, capsys):
+    src, dst = tmp_path / "rows.jsonl", tmp_path / "out.jsonl"
+    good = json.dumps({"option_params": {"strike": 100, "maturity": 1.0}})
+    src.write_text("\n".join([good, '{"option_params": {"strike": 1', "[1, 2]", good]) + "\n")
+    code = main([str(src), "-o", str(dst), "--workers", "0", "--quiet",
+                 "--model-params", json.dumps(BS_PARAMS)])
+    out = [json.loads(line) for line in dst.read_text().splitlines()]
+
+    assert code == 1
+    assert [r["id"] for r in out] == [0, 1, 2, 3]
+    assert "JSONDecodeError" in out[1]["error"] and "JSON object" in out[2]["error"]
+    assert out[0]["price"] == out[3]["price"] == pytest.approx(
+        BS.price(EuropeanOption(strike=100, maturity=1.0)))
+
+
+def test_csv_stdin_to_csv_stdout(monkeypatch, capsys):
+    text = ("strike,maturity,is_call,model.spot,model.rate,model.vol\n"
+            "90,0.5,true,100,0.05,0.2\n"
+            "110,1.0,false,100,0.05,0.25\n")
+    monkeypatch.setattr("sys.stdin", io.StringIO(text))
+    assert main(["--format", "csv", "--workers", "0", "--quiet"]) == 0
+    captured = capsys.readouterr()
+    out = list(csv.DictReader(io.StringIO(captured.out)))
+    assert captured.err == ""
+    assert [r["id"] for r in out] == ["0", "1"]
+    assert float(out[0]["price"]) == pytest.approx(BS.price(EuropeanOption(strike=90, maturity=0.5)))
+    assert float(out[1]["price"]) == pytest.approx(
+        BlackScholesModel(spot=100, rate=0.05, vol=0.25).price(
+            EuropeanOption(strike=110, maturity=1.0, is_call=False)))
+
+
+def test_bad_model_params_is_a_usage_error(capsys):
+    with pytest.raises(SystemExit) as exc:
+        main(["--model-params", "{spot: 100}", "--workers", "0"])
+    assert exc.value.code == 2
+    assert "--model-params is not valid JSON" in capsys.readouterr().err
+
+
+def test_rows_of_a_failing_model_are_counted():
+    rows = [{"id": i, "model": "NoSuchModel", "model_params": {}, "option": "EuropeanOption",
+             "option_params": {"strike": 100, "maturity": 1.0}} for i in range(3)]
+    results, timings = price_rows(rows)
+    assert all("NoSuchModel" in r["error"] for r in results)
+    assert timings["NoSuchModel"][0] == 3
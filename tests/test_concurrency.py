@@ -0,0 +1,40 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from optionkit.payoffs import EuropeanOption, AmericanOption
+from optionkit.models import (
+    BinomialTreeModel, TrinomialTreeModel, MonteCarloModel, HestonModel, MertonModel,
+)
+
+# Different maturities give different per-call lattice/time-step state, so any
+# state leaking through the shared instance shows up as a wrong price.
+OPTIONS = [
+    cls(strike=k, maturity=t, is_call=c)
+    for cls in (EuropeanOption, AmericanOption)
+    for k, t, c in [(90, 0.25, True), (100, 1.0, False), (110, 2.0, True), (100, 0.5, False)]
+]
+
+MODELS = [
+    BinomialTreeModel(spot=100, rate=0.05, vol=0.2, steps=60),
+    TrinomialTreeModel(spot=100, rate=0.05, vol=0.2, steps=30, smoothing=True, richardson=True),
+    TrinomialTreeModel(spot=100, rate=0.05, vol=0.2, steps=20, adaptive=True, tol=1e-4,
+                       max_steps=160),
+    MonteCarloModel(spot=100, rate=0.05, vol=0.2, paths=20_000, seed=7),
+    HestonModel(spot=100, rate=0.05, v0=0.04, kappa=2.0, theta=0.04,
+                sigma_v=0.3, rho=-0.7, steps=20, paths=5_000, seed=7),
+    MertonModel(spot=100, rate=0.05, vol=0.2, lam=0.5, mu_j=-0.1, sigma_j=0.2,
+                steps=20, paths=5_000, seed=7),
+]
+
+
+@pytest.mark.parametrize("model", MODELS, ids=lambda m: type(m).__name__)
+def test_shared_instance_prices_consistently_across_threads(model):
+    expected = [model.price(o) for o in OPTIONS]
+    before = repr(model)
+
+    jobs = OPTIONS * 8
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(model.price, jobs))
+
+    assert results == expected * 8
+    assert repr(model) == before  # no per-call state left on the instance
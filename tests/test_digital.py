@@ -0,0 +1,67 @@
+import copy
+import math
+
+import pytest
+from optionkit.payoffs import DigitalOption, EuropeanOption
+from optionkit.models import BlackScholesModel, MonteCarloModel, HestonModel, MertonModel
+
+GREEKS = ["delta", "gamma", "vega", "theta", "rho"]
+
+
+def _bump(model, option, greek, h=1e-4):
+    """Central finite difference of the closed-form price."""
+    if greek == "theta":
+        up, dn = copy.copy(option), copy.copy(option)
+        up.maturity += h
+        dn.maturity -= h
+        return -(model.price(up) - model.price(dn)) / (2 * h)
+    attr = {"delta": "spot", "gamma": "spot", "vega": "vol", "rho": "rate"}[greek]
+    up, dn = copy.copy(model), copy.copy(model)
+    setattr(up, attr, getattr(model, attr) + h)
+    setattr(dn, attr, getattr(model, attr) - h)
+    if greek == "gamma":
+        return (up.price(option) - 2 * model.price(option) + dn.price(option)) / h**2
+    return (up.price(option) - dn.price(option)) / (2 * h)
+
+
+@pytest.mark.parametrize("is_call", [True, False])
+def test_black_scholes_digital_closed_form(is_call):
+    model = BlackScholesModel(spot=100, rate=0.05, vol=0.2)
+    option = DigitalOption(strike=105, maturity=0.7, is_call=is_call, payout=3.0)
+    other = DigitalOption(strike=105, maturity=0.7, is_call=not is_call, payout=3.0)
+    assert model.price(option) + model.price(other) == pytest.approx(3.0 * math.exp(-0.05 * 0.7))
+    for greek in GREEKS:
+        h = 1e-2 if greek == "gamma" else 1e-4
+        assert getattr(model, greek)(option) == pytest.approx(_bump(model, option, greek, h),
+                                                              rel=1e-3, abs=1e-8)
+
+
+def test_black_scholes_price_many_handles_digitals():
+    model = BlackScholesModel(spot=100, rate=0.05, vol=0.2)
+    opts = [EuropeanOption(strike=100, maturity=1, is_call=True),
+            DigitalOption(strike=100, maturity=1, is_call=True, payout=2.0)]
+    assert model.price_many(opts) == pytest.approx([model.price(o) for o in opts])
+
+
+@pytest.mark.parametrize("is_call", [True, False])
+def test_monte_carlo_digital_price_and_likelihood_ratio_greeks(is_call):
+    bs = BlackScholesModel(spot=100, rate=0.05, vol=0.2)
+    mc = MonteCarloModel(spot=100, rate=0.05, vol=0.2, paths=200_000, seed=11)
+    option = DigitalOption(strike=105, maturity=1, is_call=is_call, payout=2.0)
+    assert mc.price(option) == pytest.approx(bs.price(option), rel=0.01)
+    for greek in GREEKS:
+        assert getattr(mc, greek)(option) == pytest.approx(getattr(bs, greek)(option), rel=0.1)
+
+
+@pytest.mark.parametrize("model", [
+    HestonModel(spot=100, rate=0.03, v0=0.04, kappa=1.5, theta=0.04, sigma_v=0.0, rho=0.0,
+                steps=20, paths=50_000),
+    MertonModel(spot=100, rate=0.03, vol=0.2, lam=0.0, mu_j=0.0, sigma_j=0.1,
+                steps=20, paths=50_000),
+])
+def test_adjoint_digital_greeks_reduce_to_black_scholes(model):
+    # sigma_v = 0 (Heston) and lam = 0 (Merton) collapse to GBM with 20% vol
+    bs = BlackScholesModel(spot=100, rate=0.03, vol=0.2)
+    option = DigitalOption(strike=100, maturity=1, is_call=True)
+    assert model.delta(option) == pytest.approx(bs.delta(option), rel=0.05)
+    assert model.gamma(option) == pytest.approx(bs.gamma(option), rel=0.15)
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+from optionkit.core import create_model
+from optionkit.payoffs import EuropeanOption, AmericanOption
+from optionkit.models import BlackScholesModel, FiniteDifferenceModel
+
+# American put, S=K=100, r=5%, sigma=20%, T=1 (BBSR binomial, N=2000)
+AMERICAN_PUT_REF = 6.0904
+
+
+@pytest.mark.parametrize("is_call", [True, False])
+def test_fd_matches_black_scholes_price_and_greeks(is_call):
+    option = EuropeanOption(strike=100, maturity=1, is_call=is_call)
+    bs = BlackScholesModel(spot=100, rate=0.05, vol=0.2)
+    sol = FiniteDifferenceModel(spot=100, rate=0.05, vol=0.2).solve(option)
+
+    assert abs(sol.price - bs.price(option)) < 2e-4
+    assert abs(sol.delta - bs.delta(option)) < 1e-4
+    assert abs(sol.gamma - bs.gamma(option)) < 1e-4
+
+
+def test_fd_profile_across_spot_from_one_solve():
+    option = EuropeanOption(strike=100, maturity=1, is_call=True)
+    sol = FiniteDifferenceModel(spot=100, rate=0.05, vol=0.2).solve(option)
+    bs_prices = [BlackScholesModel(spot=s, rate=0.05, vol=0.2).price(option) for s in (80, 120)]
+
+    fd_prices = np.interp([80, 120], sol.spots, sol.values)
+    assert fd_prices == pytest.approx(bs_prices, abs=5e-3)
+    inner = (sol.spots > 50) & (sol.spots < 200)
+    assert np.all(np.diff(sol.deltas[inner]) > 0)   # call delta increases with spot
+
+
+@pytest.mark.parametrize("solver", ["brennan_schwartz", "psor"])
+def test_fd_american_put(solver):
+    option = AmericanOption(strike=100, maturity=1, is_call=False)
+    model = create_model("FiniteDifference", spot=100, rate=0.05, vol=0.2, american=solver)
+    assert abs(model.price(option) - AMERICAN_PUT_REF) < 2e-3
+    assert model.gamma(option) > 0
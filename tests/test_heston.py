@@ -1,3 +1,5 @@
+import tracemalloc
+
 from optionkit.payoffs.european import EuropeanOption
 from optionkit.models.heston import HestonModel
 
@@ -11,3 +13,30 @@ def test_heston_mc_runs():
     )
     price = model.price(option)
     assert price > 0  # sanity check
+
+
+def test_heston_paths_do_not_keep_the_normals():
+    model = HestonModel(spot=100, rate=0.05, v0=0.04, kappa=2.0, theta=0.04,
+                        sigma_v=0.2, rho=-0.7, steps=50, paths=20_000)
+    grid = (model.steps + 1) * model.paths * 8
+    tracemalloc.start()
+    S, v = model.simulate_paths(1.0, return_variance=True)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert peak < 2.5 * grid                 # S and v only, no (steps, paths) normals
+
+
+def test_heston_adjoint_memory_is_a_small_multiple_of_pricing():
+    model = HestonModel(spot=100, rate=0.05, v0=0.04, kappa=2.0, theta=0.04,
+                        sigma_v=0.2, rho=-0.7, steps=100, paths=10_000)
+    option = EuropeanOption(strike=100, maturity=1, is_call=True)
+    peaks = []
+    for run in (model.price, model.sensitivities):
+        tracemalloc.start()
+        run(option)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    grid = (model.steps + 1) * model.paths * 8
+    assert peaks[1] < 10 * peaks[0]          # checkpointed replay, no stored normals
+    assert peaks[1] < grid
+    assert model.sensitivities(option).price == model.price(option)
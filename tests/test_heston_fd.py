@@ -0,0 +1,55 @@
+import pytest
+from optionkit.core import create_model
+from optionkit.calibration.fourier import heston_prices
+from optionkit.models import HestonModel, HestonFDModel
+from optionkit.payoffs import AmericanOption, AsianOption, EuropeanOption
+
+PARAMS = dict(spot=100, rate=0.03, v0=0.04, kappa=1.5, theta=0.04, sigma_v=0.5, rho=-0.7)
+HESTON = (PARAMS["v0"], PARAMS["kappa"], PARAMS["theta"], PARAMS["sigma_v"], PARAMS["rho"])
+
+
+def fourier(strike, is_call, spot=100.0, v0=PARAMS["v0"]):
+    return heston_prices(spot, PARAMS["rate"], [strike], [1.0], is_call, v0, *HESTON[1:])[0]
+
+
+@pytest.mark.parametrize("scheme", ["douglas", "craig_sneyd", "modified_craig_sneyd"])
+@pytest.mark.parametrize("strike,is_call", [(90, True), (100, False), (110, True)])
+def test_adi_matches_fourier_prices(scheme, strike, is_call):
+    option = EuropeanOption(strike=strike, maturity=1.0, is_call=is_call)
+    model = HestonFDModel(**PARAMS, scheme=scheme)
+    assert model.price(option) == pytest.approx(fourier(strike, is_call), abs=2e-2)
+
+
+def test_greeks_from_the_grid():
+    option = EuropeanOption(strike=100, maturity=1.0, is_call=True)
+    sol = HestonFDModel(**PARAMS).solve(option)
+    h, dsig = 0.01, 1e-4
+    up, mid, down = (fourier(100, True, spot=100 + k * h) for k in (1, 0, -1))
+    vol_up = fourier(100, True, v0=(0.2 + dsig) ** 2)
+    vol_down = fourier(100, True, v0=(0.2 - dsig) ** 2)
+
+    assert sol.delta == pytest.approx((up - down) / (2 * h), abs=1e-3)
+    assert sol.gamma == pytest.approx((up - 2 * mid + down) / h**2, abs=1e-4)
+    assert sol.vega == pytest.approx((vol_up - vol_down) / (2 * dsig), abs=5e-2)
+
+
+def test_american_exercise():
+    model = create_model("HestonFiniteDifference", **PARAMS)
+    put = model.price(AmericanOption(strike=100, maturity=1.0, is_call=False))
+    fine = HestonFDModel(**PARAMS, s_steps=200, v_steps=100, time_steps=200)
+    assert put > fourier(100, False) + 0.2
+    assert put == pytest.approx(fine.price(AmericanOption(strike=100, maturity=1.0, is_call=False)),
+                                abs=2e-2)
+    # No dividends: early exercise of a call is never optimal
+    call = model.price(AmericanOption(strike=100, maturity=1.0, is_call=True))
+    assert call == pytest.approx(model.price(EuropeanOption(strike=100, maturity=1.0)), abs=1e-4)
+
+
+def test_from_heston_and_validation():
+    mc = HestonModel(**PARAMS, paths=1000)
+    model = HestonFDModel.from_heston(mc, time_steps=25)
+    assert model.time_steps == 25 and model.sigma_v == PARAMS["sigma_v"]
+    with pytest.raises(ValueError):
+        model.price(AsianOption(strike=100, maturity=1.0))
+    with pytest.raises(ValueError):
+        HestonFDModel(**PARAMS, scheme="hundsdorfer_verwer")
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+from optionkit.models import BlackScholesModel, HestonModel
+from optionkit.payoffs import EuropeanOption
+from optionkit.service import IncrementalRepricer
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_book(budget=1e-3, clock=None):
+    book = IncrementalRepricer(BlackScholesModel(spot=100, rate=0.03, vol=0.2),
+                               budget=budget, max_age=30.0, clock=clock or FakeClock())
+    for i, K in enumerate(np.linspace(85, 115, 12)):
+        book.add(f"pos{i}", EuropeanOption(strike=float(K), maturity=0.25 + 0.25 * (i % 3),
+                                           is_call=bool(i % 2)), quantity=2.0)
+    return book
+
+
+def full_values(book, spot, vol):
+    model = BlackScholesModel(spot=spot, rate=0.03, vol=vol)
+    return np.array([2.0 * model.price(o) for o in book._options])
+
+
+def test_first_update_revalues_everything():
+    book = make_book()
+    report = book.update(spot=100)
+    assert len(report.revalued) == len(book) and not report.approximated
+    assert list(report.values.values()) == pytest.approx(full_values(book, 100, 0.2))
+
+
+def test_small_ticks_use_taylor_within_budget():
+    book = make_book()
+    book.update(spot=100)
+    for spot, vol in [(100.05, None), (100.2, 0.201), (99.7, None)]:
+        report = book.update(spot=spot, vol=vol)
+        assert not report.revalued and len(report.approximated) == len(book)
+        err = np.abs(np.array(list(report.values.values())) - full_values(book, spot, book.model.vol))
+        assert err.max() < 2e-3 and report.max_error < 1e-3
+
+
+def test_large_move_and_staleness_trigger_revaluation():
+    clock = FakeClock()
+    book = make_book(clock=clock)
+    book.update(spot=100)
+    report = book.update(spot=104)
+    assert report.revalued
+    assert list(report.values.values()) == pytest.approx(full_values(book, 104, 0.2), abs=2e-3)
+
+    clock.now = 31.0
+    report = book.update(spot=104)
+    assert sorted(report.revalued) == sorted(book._keys)
+
+
+def test_vol_update_needs_model_vol_and_unique_keys():
+    book = make_book()
+    with pytest.raises(ValueError):
+        book.add("pos0", EuropeanOption(strike=100, maturity=1))
+    heston = IncrementalRepricer(HestonModel(spot=100, rate=0.03, v0=0.04, kappa=2.0,
+                                             theta=0.04, sigma_v=0.5, rho=-0.7))
+    with pytest.raises(ValueError):
+        heston.update(vol=0.25)
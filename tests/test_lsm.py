@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+from optionkit.payoffs import EuropeanOption, AmericanOption
+from optionkit.models import HestonModel, MertonModel
+from optionkit.models.lsm import laguerre_basis
+
+# American put, S=K=100, r=5%, sigma=20%, T=1 (BBSR binomial, N=2000)
+AMERICAN_PUT_REF = 6.0904
+
+
+def test_laguerre_basis_matches_closed_form():
+    x = np.array([0.0, 0.5, 2.0])
+    L2 = 1 - 2 * x + 0.5 * x**2
+    assert laguerre_basis(x, 2)[:, 2] == pytest.approx(np.exp(-x / 2) * L2)
+
+
+@pytest.mark.parametrize("chunk", [None, 10_000])
+@pytest.mark.parametrize("basis", ["laguerre", "polynomial"])
+def test_lsm_without_jumps_matches_american_put(chunk, basis):
+    # lam=0 reduces Merton to GBM; 50 exercise dates slightly undervalue the American
+    model = MertonModel(spot=100, rate=0.05, vol=0.2, lam=0.0, mu_j=0.0, sigma_j=0.1,
+                        steps=50, paths=40_000, seed=3, lsm_basis=basis, lsm_chunk=chunk)
+    price = model.price(AmericanOption(strike=100, maturity=1, is_call=False))
+    assert AMERICAN_PUT_REF - 0.1 < price < AMERICAN_PUT_REF + 0.05
+
+
+def test_lsm_early_exercise_premium_under_heston_and_jumps():
+    amer = AmericanOption(strike=100, maturity=1, is_call=False)
+    euro = EuropeanOption(strike=100, maturity=1, is_call=False)
+    models = [
+        HestonModel(spot=100, rate=0.05, v0=0.04, kappa=2.0, theta=0.04,
+                    sigma_v=0.3, rho=-0.7, steps=50, paths=20_000, seed=5),
+        MertonModel(spot=100, rate=0.05, vol=0.2, lam=0.75, mu_j=-0.5, sigma_j=0.2,
+                    steps=50, paths=20_000, seed=5, lsm_chunk=5_000),
+    ]
+    for model in models:
+        assert model.price(amer) > model.price(euro) + 0.3
@@ -0,0 +1,53 @@
+import math
+
+import numpy as np
+import pytest
+from optionkit.payoffs import EuropeanOption, AmericanOption
+from optionkit.models import MonteCarloModel, HestonModel, MertonModel
+from optionkit.core.math_utils import bs_price
+
+CALL = EuropeanOption(strike=100, maturity=1, is_call=True)
+
+MODELS = [
+    lambda **kw: HestonModel(spot=100, rate=0.03, v0=0.04, kappa=1.5, theta=0.04,
+                             sigma_v=0.4, rho=-0.6, steps=50, paths=40_000, seed=1, **kw),
+    lambda **kw: MertonModel(spot=100, rate=0.03, vol=0.2, lam=0.5, mu_j=-0.1, sigma_j=0.15,
+                             steps=50, paths=40_000, seed=1, **kw),
+]
+
+
+def _stderr(model, T):
+    disc = math.exp(-model.rate * T)
+    payoff = CALL.payoff_array(model.simulate_paths(T)[-1])
+    return disc * payoff.std() / math.sqrt(payoff.size)
+
+
+def test_float32_rounding_is_far_below_mc_error():
+    # Same float32 normals evaluated in float64: rounding error only
+    model = MonteCarloModel(spot=100, rate=0.05, vol=0.2, paths=200_000, dtype="float32")
+    ST, Z = model.simulate_terminal(1.0)
+    assert ST.dtype == np.float32
+    exact = 100 * np.exp(0.05 - 0.02 + 0.2 * Z.astype(np.float64))
+    assert np.max(np.abs(ST / exact - 1)) < 2e-6
+
+
+def test_float32_monte_carlo_matches_black_scholes():
+    ref = bs_price(100, 100, 1, 0.05, 0.2)
+    for dtype in ("float64", "float32"):
+        model = MonteCarloModel(spot=100, rate=0.05, vol=0.2, paths=400_000, seed=3, dtype=dtype)
+        assert model.price(CALL) == pytest.approx(ref, abs=0.08)   # ~3 standard errors
+
+
+@pytest.mark.parametrize("make", MODELS)
+def test_float32_paths_agree_with_float64_within_sampling_error(make):
+    m64, m32 = make(), make(dtype="float32")
+    assert m32.simulate_paths(1.0).dtype == np.float32
+    se = _stderr(m64, 1.0)
+    assert abs(m32.price(CALL) - m64.price(CALL)) < 4 * math.sqrt(2) * se
+    put = AmericanOption(strike=100, maturity=1, is_call=False)
+    assert m32.price(put) == pytest.approx(m64.price(put), rel=0.03)
+
+
+def test_unsupported_dtype_rejected():
+    with pytest.raises(ValueError):
+        MonteCarloModel(spot=100, rate=0.05, vol=0.2, dtype="float16")
@@ -0,0 +1,72 @@
+import tracemalloc
+
+import numpy as np
+import pytest
+import optionkit.models  # noqa: F401
+from optionkit.core.factory import MODEL_REGISTRY, create_model
+from optionkit.payoffs import AsianOption
+from optionkit.profiling import (
+    ENGINE_CASES, EngineCase, MemoryBudget, MemoryBudgetExceeded, measure,
+    profile_engine, profile_engines, profile_scaling, scaling_exponent,
+)
+
+
+def test_measure_peak_and_retained():
+    keep = []
+    transient = measure(lambda: np.ones(1_000_000).sum(), size=1_000_000, unit="elements")
+    leak = measure(lambda: keep.append(np.ones(500_000)))
+
+    assert 8e6 <= transient.peak_bytes < 9e6
+    assert transient.retained_bytes < 1e5
+    assert transient.bytes_per_unit == pytest.approx(8, rel=0.1)
+    assert leak.retained_bytes >= 4e6 and leak.numpy_retained_bytes >= 4e6
+
+
+def test_budget_fails_when_exceeded():
+    profile = measure(lambda: np.zeros(1_000_000) + 1, size=1_000_000, unit="paths")
+    assert MemoryBudget(peak_bytes=64 * 2**20, bytes_per_unit=32).check(profile) is profile
+    with pytest.raises(MemoryBudgetExceeded, match="B/path"):
+        MemoryBudget(bytes_per_unit=4).check(profile)
+    with pytest.raises(MemoryBudgetExceeded, match="peak"):
+        profile_engine("MonteCarlo", 50_000, budget=MemoryBudget(peak_bytes=1024))
+
+
+def test_every_registered_model_has_a_workload():
+    assert set(MODEL_REGISTRY) <= set(ENGINE_CASES)
+    profiles = profile_engines(scale=0.1)
+    assert [p.label for p in profiles] == list(MODEL_REGISTRY)
+    assert all(p.peak_bytes > 0 and p.units > 0 for p in profiles)
+
+
+@pytest.mark.parametrize("name,sizes", [
+    ("MonteCarlo", [50_000, 100_000, 200_000]),
+    ("Heston", [10_000, 20_000, 40_000]),
+    ("BinomialTree", [100, 200, 400]),
+])
+def test_memory_is_linear_in_paths_and_nodes(name, sizes):
+    profiles = profile_scaling(name, sizes)
+    assert scaling_exponent(profiles) == pytest.approx(1.0, abs=0.15)
+
+
+def test_heston_terminal_pricing_is_independent_of_steps():
+    # Trimmed state: a handful of (paths,) slices, not (steps, paths) grids
+    profile = profile_engine("Heston", 20_000, budget=MemoryBudget(bytes_per_unit=160))
+    steps = 50
+    case = EngineCase(
+        lambda n: (create_model("Heston", spot=100.0, rate=0.03, v0=0.04, kappa=1.5, theta=0.04,
+                                sigma_v=0.5, rho=-0.7, steps=steps, paths=n),
+                   [AsianOption(strike=100.0, maturity=1.0)]),
+        lambda n: n, "paths", 2_000)
+    full = profile_engine("Heston", 2_000, case=case)
+    assert full.bytes_per_unit > steps * 8 > profile.bytes_per_unit
+
+
+def test_creation_log_is_bounded():
+    make = lambda: [create_model("BlackScholes", spot=100.0, rate=0.03, vol=0.2) for _ in range(12_000)]
+    tracemalloc.start()
+    try:
+        make()                                      # fill the log to its bound
+        profile = measure(make)
+    finally:
+        tracemalloc.stop()
+    assert profile.retained_bytes < 256 * 1024 < profile.peak_bytes
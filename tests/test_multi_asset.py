@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+from optionkit.core.factory import create_option
+from optionkit.core.math_utils import kirk_spread_price, margrabe_price
+from optionkit.models import BlackScholesModel, MultiAssetMonteCarloModel
+from optionkit.payoffs import BasketOption, EuropeanOption, SpreadOption
+from optionkit.simulation import CorrelatedGBM, correlation_factor
+
+CORR3 = np.array([[1.0, 0.5, 0.3], [0.5, 1.0, 0.4], [0.3, 0.4, 1.0]])
+SPOTS3, VOLS3 = [100, 95, 105], [0.2, 0.25, 0.3]
+CORR2 = [[1.0, 0.6], [0.6, 1.0]]
+
+
+@pytest.mark.parametrize("method", ["cholesky", "pca"])
+def test_factorization_and_sample_correlation(method):
+    L = correlation_factor(CORR3, method)
+    assert L @ L.T == pytest.approx(CORR3)
+    gen = CorrelatedGBM(SPOTS3, VOLS3, CORR3, rate=0.03, paths=200_000, factorization=method)
+    ST = gen.simulate_terminal(1.0)
+    assert ST.shape == (3, 200_000)
+    assert np.corrcoef(np.log(ST)) == pytest.approx(CORR3, abs=0.01)
+    # martingale check: E[S_T] = S_0 e^{rT}
+    assert ST.mean(axis=1) == pytest.approx(np.array(SPOTS3) * np.exp(0.03), rel=0.005)
+
+
+def test_semidefinite_correlation_needs_pca():
+    ones = np.ones((2, 2))
+    with pytest.raises(ValueError):
+        correlation_factor(ones, "cholesky")
+    L = correlation_factor(ones, "pca")
+    assert L @ L.T == pytest.approx(ones)
+    with pytest.raises(ValueError):
+        correlation_factor([[1.0, 0.2], [0.3, 1.0]])
+
+
+def test_chunking_does_not_change_the_stream():
+    option = BasketOption(strike=100, maturity=1, weights=(0.5, 0.3, 0.2))
+    prices = [MultiAssetMonteCarloModel(SPOTS3, VOLS3, CORR3, 0.03, paths=50_000, chunk=c).price(option)
+              for c in (1_000, 7_919, 50_000)]
+    assert prices == pytest.approx([prices[0]] * 3, rel=1e-12)
+
+
+@pytest.mark.parametrize("kw", [{}, {"sobol": True}, {"sobol": True, "factorization": "pca"},
+                                {"dtype": "float32"}])
+def test_single_weight_basket_matches_black_scholes(kw):
+    model = MultiAssetMonteCarloModel([100, 95], [0.2, 0.25], [[1, 0.3], [0.3, 1]], 0.03,
+                                      paths=2**17, **kw)
+    for is_call in (True, False):
+        basket = BasketOption(strike=100, maturity=1, is_call=is_call, weights=(1.0, 0.0))
+        bs = BlackScholesModel(spot=100, rate=0.03, vol=0.2).price(
+            EuropeanOption(strike=100, maturity=1, is_call=is_call))
+        assert model.price(basket) == pytest.approx(bs, abs=0.1)
+
+
+def test_exchange_option_is_exact_with_control_variate():
+    model = MultiAssetMonteCarloModel([110, 100], [0.3, 0.2], CORR2, 0.03, paths=20_000)
+    for is_call in (True, False):
+        option = SpreadOption(strike=0, maturity=1, is_call=is_call)
+        exact = margrabe_price(110, 100, 1, 0.3, 0.2, 0.6, is_call)
+        assert model.kirk_price(option) == pytest.approx(exact)
+        assert model.price(option) == pytest.approx(exact, rel=1e-10)
+
+
+@pytest.mark.parametrize("strike", [5, 20])
+@pytest.mark.parametrize("is_call", [True, False])
+def test_spread_control_variate_reduces_error(strike, is_call):
+    option = SpreadOption(strike=strike, maturity=1, is_call=is_call)
+    ref = MultiAssetMonteCarloModel([110, 100], [0.3, 0.2], CORR2, 0.03, paths=2_000_000,
+                                    seed=7, control_variate=False).price(option)
+    errors = {cv: [] for cv in (True, False)}
+    for seed in range(5):
+        for cv in (True, False):
+            model = MultiAssetMonteCarloModel([110, 100], [0.3, 0.2], CORR2, 0.03,
+                                              paths=20_000, seed=seed, control_variate=cv)
+            errors[cv].append(model.price(option) - ref)
+    assert np.std(errors[True]) < 0.5 * np.std(errors[False])
+    assert np.mean(errors[True]) == pytest.approx(0.0, abs=0.05)
+    # Kirk is an approximation, but a close one at these strikes
+    assert kirk_spread_price(110, 100, strike, 1, 0.03, 0.3, 0.2, 0.6, is_call) == pytest.approx(ref, abs=0.05)
+
+
+def test_registry_and_validation():
+    option = create_option("SpreadOption", strike=1.0, maturity=1.0, legs=(2, 0))
+    assert option.payoff([100.0, 0.0, 105.0]) == pytest.approx(4.0)
+    assert create_option("BasketOption", strike=100, maturity=1, weights=[0.5, 0.5]).weights == (0.5, 0.5)
+    model = MultiAssetMonteCarloModel([110, 100], [0.3, 0.2], CORR2, 0.03, paths=1_000)
+    with pytest.raises(ValueError):
+        model.price(BasketOption(strike=100, maturity=1, weights=(1.0, 1.0, 1.0)))
+    with pytest.raises(ValueError):
+        model.price(option)
+    with pytest.raises(ValueError):
+        SpreadOption(strike=0, maturity=1, legs=(1, 1))
+    with pytest.raises(ValueError, match="EuropeanOption"):
+        model.price(EuropeanOption(strike=100, maturity=1))   # single-asset payoff
+
+
+def test_per_asset_greeks():
+    model = MultiAssetMonteCarloModel([110, 100], [0.3, 0.2], CORR2, 0.03, paths=50_000)
+    option = SpreadOption(strike=0, maturity=1)
+    delta, vega = model.delta(option), model.vega(option)
+    assert delta.shape == (2,) and delta[0] > 0 > delta[1]
+    # exchange option value is homogeneous of degree one in the spots (Euler)
+    assert float(np.dot(delta, [110, 100])) == pytest.approx(model.price(option), rel=1e-3)
+    assert vega[0] > 0
@@ -0,0 +1,88 @@
+import os
+
+import numpy as np
+import pytest
+from optionkit.core import OptionBatch
+from optionkit.payoffs import EuropeanOption, DigitalOption, BarrierOption, BasketOption
+from optionkit.models import BlackScholesModel
+
+OPTIONS = [
+    EuropeanOption(strike=100, maturity=1.0, is_call=True),
+    DigitalOption(strike=90, maturity=0.5, is_call=False, payout=3.0),
+    BarrierOption(strike=100, maturity=1.0, barrier=80, direction="down", knock="in", rebate=1.0),
+    EuropeanOption(strike=110, maturity=0.5, is_call=False),
+]
+
+
+def test_round_trip_through_rows():
+    batch = OptionBatch.from_options(OPTIONS)
+    assert len(batch) == 4
+    assert batch.to_options() == OPTIONS
+    assert batch[2] == OPTIONS[2]
+    assert np.isnan(batch.columns["payout"][0])
+
+
+@pytest.mark.parametrize("fmt", ["csv", "npz"])
+def test_file_round_trip(tmp_path, fmt):
+    batch = OptionBatch.from_options(OPTIONS)
+    path = tmp_path / f"chain.{fmt}"
+    getattr(batch, f"to_{fmt}")(path)
+    loaded = getattr(OptionBatch, f"from_{fmt}")(path)
+    assert loaded.to_options() == OPTIONS
+
+
+def test_csv_loader_defaults_and_bool_parsing(tmp_path):
+    path = tmp_path / "chain.csv"
+    path.write_text("strike,maturity,is_call\n100,1,call\n95,0.5,put\n105,0.5,1\n")
+    batch = OptionBatch.from_csv(path)
+    assert batch.types == ("EuropeanOption",)
+    assert batch.is_call.tolist() == [True, False, True]
+    assert batch.strike.tolist() == [100, 95, 105]
+
+
+def test_csv_loader_reads_a_pipe_once(tmp_path):
+    batch = OptionBatch.from_options(OPTIONS)
+    batch.to_csv(tmp_path / "chain.csv")
+    r, w = os.pipe()
+    with os.fdopen(w, "w") as fh:
+        fh.write((tmp_path / "chain.csv").read_text())
+    with os.fdopen(r, newline="") as fh:
+        assert not fh.seekable()
+        loaded = OptionBatch.from_csv(fh)
+    assert loaded.to_options() == OPTIONS
+    assert np.isnan(loaded.columns["barrier"][0])
+
+
+def test_from_options_rejects_sequence_fields():
+    with pytest.raises(ValueError, match="BasketOption.weights"):
+        OptionBatch.from_options([BasketOption(strike=100, maturity=1, weights=(0.5, 0.5))])
+
+
+def test_parquet_round_trip(tmp_path):
+    pytest.importorskip("pyarrow")
+    batch = OptionBatch.from_options(OPTIONS)
+    batch.to_parquet(tmp_path / "chain.parquet")
+    assert OptionBatch.from_parquet(tmp_path / "chain.parquet").to_options() == OPTIONS
+
+
+def test_slicing_is_zero_copy_and_grouping():
+    batch = OptionBatch(np.linspace(80, 120, 9), [0.5, 1.0, 0.5, 1.0, 0.5, 1.0, 0.5, 1.0, 0.5],
+                        is_call=True)
+    view = batch[2:5]
+    assert np.shares_memory(view.strike, batch.strike)
+    groups = dict(batch.groupby(("maturity",)))
+    assert sorted(groups) == [(0.5,), (1.0,)]
+    assert len(groups[(0.5,)]) == 5 and np.all(groups[(1.0,)].maturity == 1.0)
+    by_type = dict(OptionBatch.from_options(OPTIONS).groupby())
+    assert ("EuropeanOption", 0.5) in by_type and len(by_type) == 4
+
+
+def test_black_scholes_prices_batch_without_building_rows(monkeypatch):
+    model = BlackScholesModel(spot=100, rate=0.05, vol=0.2)
+    batch = OptionBatch.from_options(OPTIONS)
+    expected = [model.price(o) for o in OPTIONS]
+
+    def no_rows(self, i):
+        raise AssertionError("row object built")
+    monkeypatch.setattr(OptionBatch, "option", no_rows)
+    assert model.price_many(batch) == pytest.approx(expected)
@@ -0,0 +1,90 @@
+import os
+import time
+
+import numpy as np
+import pytest
+from optionkit.payoffs import EuropeanOption, AmericanOption
+from optionkit.models import HestonModel, MertonModel
+from optionkit.simulation import PathStore
+
+
+def heston(**kw):
+    return HestonModel(spot=100, rate=0.03, v0=0.04, kappa=1.5, theta=0.04,
+                       sigma_v=0.4, rho=-0.6, steps=20, paths=2_000, seed=5, **kw)
+
+
+def test_store_round_trip_is_read_only_memmap(tmp_path):
+    store = PathStore(tmp_path)
+    model = heston()
+    first = store.get(model, 1.0)
+    assert store.load(model, 1.0) is not None
+    again = store.get(model, 1.0)
+    assert isinstance(again, np.memmap)
+    assert not again.flags.writeable
+    np.testing.assert_array_equal(again, model.simulate_paths(1.0))
+    np.testing.assert_array_equal(first, again)
+
+
+def test_key_depends_on_parameters_seed_and_grid(tmp_path):
+    store = PathStore(tmp_path)
+    base = store.key(heston(), 1.0)
+    assert store.key(heston(), 1.0) == base
+    assert store.key(heston(lsm_degree=2), 1.0) == base   # not a simulation input
+    other = [store.key(heston(), 2.0), store.key(heston(), 1.0, kind="terminal")]
+    m = heston(); m.seed = 6; other.append(store.key(m, 1.0))
+    m = heston(); m.steps = 40; other.append(store.key(m, 1.0))
+    assert base not in other and len(set(other)) == len(other)
+
+
+@pytest.mark.parametrize("make", [heston, lambda **kw: MertonModel(
+    spot=100, rate=0.03, vol=0.2, lam=0.5, mu_j=-0.1, sigma_j=0.15,
+    steps=20, paths=2_000, seed=5, **kw)])
+def test_prices_unchanged_with_store(tmp_path, make):
+    store = PathStore(tmp_path)
+    plain, cached = make(), make(path_store=store)
+    for opt in (EuropeanOption(strike=100, maturity=1, is_call=True),
+                AmericanOption(strike=100, maturity=1, is_call=False)):
+        expected = plain.price(opt)
+        assert cached.price(opt) == pytest.approx(expected, rel=1e-12)
+        assert cached.price(opt) == pytest.approx(expected, rel=1e-12)   # from disk
+    assert len(store.entries()) == 2    # terminal row + full paths
+
+
+def test_eviction_by_size_and_age(tmp_path):
+    model = heston()
+    store = PathStore(tmp_path)
+    for T in (0.5, 1.0, 1.5):
+        store.get(model, T, kind="terminal")
+    oldest = store.entries()[0][0]
+    past = time.time() - 3600
+    os.utime(oldest, (past, past))
+
+    store.max_age = 600
+    assert store.evict() == 1
+    assert not oldest.exists() and len(store.entries()) == 2
+
+    store.max_age = None
+    store.max_bytes = store.entries()[-1][1]
+    assert store.evict() == 1
+    assert len(store.entries()) == 1
+    store.clear()
+    assert store.size == 0
+
+
+def test_load_from_read_only_store_and_versioned_key(tmp_path, monkeypatch):
+    import optionkit.simulation.path_store as path_store
+    store = PathStore(tmp_path)
+    model = heston()
+    stored = np.array(store.get(model, 1.0, kind="terminal"))
+    assert not list(tmp_path.glob("*.tmp.*"))
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+    def read_only(*args, **kwargs):
+        raise PermissionError("read-only file system")
+    monkeypatch.setattr(path_store.os, "utime", read_only)
+    np.testing.assert_array_equal(store.load(model, 1.0, kind="terminal"), stored)
+
+    key = store.key(model, 1.0)
+    monkeypatch.setattr(path_store, "FORMAT_VERSION", path_store.FORMAT_VERSION + 1)
+    assert store.key(model, 1.0) != key
+    assert store.load(model, 1.0, kind="terminal") is None
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+from optionkit.calibration.fourier import merton_prices
+from optionkit.models import BlackScholesModel, HestonModel, MertonModel, MonteCarloModel
+from optionkit.models.sequential import RunningStats
+from optionkit.payoffs import AmericanOption, BarrierOption, EuropeanOption
+
+MC = MonteCarloModel(spot=100, rate=0.05, vol=0.2, paths=100_000, seed=11)
+BS = BlackScholesModel(spot=100, rate=0.05, vol=0.2)
+MERTON = dict(vol=0.2, lam=0.5, mu_j=-0.1, sigma_j=0.15)
+
+
+def test_running_stats_match_numpy():
+    rng = np.random.default_rng(0)
+    x = rng.lognormal(size=12_345)
+    stats = RunningStats()
+    for chunk in np.array_split(x, [1, 7, 1000, 5000]):
+        stats.update(chunk)
+    assert stats.count == x.size
+    assert stats.mean == pytest.approx(x.mean(), rel=1e-12)
+    assert stats.variance == pytest.approx(x.var(ddof=1), rel=1e-10)
+
+
+def test_stops_at_relative_target_with_valid_interval():
+    option = EuropeanOption(strike=100, maturity=1.0)
+    est = MC.price_to_precision(option, rel_tol=0.005, batch=5_000)
+    exact = BS.price(option)
+    assert est.converged and est.stderr <= 0.005 * est.price
+    assert est.paths % 5_000 == 0 and est.paths < 1_000_000
+    assert est.ci_low < est.price < est.ci_high
+    assert est.ci_high - est.ci_low == pytest.approx(2 * 1.959964 * est.stderr, rel=1e-5)
+    assert abs(est.price - exact) < 4 * est.stderr
+
+
+def test_out_of_the_money_options_get_more_paths():
+    atm = MC.price_to_precision(EuropeanOption(strike=100, maturity=1.0), rel_tol=0.01)
+    otm = MC.price_to_precision(EuropeanOption(strike=140, maturity=1.0), rel_tol=0.01)
+    assert atm.converged and otm.converged
+    assert otm.paths > 5 * atm.paths
+
+
+def test_budget_exhausted_and_zero_payoffs_do_not_converge():
+    est = MC.price_to_precision(EuropeanOption(strike=200, maturity=1.0), rel_tol=1e-3, max_paths=50_000)
+    assert not est.converged and est.paths == 50_000
+    # never hit: a zero standard error is not evidence of precision
+    est = MC.price_to_precision(EuropeanOption(strike=1_000, maturity=1.0), abs_tol=1.0, max_paths=30_000)
+    assert not est.converged and est.price == 0.0 and est.paths == 30_000
+
+
+def test_full_budget_reproduces_fixed_path_price():
+    option = EuropeanOption(strike=105, maturity=1.0)
+    est = MC.price_to_precision(option, abs_tol=0.0, max_paths=MC.paths, batch=7_000)
+    assert est.paths == MC.paths
+    assert est.price == pytest.approx(MC.price(option), rel=1e-12)
+
+
+def test_jump_and_stochastic_vol_engines():
+    merton = MertonModel(spot=100, rate=0.03, seed=5, **MERTON)
+    est = merton.price_to_precision(EuropeanOption(strike=110, maturity=1.0), abs_tol=0.02)
+    ref = float(np.squeeze(merton_prices(100, 0.03, [110], [1.0], True, **MERTON)))
+    assert est.converged and abs(est.price - ref) < 4 * est.stderr
+
+    heston = HestonModel(spot=100, rate=0.03, v0=0.04, kappa=1.5, theta=0.05, sigma_v=0.2,
+                         rho=-0.7, steps=25)
+    est = heston.price_to_precision(BarrierOption(strike=100, maturity=1.0, barrier=85), abs_tol=0.1)
+    assert est.converged and est.stderr <= 0.1
+    with pytest.raises(ValueError):
+        heston.price_to_precision(AmericanOption(strike=100, maturity=1.0), abs_tol=0.1)
+    with pytest.raises(ValueError):
+        MC.price_to_precision(EuropeanOption(strike=100, maturity=1.0))
@@ -0,0 +1,116 @@
+import asyncio
+import json
+
+import pytest
+from optionkit.service import PricingService, MicroBatcher
+from optionkit.payoffs import AsianOption, EuropeanOption
+from optionkit.models import BlackScholesModel
+
+BS_PARAMS = {"spot": 100, "rate": 0.05, "vol": 0.2}
+
+
+def _request(i, strike, model="BlackScholes", params=BS_PARAMS):
+    return {
+        "id": i, "model": model, "model_params": params,
+        "option": "EuropeanOption",
+        "option_params": {"strike": strike, "maturity": 1.0, "is_call": True},
+    }
+
+
+def test_black_scholes_price_many_matches_scalar():
+    model = BlackScholesModel(**BS_PARAMS)
+    options = [EuropeanOption(strike=k, maturity=t, is_call=c)
+               for k, t, c in [(80, 0.5, True), (100, 1.0, False), (120, 2.0, True)]]
+    batch = model.price_many(options)
+    assert batch == pytest.approx([model.price(o) for o in options], rel=1e-12)
+
+
+def test_batcher_coalesces_concurrent_requests():
+    async def run():
+        batcher = MicroBatcher(window=0.01, max_batch=1000)
+        options = [EuropeanOption(strike=80 + i, maturity=1.0) for i in range(40)]
+        prices = await asyncio.gather(
+            *(batcher.submit("BlackScholes", BS_PARAMS, o) for o in options)
+        )
+        return batcher.metrics, options, prices
+
+    metrics, options, prices = asyncio.run(run())
+    model = BlackScholesModel(**BS_PARAMS)
+    assert prices == pytest.approx([model.price(o) for o in options])
+    assert metrics.batches == 1 and metrics.batched_requests == 40
+
+
+def test_batcher_failure_only_affects_the_bad_request():
+    params = {"spot": 100, "rate": 0.03, "v0": 0.04, "kappa": 1.5, "theta": 0.04,
+              "sigma_v": 0.5, "rho": -0.7, "s_steps": 40, "v_steps": 20, "time_steps": 10}
+    good = [EuropeanOption(strike=k, maturity=1.0) for k in (90, 110)]
+
+    async def run():
+        batcher = MicroBatcher(window=0.01)
+        options = [good[0], AsianOption(strike=100, maturity=1.0), good[1]]
+        return await asyncio.gather(
+            *(batcher.submit("HestonFiniteDifference", params, o) for o in options),
+            return_exceptions=True,
+        ), batcher.metrics
+
+    results, metrics = asyncio.run(run())
+    assert metrics.batches == 1
+    assert isinstance(results[1], ValueError)
+    assert results[0] > results[2] > 0
+
+
+def test_service_replies_to_every_line():
+    async def run():
+        service = PricingService(window=0.001)
+        server = await service.start_tcp("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        lines = [b"[1]", b"3", b'"x"', b"{not json", json.dumps(_request(1, 100)).encode()]
+        for line in lines:
+            writer.write(line + b"\n")
+        await writer.drain()
+        replies = [json.loads(await asyncio.wait_for(reader.readline(), 5)) for _ in lines]
+        writer.close()
+        await service.close()
+        return replies
+
+    replies = asyncio.run(run())
+    assert sum("error" in r for r in replies) == 4
+    assert [r["price"] for r in replies if "price" in r] == pytest.approx(
+        [BlackScholesModel(**BS_PARAMS).price(EuropeanOption(strike=100, maturity=1.0))])
+
+
+def test_tcp_service_round_trip_and_metrics():
+    async def run():
+        service = PricingService(window=0.005, max_pending=8)
+        server = await service.start_tcp("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+
+        requests = [_request(i, 80 + i) for i in range(30)]
+        requests.append(_request("bad", 100, model="NopeModel"))
+        for req in requests:
+            writer.write(json.dumps(req).encode() + b"\n")
+        await writer.drain()
+        replies = [json.loads(await reader.readline()) for _ in requests]
+
+        writer.write(b'{"op": "metrics"}\n')
+        await writer.drain()
+        metrics = json.loads(await reader.readline())["metrics"]
+
+        writer.close()
+        await service.close()
+        return replies, metrics
+
+    replies, metrics = asyncio.run(run())
+    by_id = {r["id"]: r for r in replies}
+    model = BlackScholesModel(**BS_PARAMS)
+    for i in range(30):
+        expected = model.price(EuropeanOption(strike=80 + i, maturity=1.0))
+        assert by_id[i]["price"] == pytest.approx(expected)
+    assert "not found" in by_id["bad"]["error"]
+
+    assert metrics["requests"] == 31 and metrics["errors"] == 1
+    assert metrics["max_in_flight"] <= 8          # backpressure limit honoured
+    assert metrics["batches"] < 31                # requests were coalesced
+    assert metrics["latency_p99_ms"] > 0
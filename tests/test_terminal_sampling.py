@@ -0,0 +1,78 @@
+import tracemalloc
+
+import numpy as np
+import pytest
+from optionkit.calibration.fourier import merton_prices
+from optionkit.core import is_terminal_payoff
+from optionkit.models import (BinomialTreeModel, BlackScholesModel, FiniteDifferenceModel,
+                              HestonModel, MertonModel, MonteCarloModel, TrinomialTreeModel)
+from optionkit.payoffs import (AmericanOption, AsianOption, BarrierOption, BasketOption,
+                               DigitalOption, EuropeanOption, SpreadOption)
+
+MERTON = dict(vol=0.2, lam=0.5, mu_j=-0.1, sigma_j=0.15)
+HESTON = dict(v0=0.04, kappa=1.5, theta=0.05, sigma_v=0.2, rho=-0.7)
+
+
+def test_terminal_payoff_classification():
+    assert is_terminal_payoff(EuropeanOption(strike=100, maturity=1))
+    assert is_terminal_payoff(DigitalOption(strike=100, maturity=1))
+    assert not is_terminal_payoff(AmericanOption(strike=100, maturity=1))
+    assert not is_terminal_payoff(AsianOption(strike=100, maturity=1))
+    assert not is_terminal_payoff(BarrierOption(strike=100, maturity=1, barrier=90))
+    assert not is_terminal_payoff(BasketOption(strike=100, maturity=1, weights=(0.5, 0.5)))
+    assert not is_terminal_payoff(SpreadOption(strike=0, maturity=1))
+
+
+@pytest.mark.parametrize("model", [
+    BlackScholesModel(spot=100, rate=0.03, vol=0.2),
+    MonteCarloModel(spot=100, rate=0.03, vol=0.2, paths=1_000),
+    HestonModel(spot=100, rate=0.03, steps=10, paths=1_000, **HESTON),
+    MertonModel(spot=100, rate=0.03, steps=10, paths=1_000, **MERTON),
+    BinomialTreeModel(spot=100, rate=0.03, vol=0.2, steps=20),
+    TrinomialTreeModel(spot=100, rate=0.03, vol=0.2, steps=20),
+    FiniteDifferenceModel(spot=100, rate=0.03, vol=0.2),
+], ids=lambda m: type(m).__name__)
+def test_single_asset_engines_reject_multi_asset_options(model):
+    for option in (BasketOption(strike=100, maturity=1, weights=(0.5, 0.5)),
+                   SpreadOption(strike=0, maturity=1)):
+        with pytest.raises(TypeError, match="single-asset"):
+            model.price(option)
+        with pytest.raises(TypeError, match="single-asset"):
+            model.price_many([option])
+
+
+@pytest.mark.parametrize("is_call", [True, False])
+def test_merton_exact_terminal_sample_matches_fourier(is_call):
+    model = MertonModel(spot=100, rate=0.03, paths=400_000, seed=1, **MERTON)
+    for K in (80, 100, 120):
+        ref = float(np.squeeze(merton_prices(100, 0.03, [K], [1.0], is_call, **MERTON)))
+        assert model.price(EuropeanOption(strike=K, maturity=1.0, is_call=is_call)) == pytest.approx(ref, rel=0.01, abs=0.05)
+
+
+def test_merton_exact_sample_agrees_with_stepped_paths():
+    model = MertonModel(spot=100, rate=0.03, steps=50, paths=100_000, seed=3, **MERTON)
+    exact, stepped = model.sample_terminal(1.0), model.simulate_paths(1.0)[-1]
+    assert exact.shape == stepped.shape
+    for q in (0.05, 0.25, 0.5, 0.75, 0.95):
+        assert np.quantile(exact, q) == pytest.approx(np.quantile(stepped, q), rel=0.01)
+
+
+def test_heston_trimmed_state_matches_full_grid_with_less_memory():
+    model = HestonModel(spot=100, rate=0.03, steps=100, paths=20_000, seed=4, **HESTON)
+    full = model.simulate_paths(1.0)
+    np.testing.assert_array_equal(model.sample_terminal(1.0), full[-1])
+
+    tracemalloc.start()
+    model.price(EuropeanOption(strike=100, maturity=1.0))
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert peak < full.nbytes / 5
+
+
+def test_path_dependent_payoffs_still_use_full_paths():
+    model = MertonModel(spot=100, rate=0.03, steps=20, paths=5_000, seed=2, **MERTON)
+    asian = model.price(AsianOption(strike=100, maturity=1.0))
+    S = model.simulate_paths(1.0)
+    expected = np.exp(-0.03) * np.mean(np.maximum(S.mean(axis=0) - 100, 0.0))
+    assert asian == pytest.approx(expected, rel=1e-12)
+    assert asian < model.price(EuropeanOption(strike=100, maturity=1.0))
@@ -0,0 +1,41 @@
+import pytest
+from optionkit.payoffs import EuropeanOption, AmericanOption, DigitalOption
+from optionkit.models import BinomialTreeModel, TrinomialTreeModel, BlackScholesModel
+
+# American put, S=K=100, r=5%, sigma=20%, T=1 (BBSR binomial, N=2000)
+AMERICAN_PUT_REF = 6.0904
+
+
+@pytest.mark.parametrize("cls", [BinomialTreeModel, TrinomialTreeModel])
+@pytest.mark.parametrize("is_call", [True, False])
+def test_bbsr_matches_black_scholes_with_few_steps(cls, is_call):
+    option = EuropeanOption(strike=100, maturity=1, is_call=is_call)
+    bs_price = BlackScholesModel(spot=100, rate=0.05, vol=0.2).price(option)
+
+    plain = cls(spot=100, rate=0.05, vol=0.2, steps=50).price(option)
+    fast = cls(spot=100, rate=0.05, vol=0.2, steps=50,
+               smoothing=True, richardson=True).price(option)
+
+    assert abs(fast - bs_price) < 1e-3
+    assert abs(fast - bs_price) < abs(plain - bs_price)
+
+
+@pytest.mark.parametrize("cls", [BinomialTreeModel, TrinomialTreeModel])
+def test_accelerated_american_put(cls):
+    option = AmericanOption(strike=100, maturity=1, is_call=False)
+    model = cls(spot=100, rate=0.05, vol=0.2, steps=50, smoothing=True, richardson=True)
+    assert abs(model.price(option) - AMERICAN_PUT_REF) < 2e-3
+
+
+def test_early_exercise_premium_on_trees():
+    euro = EuropeanOption(strike=100, maturity=1, is_call=False)
+    amer = AmericanOption(strike=100, maturity=1, is_call=False)
+    model = BinomialTreeModel(spot=100, rate=0.05, vol=0.2, steps=100)
+    assert model.price(amer) > model.price(euro) + 0.4
+
+
+def test_smoothing_rejects_non_vanilla_payoffs():
+    option = DigitalOption(strike=100, maturity=1, is_call=True)
+    model = BinomialTreeModel(spot=100, rate=0.05, vol=0.2, steps=20, smoothing=True)
+    with pytest.raises(ValueError):
+        model.price(option)
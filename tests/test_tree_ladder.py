@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+from optionkit.models import BinomialTreeModel, TrinomialTreeModel
+from optionkit.payoffs import AmericanOption, DigitalOption, EuropeanOption
+
+LADDER = [cls(strike=float(k), maturity=1.0, is_call=c)
+          for k in np.linspace(70, 130, 13)
+          for cls in (EuropeanOption, AmericanOption) for c in (True, False)]
+
+
+@pytest.mark.parametrize("cls", [BinomialTreeModel, TrinomialTreeModel])
+@pytest.mark.parametrize("accelerated", [False, True])
+def test_ladder_matches_one_by_one(cls, accelerated):
+    model = cls(spot=100, rate=0.05, vol=0.2, steps=80,
+                smoothing=accelerated, richardson=accelerated)
+    options = LADDER + ([] if accelerated else [DigitalOption(strike=100, maturity=1.0)])
+    many = model.price_many(options)
+    assert many == pytest.approx([model.price(o) for o in options], rel=1e-12, abs=1e-12)
+    # early exercise is applied per column only
+    for euro, amer in zip(many[0::4], many[2::4]):
+        assert amer >= euro - 1e-12
+
+
+def test_ladder_runs_one_induction_per_maturity(monkeypatch):
+    model = BinomialTreeModel(spot=100, rate=0.05, vol=0.2, steps=50)
+    calls = []
+    original = BinomialTreeModel._induce_many
+
+    def counting(self, options, steps):
+        calls.append(len(options))
+        return original(self, options, steps)
+
+    monkeypatch.setattr(BinomialTreeModel, "_induce_many", counting)
+    short = [EuropeanOption(strike=float(k), maturity=0.5) for k in range(80, 121)]
+    model.price_many(LADDER + short)
+    assert sorted(calls) == sorted([len(LADDER), len(short)])
+
+
+def test_lattice_geometry_is_cached_and_read_only():
+    model = TrinomialTreeModel(spot=100, rate=0.05, vol=0.2, steps=40)
+    levels, params = model.lattice(1.0, 40)
+    again, _ = TrinomialTreeModel(spot=100, rate=0.05, vol=0.2, steps=40).lattice(1.0, 40)
+    assert again is levels
+    assert len(levels) == 41 and levels[0][0] == 100 and levels[-1].size == 81
+    with pytest.raises(ValueError):
+        levels[-1][0] = 1.0
+    assert model.lattice(2.0, 40)[0] is not levels
+    assert TrinomialTreeModel(spot=101, rate=0.05, vol=0.2).lattice(1.0, 40)[0] is not levels
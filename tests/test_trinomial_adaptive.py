@@ -27,3 +27,31 @@ def test_trinomial_adaptive_converges(scheme):
     # With adaptive, all valid schemes should end up close to BS (or fallback to KR)
     assert abs(tri_price - bs_price) < 0.5
 
+
+def test_trinomial_adaptive_does_not_mutate_model():
+    option = EuropeanOption(strike=100, maturity=1, is_call=True)
+    bs_price = BlackScholesModel(spot=100, rate=0.05, vol=0.2).price(option)
+    model = TrinomialTreeModel(spot=100, rate=0.05, vol=0.2,
+                               steps=50, adaptive=True, tol=1e-5)
+
+    result = model.price_adaptive(option)
+    assert model.steps == 50
+    assert result.converged
+    assert result.steps > 50 and result.error < 1e-5
+    assert abs(result.price - bs_price) < 1e-4
+
+    # Repeated calls start from the same state and agree exactly
+    assert model.price(option) == result.price
+
+
+def test_trinomial_adaptive_fallback_warns_once():
+    option = EuropeanOption(strike=100, maturity=1, is_call=True)
+    model = TrinomialTreeModel(spot=100, rate=0.05, vol=0.2,
+                               steps=50, method="jr", adaptive=True, tol=1e-5)
+    with pytest.warns(UserWarning, match="Falling back to 'kr'") as record:
+        price = model.price(option)
+    assert len(record) == 1
+    assert model.method == "jr"
+    kr = TrinomialTreeModel(spot=100, rate=0.05, vol=0.2, steps=50, method="kr",
+                            adaptive=True, tol=1e-5)
+    assert price == kr.price(option)
@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+from optionkit.calibration import SVISlice, VolSurface
+from optionkit.models import BlackScholesModel
+from optionkit.payoffs import EuropeanOption
+
+SPOT, RATE = 100.0, 0.03
+TRUE_SLICES = [
+    SVISlice(0.25, 0.004, 0.08, -0.4, 0.02, 0.15),
+    SVISlice(0.5, 0.010, 0.09, -0.35, 0.03, 0.20),
+    SVISlice(1.0, 0.022, 0.10, -0.3, 0.05, 0.25),
+]
+STRIKES = np.linspace(60, 150, 25)
+
+
+def _quotes(slices=TRUE_SLICES):
+    K, T, iv = [], [], []
+    for s in slices:
+        k = np.log(STRIKES / (SPOT * np.exp(RATE * s.maturity)))
+        K.append(STRIKES)
+        T.append(np.full_like(STRIKES, s.maturity))
+        iv.append(s.implied_vol(k))
+    return np.concatenate(K), np.concatenate(T), np.concatenate(iv)
+
+
+@pytest.mark.parametrize("kind, tol", [("svi", 1e-3), ("ssvi", 1e-2)])
+def test_surface_fit_reproduces_quotes(kind, tol):
+    K, T, iv = _quotes()
+    surface = VolSurface.fit(SPOT, RATE, K, T, iv, kind=kind)
+    assert np.abs(surface.vol(K, T) - iv).max() < tol
+    assert surface.arbitrage_report()["arbitrage_free"]
+
+
+def test_vol_lookup_is_vectorized_and_interpolates_in_total_variance():
+    surface = VolSurface(SPOT, RATE, TRUE_SLICES)
+    K = np.array([[80.0, 100.0], [120.0, 140.0]])
+    assert surface.vol(K, 0.75).shape == (2, 2)
+
+    # Between expiries: linear in total variance at fixed forward moneyness
+    k = 0.1
+    w = surface.total_variance(k, 0.75)
+    w_lo, w_hi = TRUE_SLICES[1].total_variance(k), TRUE_SLICES[2].total_variance(k)
+    assert w == pytest.approx(0.5 * (w_lo + w_hi), rel=1e-4)
+
+    # Beyond the last expiry implied vol is held flat
+    assert surface.total_variance(k, 2.0) == pytest.approx(2 * w_hi, rel=1e-4)
+
+
+def test_update_slice_refits_only_that_expiry():
+    K, T, iv = _quotes()
+    surface = VolSurface.fit(SPOT, RATE, K, T, iv)
+    before = surface.slices
+
+    bumped = iv[T == 0.5] * 1.05
+    surface.update_slice(0.5, STRIKES, bumped)
+    after = surface.slices
+
+    assert after[0] == before[0] and after[2] == before[2]
+    assert after[1] != before[1]
+    assert np.abs(surface.vol(STRIKES, 0.5) - bumped).max() < 1e-3
+
+    # A nearby maturity replaces the slice and the recorded expiry with it
+    surface.update_slice(0.5 + 1e-10, STRIKES, bumped)
+    assert len(surface.slices) == 3
+    assert surface.maturities[1] == surface.slices[1].maturity == 0.5 + 1e-10
+
+
+def test_vol_at_zero_maturity_is_the_short_end_limit():
+    surface = VolSurface(SPOT, RATE, TRUE_SLICES)
+    short = surface.vol(STRIKES, 0.0)
+    assert np.all(np.isfinite(short))
+    assert short == pytest.approx(TRUE_SLICES[0].implied_vol(np.log(STRIKES / SPOT)), rel=1e-3)
+    assert surface.vol(STRIKES, 1e-6) == pytest.approx(short, rel=1e-4)
+    with pytest.raises(ValueError):
+        surface.vol(100.0, -0.1)
+
+
+def test_batch_black_scholes_accepts_surface():
+    surface = VolSurface(SPOT, RATE, TRUE_SLICES)
+    model = BlackScholesModel(spot=SPOT, rate=RATE, vol=0.2)
+    prices = model.price_batch(STRIKES, 0.5, False, vol=surface)
+
+    for K, p in zip(STRIKES, prices):
+        sigma = float(surface.vol(K, 0.5))
+        ref = BlackScholesModel(spot=SPOT, rate=RATE, vol=sigma).price(
+            EuropeanOption(strike=K, maturity=0.5, is_call=False)
+        )
+        assert p == pytest.approx(ref, rel=1e-12)